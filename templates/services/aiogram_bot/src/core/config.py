@@ -18,11 +18,25 @@ class Settings(BaseSettings):
     business_api_url: str = "http://business-api:8000"
     business_api_timeout: float = 30.0
 
+    # === Пул HTTP соединений ===
+    http_pool_max_connections: int = 100
+    http_pool_max_keepalive: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = False  # Требует пакет h2
+    http_pool_stats_interval_seconds: int = 60
+
     # === Redis ===
     redis_url: str = "redis://redis:6379/0"
 
     # === Логирование ===
     log_level: str = "INFO"
+    # Неблокирующий вывод логов (кольцевой буфер + фоновый поток)
+    log_async_sink: bool = False
+    log_sink_policy: str = "drop"  # drop | block
+    # Сэмплирование request/db событий (ошибки и медленные сохраняются всегда)
+    log_sampling_enabled: bool = False
+    # Профиль логирования: dev | prod (prod — дешёвый timestamp)
+    log_profile: str = "dev"
 
     class Config:
         """Конфигурация Pydantic."""
@@ -4,6 +4,20 @@ HTTP клиенты.
 Клиенты для взаимодействия с API.
 """
 
-from src.infrastructure.http.api_client import BusinessApiClient
+from src.infrastructure.http.api_client import (
+    BusinessApiClient,
+    close_http_client,
+    get_http_client,
+    get_pool_stats,
+    init_http_client,
+    log_pool_stats,
+)
 
-__all__ = ["BusinessApiClient"]
+__all__ = [
+    "BusinessApiClient",
+    "close_http_client",
+    "get_http_client",
+    "get_pool_stats",
+    "init_http_client",
+    "log_pool_stats",
+]
@@ -2,6 +2,11 @@
 Клиент Business API.
 
 HTTP клиент для взаимодействия с Business API.
+
+Использует один долгоживущий httpx.AsyncClient с пулом соединений,
+которым владеет жизненный цикл бота (main):
+    await init_http_client()   # при старте
+    await close_http_client()  # при остановке
 """
 
 from typing import Any
@@ -15,19 +20,122 @@ from src.core.config import settings
 logger = structlog.get_logger()
 
 
+# Общий HTTP клиент процесса (создаётся в main)
+_http_client: httpx.AsyncClient | None = None
+
+# Счётчики использования пула
+_pool_counters: dict[str, int] = {
+    "requests_total": 0,
+    "in_flight": 0,
+    "peak_in_flight": 0,
+}
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Создать HTTP клиент с пулом соединений.
+
+    Лимиты пула, keep-alive и HTTP/2 берутся из настроек.
+
+    Returns:
+        Настроенный httpx.AsyncClient.
+    """
+    return httpx.AsyncClient(
+        base_url=settings.business_api_url,
+        timeout=settings.business_api_timeout,
+        limits=httpx.Limits(
+            max_connections=settings.http_pool_max_connections,
+            max_keepalive_connections=settings.http_pool_max_keepalive,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+        http2=settings.http2_enabled,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    """
+    Создать общий HTTP клиент процесса.
+
+    Returns:
+        Общий httpx.AsyncClient.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+        logger.info(
+            "http_pool_created",
+            base_url=settings.business_api_url,
+            max_connections=settings.http_pool_max_connections,
+            max_keepalive=settings.http_pool_max_keepalive,
+            keepalive_expiry_seconds=settings.http_keepalive_expiry_seconds,
+            http2=settings.http2_enabled,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Закрыть общий HTTP клиент процесса."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        logger.info("http_pool_closed", **get_pool_stats())
+        await _http_client.aclose()
+    _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Получить общий HTTP клиент процесса.
+
+    Returns:
+        Общий httpx.AsyncClient.
+
+    Raises:
+        RuntimeError: Клиент не инициализирован (init_http_client не вызван).
+    """
+    if _http_client is None or _http_client.is_closed:
+        raise RuntimeError("HTTP клиент не инициализирован: вызовите init_http_client()")
+    return _http_client
+
+
+def get_pool_stats() -> dict[str, int]:
+    """
+    Получить статистику использования пула соединений.
+
+    Считается по собственным счётчикам модуля: у httpx нет публичного
+    API состояния пула, а его внутренние атрибуты меняются между версиями.
+
+    Returns:
+        Счётчики запросов (всего, в полёте, пик) и лимит пула.
+    """
+    return {
+        **_pool_counters,
+        "max_connections": settings.http_pool_max_connections,
+    }
+
+
+def log_pool_stats() -> None:
+    """Залогировать статистику пула соединений."""
+    logger.info("http_pool_stats", **get_pool_stats())
+
+
 class BusinessApiClient:
     """Клиент для Business API."""
 
-    def __init__(self, request_id: str | None = None):
+    def __init__(
+        self,
+        request_id: str | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
         """
         Инициализация клиента.
 
         Args:
             request_id: ID запроса для корреляции.
+            client: HTTP клиент (по умолчанию общий клиент процесса).
         """
-        self.base_url = settings.business_api_url
-        self.timeout = settings.business_api_timeout
         self.request_id = request_id
+        self.client = client or get_http_client()
 
     def _get_headers(self) -> dict[str, str]:
         """
@@ -61,31 +169,37 @@ class BusinessApiClient:
         Raises:
             Exception: При ошибке запроса.
         """
-        url = f"{self.base_url}{path}"
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            logger.debug(
-                "HTTP запрос",
+        logger.debug(
+            "HTTP запрос",
+            method=method,
+            path=path,
+        )
+
+        _pool_counters["requests_total"] += 1
+        _pool_counters["in_flight"] += 1
+        _pool_counters["peak_in_flight"] = max(
+            _pool_counters["peak_in_flight"],
+            _pool_counters["in_flight"],
+        )
+        try:
+            response = await self.client.request(
                 method=method,
-                url=url,
-            )
-
-            response = await client.request(
-                method=method,
-                url=url,
+                url=path,
                 headers=self._get_headers(),
                 **kwargs,
             )
+        finally:
+            _pool_counters["in_flight"] -= 1
+
+        if response.status_code >= 400:
+            logger.error(
+                "Ошибка HTTP запроса",
+                status_code=response.status_code,
+                url=str(response.url),
+            )
+            response.raise_for_status()
 
-            if response.status_code >= 400:
-                logger.error(
-                    "Ошибка HTTP запроса",
-                    status_code=response.status_code,
-                    url=url,
-                )
-                response.raise_for_status()
-
-            return response.json()
+        return response.json()
 
     async def get(self, path: str, **kwargs) -> dict[str, Any]:
         """GET запрос."""
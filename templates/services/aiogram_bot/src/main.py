@@ -5,6 +5,7 @@
 """
 
 import asyncio
+import contextlib
 
 import structlog
 from aiogram import Bot, Dispatcher
@@ -15,15 +16,29 @@ from src.core.config import settings
 from src.core.logging import setup_logging
 from src.bot.handlers import start
 from src.bot.middlewares.logging import LoggingMiddleware
+from src.infrastructure.http import close_http_client, init_http_client, log_pool_stats
 
 
 logger = structlog.get_logger()
 
 
+async def log_pool_stats_periodically() -> None:
+    """Периодически логировать статистику пула HTTP соединений."""
+    while True:
+        await asyncio.sleep(settings.http_pool_stats_interval_seconds)
+        log_pool_stats()
+
+
 async def main() -> None:
     """Главная функция запуска бота."""
     # Настройка логирования
-    setup_logging(log_level=settings.log_level)
+    setup_logging(
+        log_level=settings.log_level,
+        async_sink=settings.log_async_sink,
+        sink_policy=settings.log_sink_policy,
+        sampling=settings.log_sampling_enabled,
+        profile=settings.log_profile,
+    )
 
     logger.info("Запуск бота", bot_name=settings.bot_name)
 
@@ -47,6 +62,10 @@ async def main() -> None:
     dp.include_router(start.router)
     # dp.include_router({domain}.router)
 
+    # Общий пул HTTP соединений к Business API
+    await init_http_client()
+    pool_stats_task = asyncio.create_task(log_pool_stats_periodically())
+
     try:
         # Удаление webhook (для polling)
         await bot.delete_webhook(drop_pending_updates=True)
@@ -60,6 +79,10 @@ async def main() -> None:
         )
     finally:
         logger.info("Остановка бота")
+        pool_stats_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await pool_stats_task
+        await close_http_client()
         await bot.session.close()
 
 
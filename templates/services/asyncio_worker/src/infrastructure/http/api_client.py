@@ -2,26 +2,135 @@
 Клиент Business API.
 
 HTTP клиент для взаимодействия с Business API.
+
+Использует один долгоживущий httpx.AsyncClient с пулом соединений,
+которым владеет жизненный цикл воркера (Worker.run):
+    await init_http_client()   # при старте
+    await close_http_client()  # при остановке
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 
 import httpx
 import structlog
 
 from src.core.config import settings
+from shared.utils.json_codec import json_loads
 
 
 logger = structlog.get_logger()
 
 
+# Общий HTTP клиент процесса (создаётся в Worker.run)
+_http_client: httpx.AsyncClient | None = None
+
+# Счётчики использования пула
+_pool_counters: dict[str, int] = {
+    "requests_total": 0,
+    "in_flight": 0,
+    "peak_in_flight": 0,
+}
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Создать HTTP клиент с пулом соединений.
+
+    Лимиты пула, keep-alive и HTTP/2 берутся из настроек.
+
+    Returns:
+        Настроенный httpx.AsyncClient.
+    """
+    return httpx.AsyncClient(
+        base_url=settings.business_api_url,
+        timeout=settings.business_api_timeout,
+        limits=httpx.Limits(
+            max_connections=settings.http_pool_max_connections,
+            max_keepalive_connections=settings.http_pool_max_keepalive,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+        http2=settings.http2_enabled,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    """
+    Создать общий HTTP клиент процесса.
+
+    Returns:
+        Общий httpx.AsyncClient.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client()
+        logger.info(
+            "http_pool_created",
+            base_url=settings.business_api_url,
+            max_connections=settings.http_pool_max_connections,
+            max_keepalive=settings.http_pool_max_keepalive,
+            keepalive_expiry_seconds=settings.http_keepalive_expiry_seconds,
+            http2=settings.http2_enabled,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Закрыть общий HTTP клиент процесса."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        logger.info("http_pool_closed", **get_pool_stats())
+        await _http_client.aclose()
+    _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Получить общий HTTP клиент процесса.
+
+    Returns:
+        Общий httpx.AsyncClient.
+
+    Raises:
+        RuntimeError: Клиент не инициализирован (init_http_client не вызван).
+    """
+    if _http_client is None or _http_client.is_closed:
+        raise RuntimeError("HTTP клиент не инициализирован: вызовите init_http_client()")
+    return _http_client
+
+
+def get_pool_stats() -> dict[str, int]:
+    """
+    Получить статистику использования пула соединений.
+
+    Считается по собственным счётчикам модуля: у httpx нет публичного
+    API состояния пула, а его внутренние атрибуты меняются между версиями.
+
+    Returns:
+        Счётчики запросов (всего, в полёте, пик) и лимит пула.
+    """
+    return {
+        **_pool_counters,
+        "max_connections": settings.http_pool_max_connections,
+    }
+
+
+def log_pool_stats() -> None:
+    """Залогировать статистику пула соединений."""
+    logger.info("http_pool_stats", **get_pool_stats())
+
+
 class BusinessApiClient:
     """Клиент для Business API."""
 
-    def __init__(self):
-        """Инициализация клиента."""
-        self.base_url = settings.business_api_url
-        self.timeout = settings.business_api_timeout
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """
+        Инициализация клиента.
+
+        Args:
+            client: HTTP клиент (по умолчанию общий клиент процесса).
+        """
+        self.client = client or get_http_client()
 
     async def _request(
         self,
@@ -40,31 +149,36 @@ class BusinessApiClient:
         Returns:
             JSON данные ответа.
         """
-        url = f"{self.base_url}{path}"
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            logger.debug(
-                "HTTP запрос",
-                method=method,
-                url=url,
-            )
-
-            response = await client.request(
+        logger.debug(
+            "HTTP запрос",
+            method=method,
+            path=path,
+        )
+
+        _pool_counters["requests_total"] += 1
+        _pool_counters["in_flight"] += 1
+        _pool_counters["peak_in_flight"] = max(
+            _pool_counters["peak_in_flight"],
+            _pool_counters["in_flight"],
+        )
+        try:
+            response = await self.client.request(
                 method=method,
-                url=url,
-                headers={"Content-Type": "application/json"},
+                url=path,
                 **kwargs,
             )
+        finally:
+            _pool_counters["in_flight"] -= 1
+
+        if response.status_code >= 400:
+            logger.error(
+                "http_request_failed",
+                status_code=response.status_code,
+                url=str(response.url),
+            )
+            response.raise_for_status()
 
-            if response.status_code >= 400:
-                logger.error(
-                    "Ошибка HTTP запроса",
-                    status_code=response.status_code,
-                    url=url,
-                )
-                response.raise_for_status()
-
-            return response.json()
+        return response.json()
 
     async def get(self, path: str, **kwargs) -> dict[str, Any]:
         """GET запрос."""
@@ -73,3 +187,55 @@ class BusinessApiClient:
     async def post(self, path: str, data: dict | None = None, **kwargs) -> dict[str, Any]:
         """POST запрос."""
         return await self._request("POST", path, json=data, **kwargs)
+
+    async def stream_ndjson(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Потоково прочитать NDJSON выгрузку Business API
+        (GET /api/v1/{domain}s/export — прокси /export Data API).
+
+        Строки разбираются по мере чтения сокета: следующая порция
+        не читается, пока задача не обработала текущую (backpressure
+        до серверного курсора БД), память постоянна.
+
+        Args:
+            path: Путь выгрузки.
+            params: Query параметры (format, batch_size).
+
+        Yields:
+            Записи по одной.
+
+        Example:
+            ```python
+            async for row in client.stream_ndjson("/api/v1/orders/export"):
+                await aggregate(row)
+            ```
+        """
+        rows = 0
+        _pool_counters["requests_total"] += 1
+        _pool_counters["in_flight"] += 1
+        _pool_counters["peak_in_flight"] = max(
+            _pool_counters["peak_in_flight"],
+            _pool_counters["in_flight"],
+        )
+        try:
+            async with self.client.stream("GET", path, params=params) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    logger.error(
+                        "http_request_failed",
+                        status_code=response.status_code,
+                        url=str(response.url),
+                    )
+                    response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if line:
+                        rows += 1
+                        yield json_loads(line)
+        finally:
+            _pool_counters["in_flight"] -= 1
+            logger.info("http_stream_completed", path=path, rows=rows)
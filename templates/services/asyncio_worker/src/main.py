@@ -6,6 +6,7 @@
 
 import asyncio
 import signal
+import time
 from typing import Set
 
 import structlog
@@ -13,6 +14,11 @@ import structlog
 from src.core.config import settings
 from src.core.logging import setup_logging
 from src.core.scheduler import Scheduler
+from src.infrastructure.http import (
+    close_http_client,
+    init_http_client,
+    log_pool_stats,
+)
 from src.tasks.base import BaseTask
 
 
@@ -60,6 +66,9 @@ class Worker:
             )
             await asyncio.gather(*self.tasks, return_exceptions=True)
 
+        # Закрытие общего пула HTTP соединений
+        await close_http_client()
+
         logger.info("Воркер остановлен")
 
     def register_task(self, task_class: type[BaseTask]) -> None:
@@ -75,6 +84,10 @@ class Worker:
         """Запуск воркера."""
         self._setup_signals()
 
+        # Общий пул HTTP соединений на всё время жизни воркера
+        await init_http_client()
+        last_stats_at = time.monotonic()
+
         logger.info(
             "Воркер запущен",
             task_count=len(self.scheduler.tasks),
@@ -82,6 +95,12 @@ class Worker:
 
         while self.running:
             try:
+                # Периодическая статистика пула соединений
+                now = time.monotonic()
+                if now - last_stats_at >= settings.http_pool_stats_interval_seconds:
+                    log_pool_stats()
+                    last_stats_at = now
+
                 # Запуск задач по расписанию
                 pending = self.scheduler.get_pending_tasks()
 
@@ -97,6 +116,9 @@ class Worker:
             except asyncio.CancelledError:
                 break
 
+        # Идемпотентно: пул мог быть уже закрыт в _shutdown
+        await close_http_client()
+
     async def _run_task(self, task: BaseTask) -> None:
         """
         Выполнить задачу.
@@ -128,7 +150,13 @@ class Worker:
 async def main() -> None:
     """Главная функция."""
     # Настройка логирования
-    setup_logging(log_level=settings.log_level)
+    setup_logging(
+        log_level=settings.log_level,
+        async_sink=settings.log_async_sink,
+        sink_policy=settings.log_sink_policy,
+        sampling=settings.log_sampling_enabled,
+        profile=settings.log_profile,
+    )
 
     logger.info("Запуск {context}_worker")
 
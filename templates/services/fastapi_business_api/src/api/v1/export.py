@@ -0,0 +1,88 @@
+"""
+Роутер потоковой выгрузки.
+
+Фабрика маршрута GET /export для сущности: проксирует выгрузку
+Data API (NDJSON/CSV) клиенту потоком, без буферизации ответа.
+Серверная часть BusinessApiClient.stream_ndjson воркера.
+"""
+
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from src.api.dependencies import DataApiClientDep
+from shared.utils.streaming import STREAMING_HEADERS, ExportFormat
+
+
+def create_export_proxy_router(entity_type: str) -> APIRouter:
+    """
+    Создать роутер с маршрутом GET /export, проксирующим Data API.
+
+    Тело читается из Data API по мере отправки клиенту (aiter_raw):
+    медленный клиент приостанавливает чтение сокета Data API,
+    а тот — серверный курсор БД (backpressure сквозь оба сервиса).
+
+    Args:
+        entity_type: Тип сущности в Data API (users, orders, ...).
+
+    Returns:
+        Роутер для подключения с префиксом сущности
+        (до роутера домена, чтобы /export не совпал с /{id}).
+
+    Example:
+        ```python
+        api_router.include_router(
+            create_export_proxy_router("orders"),
+            prefix="/orders",
+            tags=["Orders"],
+        )
+        ```
+    """
+    router = APIRouter()
+
+    @router.get(
+        "/export",
+        response_class=StreamingResponse,
+        summary="Потоковая выгрузка записей (NDJSON/CSV)",
+    )
+    async def export(
+        data_client: DataApiClientDep,
+        export_format: ExportFormat = Query(
+            default="ndjson",
+            alias="format",
+            description="Формат выгрузки: ndjson | csv",
+        ),
+        batch_size: int | None = Query(
+            default=None,
+            ge=1,
+            le=10000,
+            description="Строк на один fetch серверного курсора Data API",
+        ),
+    ) -> StreamingResponse:
+        """Выгрузить все записи потоком из Data API."""
+        upstream = await data_client.open_export(
+            entity_type,
+            export_format=export_format,
+            batch_size=batch_size,
+        )
+
+        headers = dict(STREAMING_HEADERS)
+        if "content-disposition" in upstream.headers:
+            headers["Content-Disposition"] = upstream.headers["content-disposition"]
+
+        async def body() -> AsyncIterator[bytes]:
+            # Ответ Data API закрывается и при обрыве соединения клиентом
+            try:
+                async for chunk in upstream.aiter_raw():
+                    yield chunk
+            finally:
+                await upstream.aclose()
+
+        return StreamingResponse(
+            body(),
+            media_type=upstream.headers.get("content-type"),
+            headers=headers,
+        )
+
+    return router
@@ -25,3 +25,13 @@ api_router = APIRouter()
 #     prefix="/users",
 #     tags=["Users"],
 # )
+
+# === Потоковая выгрузка (GET /{domain}s/export → Data API /export) ===
+# Для воркера: BusinessApiClient.stream_ndjson("/api/v1/{domain}s/export")
+# Подключать до роутера домена, чтобы /export не совпал с /{id}
+# from src.api.v1.export import create_export_proxy_router
+# api_router.include_router(
+#     create_export_proxy_router("{domain}s"),
+#     prefix="/{domain}s",
+#     tags=["{Domain}s"],
+# )
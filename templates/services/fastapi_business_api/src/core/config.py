@@ -15,17 +15,45 @@ class Settings(BaseSettings):
     app_env: str = "development"
     debug: bool = True
     log_level: str = "INFO"
+    # Неблокирующий вывод логов (кольцевой буфер + фоновый поток)
+    log_async_sink: bool = False
+    log_sink_policy: str = "drop"  # drop | block
+    # Сэмплирование request/db событий (ошибки и медленные сохраняются всегда)
+    log_sampling_enabled: bool = False
+    # Профиль логирования: dev | prod (prod — дешёвый timestamp)
+    log_profile: str = "dev"
 
     # === Reverse Proxy ===
     root_path: str = ""  # Путевой префикс (например, "/my-service")
 
+    # === JSON ===
+    # orjson/msgspec для ответов, если установлены (иначе stdlib json)
+    fast_json_enabled: bool = True
+
     # === Data API ===
     data_api_url: str = "http://data-api:8001"
     data_api_timeout: float = 30.0
 
+    # === Устойчивость HTTP клиентов (shared.http_clients) ===
+    # Ошибок подряд до открытия circuit breaker
+    http_circuit_failure_threshold: int = 5
+    # Секунд в open до пробного запроса
+    http_circuit_recovery_timeout: float = 30.0
+    # Допустимая доля повторов от исходных запросов (retry budget)
+    http_retry_budget_ratio: float = 0.2
+    http_retry_budget_max_tokens: float = 10.0
+
     # === Redis (опционально) ===
     redis_url: str = "redis://redis:6379/0"
 
+    # === Идемпотентность (Idempotency-Key для POST/PATCH) ===
+    idempotency_enabled: bool = True
+    idempotency_backend: str = "memory"  # memory | redis
+    idempotency_ttl_seconds: float = 86400.0
+    idempotency_max_entries: int = 10000
+    # Суммарный размер ответов в памяти процесса (backend=memory)
+    idempotency_max_bytes: int = 64 * 1024 * 1024
+
     # === CORS ===
     cors_origins: list[str] = ["*"]
 
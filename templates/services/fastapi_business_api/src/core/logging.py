@@ -9,12 +9,19 @@ import logging
 import structlog
 from structlog.types import Processor
 
-from shared.utils.logger import sanitize_sensitive_data
+from shared.utils.log_helpers import set_min_log_level
+from shared.utils.log_sampling import LogSampler
+from shared.utils.log_sink import SinkPolicy, create_logger_factory
+from shared.utils.logger import LogProfile, get_timestamper, sanitize_sensitive_data
 
 
 def setup_logging(
     log_level: str = "INFO",
     json_logs: bool = True,
+    async_sink: bool = False,
+    sink_policy: SinkPolicy = "drop",
+    sampling: bool = False,
+    profile: LogProfile = "dev",
 ) -> None:
     """
     Настроить структурированное логирование.
@@ -22,6 +29,10 @@ def setup_logging(
     Args:
         log_level: Уровень логирования.
         json_logs: Использовать JSON формат.
+        async_sink: Неблокирующий вывод (буфер + фоновый поток).
+        sink_policy: При переполнении буфера: drop | block.
+        sampling: Сэмплирование высокочастотных событий (см. log_sampling).
+        profile: dev — ISO timestamp, prod — кэшированный timestamp.
     """
     # Общие процессоры
     # SECURITY: sanitize_sensitive_data ДОЛЖЕН быть перед JSONRenderer
@@ -30,7 +41,7 @@ def setup_logging(
         structlog.contextvars.merge_contextvars,
         sanitize_sensitive_data,  # SECURITY: фильтрация секретов
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
+        get_timestamper(profile),
         structlog.processors.StackInfoRenderer(),
     ]
 
@@ -46,12 +57,18 @@ def setup_logging(
             structlog.dev.ConsoleRenderer(colors=True),
         ]
 
+    # Сэмплирование: 1% успешных запросов, ошибки и медленные — всегда
+    if sampling:
+        processors[-1] = LogSampler(processors[-1])
+
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(
             logging.getLevelName(log_level)
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=create_logger_factory(async_sink, policy=sink_policy),
         cache_logger_on_first_use=True,
     )
+    # log_helpers отсекают выключенные уровни до построения полей
+    set_min_log_level(log_level)
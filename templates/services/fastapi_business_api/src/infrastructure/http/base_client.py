@@ -356,3 +356,82 @@ class BaseHttpClient:
                 is_retryable=True,
             )
             raise
+
+    async def open_stream(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        operation: str | None = None,
+    ) -> httpx.Response:
+        """
+        Открыть потоковый GET запрос (тело не читается заранее).
+
+        Вызывающий читает тело (aiter_raw/aiter_lines) и обязан
+        закрыть ответ: await response.aclose().
+
+        Args:
+            path: Путь запроса.
+            params: Query параметры.
+            operation: Название операции для логов.
+
+        Returns:
+            Открытый ответ со статусом < 400.
+
+        Raises:
+            ExternalServiceError: При ошибке сервиса.
+        """
+        op_name = operation or f"GET {path}"
+        start_time = log_external_call_start(
+            logger,
+            service=self.service_name,
+            operation=op_name,
+            method="GET",
+            endpoint=path,
+        )
+
+        try:
+            request = self.client.build_request(
+                "GET",
+                path,
+                params=params,
+                headers=self._get_headers(),
+            )
+            response = await self.client.send(request, stream=True)
+
+            # duration_ms — время до заголовков ответа, не всей выгрузки
+            log_external_call_end(
+                logger,
+                service=self.service_name,
+                operation=op_name,
+                start_time=start_time,
+                status_code=response.status_code,
+            )
+
+            if response.status_code >= 400:
+                await response.aread()
+                await response.aclose()
+                await self._handle_response(response)
+
+            return response
+
+        except httpx.TimeoutException:
+            log_external_call_end(
+                logger,
+                service=self.service_name,
+                operation=op_name,
+                start_time=start_time,
+                error_type="timeout",
+                is_retryable=True,
+            )
+            raise
+
+        except httpx.ConnectError:
+            log_external_call_end(
+                logger,
+                service=self.service_name,
+                operation=op_name,
+                start_time=start_time,
+                error_type="connection_error",
+                is_retryable=True,
+            )
+            raise
@@ -138,6 +138,33 @@ class DataApiClient(BaseHttpClient):
         """
         await self.delete(f"/api/v1/{entity_type}/{entity_id}")
 
+    async def open_export(
+        self,
+        entity_type: str,
+        export_format: str = "ndjson",
+        batch_size: int | None = None,
+    ) -> httpx.Response:
+        """
+        Открыть потоковую выгрузку Data API (GET /export).
+
+        Args:
+            entity_type: Тип сущности.
+            export_format: Формат выгрузки: ndjson | csv.
+            batch_size: Строк на один fetch серверного курсора Data API.
+
+        Returns:
+            Открытый потоковый ответ (закрыть через aclose()).
+        """
+        params: dict[str, Any] = {"format": export_format}
+        if batch_size:
+            params["batch_size"] = batch_size
+
+        return await self.open_stream(
+            f"/api/v1/{entity_type}/export",
+            params=params,
+            operation=f"export_{entity_type}",
+        )
+
     # === Пример специфичных методов для домена ===
     # async def get_user(self, user_id: UUID) -> dict[str, Any]:
     #     """Получить пользователя по ID."""
@@ -13,12 +13,17 @@ from typing import AsyncGenerator
 import httpx
 import structlog
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.core.config import settings
 from src.core.logging import setup_logging
 from src.api.v1.router import api_router
 from src.middlewares import RequestLoggingMiddleware
+from shared.http_clients.resilience import configure_resilience
+from shared.utils.json_codec import get_json_backend
+from shared.utils.responses import FastJSONResponse
+from shared.utils.idempotency import IdempotencyMiddleware, create_idempotency_store
 from shared.utils.log_helpers import log_service_started, log_service_stopped
 
 
@@ -92,6 +97,18 @@ def create_app() -> FastAPI:
     setup_logging(
         log_level=settings.log_level,
         json_logs=settings.app_env != "development",
+        async_sink=settings.log_async_sink,
+        sink_policy=settings.log_sink_policy,
+        sampling=settings.log_sampling_enabled,
+        profile=settings.log_profile,
+    )
+
+    # Circuit breaker и бюджет повторов HTTP клиентов
+    configure_resilience(
+        failure_threshold=settings.http_circuit_failure_threshold,
+        recovery_timeout=settings.http_circuit_recovery_timeout,
+        retry_ratio=settings.http_retry_budget_ratio,
+        retry_max_tokens=settings.http_retry_budget_max_tokens,
     )
 
     # Создание приложения
@@ -103,6 +120,13 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        default_response_class=(
+            FastJSONResponse if settings.fast_json_enabled else JSONResponse
+        ),
+    )
+    logger.info(
+        "json_backend_selected",
+        backend=get_json_backend() if settings.fast_json_enabled else "json",
     )
 
     # === Middleware (порядок важен!) ===
@@ -116,6 +140,21 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Idempotency middleware: повтор POST/PATCH с тем же Idempotency-Key
+    # получает сохранённый ответ вместо повторного выполнения handler.
+    # Добавляется до логирования, чтобы replay тоже попадал в логи
+    if settings.idempotency_enabled:
+        app.add_middleware(
+            IdempotencyMiddleware,
+            store=create_idempotency_store(
+                backend=settings.idempotency_backend,
+                redis_url=settings.redis_url,
+                max_entries=settings.idempotency_max_entries,
+                max_bytes=settings.idempotency_max_bytes,
+            ),
+            ttl_seconds=settings.idempotency_ttl_seconds,
+        )
+
     # Request Logging middleware (Log-Driven Design)
     # Должен быть после CORS, чтобы логировать только валидные запросы
     app.add_middleware(
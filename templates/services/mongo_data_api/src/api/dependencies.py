@@ -6,9 +6,11 @@ Dependency Injection для FastAPI.
 
 from typing import Annotated
 
-from fastapi import Depends, Request
+from fastapi import Depends, HTTPException, Query, Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from shared.utils.validators import parse_fields
+
 
 def get_database(request: Request) -> AsyncIOMotorDatabase:
     """
@@ -27,6 +29,35 @@ def get_database(request: Request) -> AsyncIOMotorDatabase:
 DatabaseDep = Annotated[AsyncIOMotorDatabase, Depends(get_database)]
 
 
+# === Проекция полей (?fields=id,name,email) ===
+
+def get_fields(
+    fields: str | None = Query(
+        default=None,
+        description="Поля ответа через запятую (проекция), например id,name,email",
+    ),
+) -> list[str] | None:
+    """
+    Получить список полей проекции из query параметра.
+
+    Args:
+        fields: Поля через запятую.
+
+    Returns:
+        Имена полей или None (все поля).
+
+    Raises:
+        HTTPException: 422 при невалидном списке полей.
+    """
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
+FieldsDep = Annotated[list[str] | None, Depends(get_fields)]
+
+
 # === Пример зависимости репозитория ===
 # def get_{domain}_repository(
 #     db: DatabaseDep,
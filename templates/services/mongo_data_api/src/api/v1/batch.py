@@ -0,0 +1,66 @@
+"""
+Роутер пакетного чтения.
+
+Фабрика маршрута POST /batch для любой сущности:
+получение нескольких документов одним запросом ($in).
+Серверная часть DataAPIClient.get_by_ids.
+"""
+
+from typing import Annotated, Any, Callable
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from src.repositories.base import BaseRepository
+from shared.schemas.batch import BatchGetRequest, BatchGetResponse
+
+
+def create_batch_router(
+    get_repository: Callable[..., BaseRepository],
+    item_schema: type[BaseModel],
+) -> APIRouter:
+    """
+    Создать роутер с маршрутом POST /batch.
+
+    Args:
+        get_repository: Dependency, возвращающая репозиторий сущности.
+        item_schema: Схема ответа для одной сущности.
+
+    Returns:
+        Роутер для подключения с префиксом сущности.
+
+    Example:
+        ```python
+        api_router.include_router(
+            create_batch_router(get_user_repository, UserResponse),
+            prefix="/users",
+            tags=["Users"],
+        )
+        ```
+    """
+    router = APIRouter()
+
+    @router.post(
+        "/batch",
+        response_model=BatchGetResponse[item_schema],
+        summary="Получить несколько документов по ID",
+    )
+    async def get_batch(
+        payload: BatchGetRequest,
+        repository: Annotated[BaseRepository, Depends(get_repository)],
+    ) -> dict[str, Any]:
+        """
+        Получить документы по списку ID.
+
+        Порядок items совпадает с порядком ids в запросе;
+        ненайденные и невалидные ID возвращаются в missing_ids.
+        """
+        models = await repository.get_many(payload.ids)
+        found = {model.id for model in models}
+
+        return {
+            "items": [item_schema.model_validate(model.model_dump()) for model in models],
+            "missing_ids": [raw_id for raw_id in payload.ids if raw_id not in found],
+        }
+
+    return router
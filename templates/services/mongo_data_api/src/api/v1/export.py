@@ -0,0 +1,96 @@
+"""
+Роутер потоковой выгрузки.
+
+Фабрика маршрута GET /export для любой сущности:
+выгрузка всей коллекции в NDJSON или CSV курсором Motor
+(BaseRepository.stream_all) при постоянном потреблении памяти.
+Серверная часть DataAPIClient.iter_export.
+"""
+
+from typing import Annotated, Callable
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.repositories.base import BaseRepository
+from shared.utils.streaming import STREAMING_HEADERS, ExportFormat, encode_stream
+
+
+def create_export_router(
+    get_repository: Callable[..., BaseRepository],
+    item_schema: type[BaseModel],
+) -> APIRouter:
+    """
+    Создать роутер с маршрутом GET /export.
+
+    Args:
+        get_repository: Dependency, возвращающая репозиторий сущности.
+        item_schema: Схема одной записи в выгрузке.
+
+    Returns:
+        Роутер для подключения с префиксом сущности
+        (до роутера домена, чтобы /export не совпал с /{id}).
+
+    Example:
+        ```python
+        api_router.include_router(
+            create_export_router(get_user_repository, UserResponse),
+            prefix="/users",
+            tags=["Users"],
+        )
+        ```
+    """
+    router = APIRouter()
+
+    def export_headers(export_format: ExportFormat) -> dict[str, str]:
+        if export_format == "csv":
+            return {
+                **STREAMING_HEADERS,
+                "Content-Disposition": "attachment; filename=export.csv",
+            }
+        return STREAMING_HEADERS
+
+    def serialize(model: BaseModel) -> dict:
+        return item_schema.model_validate(model.model_dump()).model_dump(
+            mode="json",
+            by_alias=True,
+        )
+
+    @router.get(
+        "/export",
+        response_class=StreamingResponse,
+        summary="Потоковая выгрузка документов (NDJSON/CSV)",
+    )
+    async def export(
+        repository: Annotated[BaseRepository, Depends(get_repository)],
+        export_format: ExportFormat = Query(
+            default="ndjson",
+            alias="format",
+            description="Формат выгрузки: ndjson | csv",
+        ),
+        batch_size: int | None = Query(
+            default=None,
+            ge=1,
+            le=10000,
+            description="Документов на один getMore курсора",
+        ),
+    ) -> StreamingResponse:
+        """
+        Выгрузить все документы потоком.
+
+        Документы читаются из MongoDB пачками по batch_size только по
+        мере отправки клиенту (backpressure), память сервиса постоянна.
+        """
+        body, media_type = encode_stream(
+            repository.stream_all(batch_size=batch_size),
+            export_format,
+            serialize=serialize,
+        )
+        return StreamingResponse(
+            body,
+            media_type=media_type,
+            headers=export_headers(export_format),
+        )
+
+    return router
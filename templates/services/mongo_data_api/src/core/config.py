@@ -4,8 +4,11 @@
 Загрузка настроек из переменных окружения.
 """
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from shared.utils.pagination import CountStrategy
+
 
 class Settings(BaseSettings):
     """Настройки приложения."""
@@ -15,14 +18,52 @@ class Settings(BaseSettings):
     app_env: str = "development"
     debug: bool = True
     log_level: str = "INFO"
+    # Неблокирующий вывод логов (кольцевой буфер + фоновый поток)
+    log_async_sink: bool = False
+    log_sink_policy: str = "drop"  # drop | block
+    # Сэмплирование request/db событий (ошибки и медленные сохраняются всегда)
+    log_sampling_enabled: bool = False
+    # Профиль логирования: dev | prod (prod — дешёвый timestamp)
+    log_profile: str = "dev"
 
     # === Reverse Proxy ===
     root_path: str = ""  # Путевой префикс (например, "/my-service")
 
+    # === JSON ===
+    # orjson/msgspec для ответов, если установлены (иначе stdlib json)
+    fast_json_enabled: bool = True
+
     # === MongoDB ===
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_database: str = "{context}_db"
 
+    # === Пагинация ===
+    # SECURITY: Секрет подписи курсоров keyset-пагинации.
+    # Нет default значения — установить через CURSOR_SECRET в .env
+    cursor_secret: str = Field(
+        ...,
+        min_length=16,
+        description="Секрет подписи курсоров. ОБЯЗАТЕЛЬНО установите через CURSOR_SECRET (openssl rand -hex 32)",
+    )
+
+    # Стратегия подсчёта total_items: exact | estimate | cached
+    count_strategy: CountStrategy = "exact"
+    count_cache_ttl_seconds: float = 30.0
+    count_cache_max_entries: int = 10000
+
+    # === Потоковая выгрузка (GET /export) ===
+    # Строк на один fetch серверного курсора (память ∝ batch_size)
+    db_stream_batch_size: int = 1000
+
+    # === Идемпотентность (Idempotency-Key для POST/PATCH) ===
+    idempotency_enabled: bool = True
+    idempotency_backend: str = "memory"  # memory | redis (общий для реплик)
+    idempotency_ttl_seconds: float = 86400.0
+    idempotency_max_entries: int = 10000
+    # Суммарный размер ответов в памяти процесса (backend=memory)
+    idempotency_max_bytes: int = 64 * 1024 * 1024
+    redis_url: str = "redis://redis:6379/0"
+
     class Config:
         """Конфигурация Pydantic."""
 
@@ -76,3 +76,8 @@ class MongoModel(BaseModel):
 #     event_type: str
 #     payload: dict
 #     user_id: str | None = None
+#
+# Пакетная запись событий (один bulk_write на BULK_CHUNK_SIZE документов):
+#     report = await repository.create_many([e.to_mongo() for e in events])
+#     # идемпотентно по внешнему ключу события
+#     report = await repository.bulk_upsert(events_data, key_fields=("event_id",))
@@ -9,11 +9,16 @@ from typing import AsyncGenerator
 
 import structlog
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 from src.core.config import settings
 from src.core.logging import setup_logging
 from src.core.database import mongodb
 from src.api.v1.router import api_router
+from shared.utils.json_codec import get_json_backend
+from shared.utils.responses import FastJSONResponse
+from shared.utils.idempotency import IdempotencyMiddleware, create_idempotency_store
+from shared.utils.request_id import RequestContextMiddleware
 
 
 logger = structlog.get_logger()
@@ -60,6 +65,10 @@ def create_app() -> FastAPI:
     setup_logging(
         log_level=settings.log_level,
         json_logs=settings.app_env != "development",
+        async_sink=settings.log_async_sink,
+        sink_policy=settings.log_sink_policy,
+        sampling=settings.log_sampling_enabled,
+        profile=settings.log_profile,
     )
 
     # Создание приложения
@@ -71,7 +80,33 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        default_response_class=(
+            FastJSONResponse if settings.fast_json_enabled else JSONResponse
+        ),
     )
+    logger.info(
+        "json_backend_selected",
+        backend=get_json_backend() if settings.fast_json_enabled else "json",
+    )
+
+    # Idempotency middleware: повтор POST/PATCH с тем же Idempotency-Key
+    # получает сохранённый ответ вместо повторной записи в БД
+    if settings.idempotency_enabled:
+        app.add_middleware(
+            IdempotencyMiddleware,
+            store=create_idempotency_store(
+                backend=settings.idempotency_backend,
+                redis_url=settings.redis_url,
+                max_entries=settings.idempotency_max_entries,
+                max_bytes=settings.idempotency_max_bytes,
+            ),
+            ttl_seconds=settings.idempotency_ttl_seconds,
+        )
+
+    # Контекст трассировки (request_id в логах, request_completed).
+    # Добавляется последним — внешний слой, чтобы request_id был
+    # и в логах остальных middleware
+    app.add_middleware(RequestContextMiddleware)
 
     # Подключение роутеров
     app.include_router(api_router, prefix="/api/v1")
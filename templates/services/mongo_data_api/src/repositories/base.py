@@ -4,20 +4,122 @@
 Generic CRUD операции для всех коллекций.
 """
 
-from typing import Any, Generic, TypeVar
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterator,
+    Literal,
+    Sequence,
+    TypeVar,
+    overload,
+)
 
+import structlog
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, DESCENDING, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
+from src.core.config import settings
 from src.domain.models.base import MongoModel
+from shared.utils.exceptions import InvalidInputError
+from shared.utils.log_helpers import log_db_operation
+from shared.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    CountCache,
+    CountResult,
+    CountStrategy,
+    CursorPaginatedResult,
+    CursorPaginationMeta,
+    decode_cursor,
+    encode_cursor,
+)
 
 
+logger = structlog.get_logger()
+
 ModelType = TypeVar("ModelType", bound=MongoModel)
 
+# Кэш count_documents для стратегии "cached" (общий для всех репозиториев процесса)
+_count_cache = CountCache(
+    ttl_seconds=settings.count_cache_ttl_seconds,
+    max_entries=settings.count_cache_max_entries,
+)
+
+# Документов на один getMore при потоковом чтении
+STREAM_BATCH_SIZE = 1000
+
+# Документов на один insert_many/bulk_write.
+# Лимит команды MongoDB — 100 000 операций и 48 MB на батч.
+BULK_CHUNK_SIZE = 1000
+
+
+@dataclass
+class BulkWriteReport:
+    """
+    Результат пакетной операции.
+
+    Ошибки отдельных документов не прерывают операцию (ordered=False):
+    остальные документы чанка и следующие чанки записываются.
+
+    Attributes:
+        success_count: Успешно записанных документов.
+        failed_count: Документов с ошибкой.
+        matched_count: Найдено документов (bulk_update/bulk_upsert).
+        modified_count: Изменено документов (bulk_update/bulk_upsert).
+        upserted_count: Вставлено через upsert.
+        inserted_ids: ID вставленных документов (create_many).
+        errors: Ошибки: chunk_index, index (позиция во входных данных),
+            code, message.
+    """
+
+    success_count: int = 0
+    failed_count: int = 0
+    matched_count: int = 0
+    modified_count: int = 0
+    upserted_count: int = 0
+    inserted_ids: list[str] = field(default_factory=list)
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    def add_errors(
+        self,
+        chunk_index: int,
+        offset: int,
+        write_errors: list[dict[str, Any]],
+    ) -> None:
+        """
+        Добавить ошибки чанка.
+
+        Args:
+            chunk_index: Номер чанка.
+            offset: Позиция первого документа чанка во входных данных.
+            write_errors: writeErrors из BulkWriteError.details.
+        """
+        for error in write_errors:
+            self.errors.append({
+                "chunk_index": chunk_index,
+                "index": offset + error["index"],
+                "code": error.get("code"),
+                "message": error.get("errmsg"),
+            })
+        self.failed_count += len(write_errors)
+
 
 class BaseRepository(Generic[ModelType]):
     """Базовый репозиторий с CRUD операциями."""
 
+    # Whitelist полей для проекции (?fields=id,name). Только поля,
+    # которые отдаёт {Domain}Response: проекция не должна раскрывать
+    # скрытые поля. id разрешён всегда, пустой набор — проекция только по id.
+    PROJECTABLE_FIELDS: frozenset[str] = frozenset()
+
     def __init__(
         self,
         collection: AsyncIOMotorCollection,
@@ -48,12 +150,72 @@ class BaseRepository(Generic[ModelType]):
             return None
         return self.model.from_mongo(doc)
 
+    async def get_many(self, entity_ids: list[str]) -> list[ModelType]:
+        """
+        Получить несколько документов по ID одним запросом ($in).
+
+        Args:
+            entity_ids: ID документов (невалидные ObjectId пропускаются).
+
+        Returns:
+            Найденные модели в порядке entity_ids (без отсутствующих
+            и дубликатов).
+        """
+        unique_ids = [
+            entity_id
+            for entity_id in dict.fromkeys(entity_ids)
+            if ObjectId.is_valid(entity_id)
+        ]
+        if not unique_ids:
+            return []
+
+        cursor = self.collection.find(
+            {"_id": {"$in": [ObjectId(entity_id) for entity_id in unique_ids]}}
+        )
+        docs = await cursor.to_list(length=len(unique_ids))
+        by_id = {str(doc["_id"]): doc for doc in docs}
+
+        return [
+            self.model.from_mongo(by_id[entity_id])
+            for entity_id in unique_ids
+            if entity_id in by_id
+        ]
+
+    @overload
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        filter_query: dict | None = None,
+        fields: None = None,
+    ) -> list[ModelType]: ...
+
+    @overload
     async def get_all(
         self,
         offset: int = 0,
         limit: int = 100,
         filter_query: dict | None = None,
-    ) -> list[ModelType]:
+        *,
+        fields: Sequence[str],
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        filter_query: dict | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> list[ModelType] | list[dict[str, Any]]: ...
+
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        filter_query: dict | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> list[ModelType] | list[dict[str, Any]]:
         """
         Получить список документов.
 
@@ -61,16 +223,161 @@ class BaseRepository(Generic[ModelType]):
             offset: Смещение.
             limit: Лимит записей.
             filter_query: Фильтр.
+            fields: Проекция — вернуть только эти поля (и id)
+                из PROJECTABLE_FIELDS.
 
         Returns:
-            Список моделей.
+            Список моделей; при fields — список словарей без
+            валидации моделью (неполный документ её не пройдёт).
+
+        Raises:
+            InvalidInputError: Поле не из PROJECTABLE_FIELDS.
         """
-        cursor = self.collection.find(filter_query or {})
+        projection: dict[str, int] | None = None
+        if fields is not None:
+            unknown = [
+                name for name in fields
+                if name != "id" and name not in self.PROJECTABLE_FIELDS
+            ]
+            if unknown:
+                raise InvalidInputError(
+                    f"Неизвестные поля: {', '.join(unknown)}",
+                    field="fields",
+                )
+            # _id возвращается MongoDB всегда; пустая проекция = все поля
+            projection = {name: 1 for name in fields if name != "id"} or {"_id": 1}
+        cursor = self.collection.find(filter_query or {}, projection)
         cursor = cursor.skip(offset).limit(limit)
 
         docs = await cursor.to_list(length=limit)
+        if projection:
+            return [{"id": str(doc.pop("_id")), **doc} for doc in docs]
         return [self.model.from_mongo(doc) for doc in docs]
 
+    async def get_page_after(
+        self,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: str = "created_at",
+        descending: bool = False,
+        filter_query: dict | None = None,
+    ) -> CursorPaginatedResult[ModelType]:
+        """
+        Получить страницу keyset (cursor) пагинацией.
+
+        Вместо skip использует range-условие ($gt/$lt) по
+        (order_by, _id), которое обслуживается составным индексом
+        независимо от глубины страницы.
+
+        Args:
+            cursor: Курсор из предыдущего ответа (None — первая страница).
+            limit: Размер страницы.
+            order_by: Поле сортировки (рекомендуется индекс (order_by, _id)).
+            descending: Сортировка по убыванию.
+            filter_query: Дополнительный фильтр.
+
+        Returns:
+            Страница моделей и курсор следующей страницы.
+
+        Raises:
+            InvalidInputError: Невалидный курсор.
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        sort_field = "_id" if order_by in ("id", "_id") else order_by
+        direction = DESCENDING if descending else ASCENDING
+        op = "$lt" if descending else "$gt"
+
+        conditions: list[dict] = [filter_query] if filter_query else []
+
+        if cursor:
+            position = decode_cursor(cursor, settings.cursor_secret)
+            if position.get("o") != sort_field or position.get("d") != descending:
+                raise InvalidInputError(
+                    "Курсор не соответствует параметрам сортировки",
+                    field="cursor",
+                )
+
+            last_id = ObjectId(position["id"])
+            if sort_field == "_id":
+                conditions.append({"_id": {op: last_id}})
+            else:
+                conditions.append({
+                    "$or": [
+                        {sort_field: {op: position["k"]}},
+                        {sort_field: position["k"], "_id": {op: last_id}},
+                    ]
+                })
+
+        query = {"$and": conditions} if len(conditions) > 1 else (
+            conditions[0] if conditions else {}
+        )
+        sort = [("_id", direction)] if sort_field == "_id" else [
+            (sort_field, direction),
+            ("_id", direction),
+        ]
+
+        # +1 документ для определения has_next без count_documents
+        cursor_obj = self.collection.find(query).sort(sort).limit(limit + 1)
+        docs = await cursor_obj.to_list(length=limit + 1)
+
+        has_next = len(docs) > limit
+        docs = docs[:limit]
+
+        next_cursor: str | None = None
+        if has_next:
+            last = docs[-1]
+            next_cursor = encode_cursor(
+                {
+                    "k": last.get(sort_field),
+                    "id": str(last["_id"]),
+                    "o": sort_field,
+                    "d": descending,
+                },
+                settings.cursor_secret,
+            )
+
+        return CursorPaginatedResult(
+            items=[self.model.from_mongo(doc) for doc in docs],
+            meta=CursorPaginationMeta(
+                next_cursor=next_cursor,
+                prev_cursor=None,
+                has_next=has_next,
+                has_prev=cursor is not None,
+            ),
+        )
+
+    async def stream_all(
+        self,
+        filter_query: dict | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[ModelType]:
+        """
+        Потоково прочитать документы курсором Motor.
+
+        Документы приходят пачками по batch_size (getMore), следующая
+        пачка запрашивается только после обработки предыдущей —
+        память постоянна при любом размере коллекции.
+
+        Args:
+            filter_query: Фильтр.
+            batch_size: Документов на один getMore (по умолчанию
+                settings.db_stream_batch_size или STREAM_BATCH_SIZE).
+
+        Yields:
+            Модели по одной.
+        """
+        batch_size = batch_size or getattr(
+            settings, "db_stream_batch_size", STREAM_BATCH_SIZE
+        )
+        cursor = self.collection.find(filter_query or {}).sort("_id", ASCENDING)
+        cursor = cursor.batch_size(batch_size)
+
+        try:
+            async for doc in cursor:
+                yield self.model.from_mongo(doc)
+        finally:
+            await cursor.close()
+
     async def count(self, filter_query: dict | None = None) -> int:
         """
         Подсчитать количество документов.
@@ -83,44 +390,158 @@ class BaseRepository(Generic[ModelType]):
         """
         return await self.collection.count_documents(filter_query or {})
 
-    async def create(self, data: dict[str, Any]) -> ModelType:
+    async def count_by_strategy(
+        self,
+        filter_query: dict | None = None,
+        strategy: CountStrategy | None = None,
+    ) -> CountResult:
+        """
+        Подсчитать количество документов выбранной стратегией.
+
+        Используется для total_items в PaginatedResponse.create:
+        - exact: count_documents на каждый вызов
+        - estimate: estimated_document_count по метаданным коллекции
+          (только без фильтра, иначе exact)
+        - cached: точный count_documents с кэшированием на TTL
+
+        Args:
+            filter_query: Фильтр.
+            strategy: Стратегия (по умолчанию settings.count_strategy).
+
+        Returns:
+            Количество и признак приблизительности.
+        """
+        strategy = strategy or settings.count_strategy
+
+        if strategy == "estimate" and not filter_query:
+            total = await self.collection.estimated_document_count()
+            return CountResult(total=total, is_approximate=True)
+
+        if strategy == "cached":
+            key = CountCache.make_key(self.collection.name, filter_query)
+            cached = _count_cache.get(key)
+            if cached is not None:
+                return CountResult(total=cached)
+
+            total = await self.count(filter_query)
+            _count_cache.set(key, total)
+            return CountResult(total=total)
+
+        return CountResult(total=await self.count(filter_query))
+
+    @overload
+    async def create(
+        self,
+        data: dict[str, Any],
+        return_document: Literal[True] = True,
+    ) -> ModelType: ...
+
+    @overload
+    async def create(
+        self,
+        data: dict[str, Any],
+        return_document: Literal[False],
+    ) -> str: ...
+
+    @overload
+    async def create(
+        self,
+        data: dict[str, Any],
+        return_document: bool = True,
+    ) -> ModelType | str: ...
+
+    async def create(
+        self,
+        data: dict[str, Any],
+        return_document: bool = True,
+    ) -> ModelType | str:
         """
         Создать документ.
 
+        Модель строится из вставленного документа без повторного
+        чтения: insert_one проставляет _id в сам документ.
+
         Args:
             data: Данные для создания.
+            return_document: False — вернуть только ID (без построения модели).
 
         Returns:
-            Созданная модель.
+            Созданная модель или ID документа при return_document=False.
         """
-        result = await self.collection.insert_one(data)
-        doc = await self.collection.find_one({"_id": result.inserted_id})
+        doc = dict(data)
+        result = await self.collection.insert_one(doc)
+        _count_cache.invalidate(self.collection.name)
+
+        if not return_document:
+            return str(result.inserted_id)
         return self.model.from_mongo(doc)
 
+    @overload
     async def update(
         self,
         entity_id: str,
         data: dict[str, Any],
-    ) -> ModelType | None:
+        return_document: Literal[True] = True,
+    ) -> ModelType | None: ...
+
+    @overload
+    async def update(
+        self,
+        entity_id: str,
+        data: dict[str, Any],
+        return_document: Literal[False],
+    ) -> bool: ...
+
+    @overload
+    async def update(
+        self,
+        entity_id: str,
+        data: dict[str, Any],
+        return_document: bool = True,
+    ) -> ModelType | bool | None: ...
+
+    async def update(
+        self,
+        entity_id: str,
+        data: dict[str, Any],
+        return_document: bool = True,
+    ) -> ModelType | bool | None:
         """
         Обновить документ.
 
+        Обновление и чтение результата выполняются одной командой
+        findAndModify (find_one_and_update с ReturnDocument.AFTER).
+
         Args:
             entity_id: ID документа.
             data: Данные для обновления.
+            return_document: False — только подтверждение (update_one),
+                без передачи документа по сети.
 
         Returns:
-            Обновлённая модель или None.
+            Обновлённая модель или None, если не найден;
+            при return_document=False — True/False (найден ли документ).
         """
-        result = await self.collection.update_one(
+        if not return_document:
+            result = await self.collection.update_one(
+                {"_id": ObjectId(entity_id)},
+                {"$set": data},
+            )
+            if result.matched_count == 0:
+                return False
+            _count_cache.invalidate(self.collection.name)
+            return True
+
+        doc = await self.collection.find_one_and_update(
             {"_id": ObjectId(entity_id)},
             {"$set": data},
+            return_document=ReturnDocument.AFTER,
         )
-
-        if result.matched_count == 0:
+        if doc is None:
             return None
-
-        return await self.get_by_id(entity_id)
+        # Изменённое поле могло входить в фильтр закэшированного count
+        _count_cache.invalidate(self.collection.name)
+        return self.model.from_mongo(doc)
 
     async def delete(self, entity_id: str) -> bool:
         """
@@ -133,4 +554,312 @@ class BaseRepository(Generic[ModelType]):
             True если удалено, False если не найдено.
         """
         result = await self.collection.delete_one({"_id": ObjectId(entity_id)})
+        if result.deleted_count > 0:
+            _count_cache.invalidate(self.collection.name)
         return result.deleted_count > 0
+
+    # === Пакетные операции ===
+
+    @staticmethod
+    def _iter_chunks(
+        items: Sequence[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> Iterator[tuple[int, Sequence[dict[str, Any]]]]:
+        """
+        Разбить входные данные на чанки.
+
+        Args:
+            items: Список словарей с данными.
+            chunk_size: Размер чанка (по умолчанию из настроек).
+
+        Yields:
+            Tuple (позиция первого элемента, срез items).
+        """
+        size = chunk_size or getattr(settings, "db_bulk_chunk_size", BULK_CHUNK_SIZE)
+        for start in range(0, len(items), size):
+            yield start, items[start:start + size]
+
+    async def _write_chunk(
+        self,
+        operation: str,
+        query_type: str,
+        chunk_index: int,
+        offset: int,
+        chunk_rows: int,
+        total_rows: int,
+        write: Callable[[], Awaitable[Any]],
+        report: BulkWriteReport,
+        positions: list[int] | None = None,
+    ) -> tuple[Any | None, set[int]]:
+        """
+        Выполнить запись чанка и учесть ошибки отдельных документов.
+
+        Args:
+            operation: Название операции (для логов).
+            query_type: Тип запроса (INSERT/UPDATE/UPSERT).
+            chunk_index: Номер чанка.
+            offset: Позиция первого документа чанка во входных данных.
+            chunk_rows: Документов в чанке.
+            total_rows: Документов всего.
+            write: Фабрика корутины insert_many/bulk_write.
+            report: Накопитель результата.
+            positions: Позиция в чанке для каждой операции, если часть
+                элементов чанка отброшена до записи.
+
+        Returns:
+            Tuple (результат pymongo или None при частичной ошибке,
+            индексы документов чанка с ошибкой).
+        """
+        start = time.perf_counter()
+        result: Any | None = None
+        details: dict[str, Any] = {}
+        failed: set[int] = set()
+
+        try:
+            result = await write()
+        except BulkWriteError as e:
+            details = e.details
+            write_errors = details.get("writeErrors", [])
+            if positions is not None:
+                write_errors = [
+                    {**error, "index": positions[error["index"]]}
+                    for error in write_errors
+                ]
+            failed = {error["index"] for error in write_errors}
+            report.add_errors(chunk_index, offset, write_errors)
+            logger.warning(
+                "db_bulk_chunk_partial_failure",
+                operation=operation,
+                table=self.collection.name,
+                chunk_index=chunk_index,
+                failed_rows=len(failed),
+                first_error=write_errors[0].get("errmsg") if write_errors else None,
+            )
+
+        report.success_count += chunk_rows - len(failed)
+        log_db_operation(
+            logger,
+            operation=operation,
+            table=self.collection.name,
+            query_type=query_type,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            affected_rows=chunk_rows - len(failed),
+            chunk_index=chunk_index,
+            chunk_rows=chunk_rows,
+            failed_rows=len(failed),
+            total_rows=total_rows,
+        )
+
+        if result is None:
+            report.matched_count += details.get("nMatched", 0)
+            report.modified_count += details.get("nModified", 0)
+            report.upserted_count += details.get("nUpserted", 0)
+        return result, failed
+
+    async def create_many(
+        self,
+        items: Sequence[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> BulkWriteReport:
+        """
+        Создать документы пакетно.
+
+        Каждый чанк — один insert_many(ordered=False): ошибка одного
+        документа (например, дубликат уникального ключа) не останавливает
+        вставку остальных.
+
+        Args:
+            items: Данные для создания.
+            chunk_size: Размер чанка (по умолчанию BULK_CHUNK_SIZE).
+
+        Returns:
+            Отчёт с inserted_ids и ошибками по документам.
+        """
+        report = BulkWriteReport()
+
+        for chunk_index, (offset, chunk) in enumerate(self._iter_chunks(items, chunk_size)):
+            docs = [dict(item) for item in chunk]
+            _, failed = await self._write_chunk(
+                "create_many",
+                "INSERT",
+                chunk_index,
+                offset,
+                len(docs),
+                len(items),
+                lambda: self.collection.insert_many(docs, ordered=False),
+                report,
+            )
+            # insert_many проставляет _id в документы до отправки
+            report.inserted_ids.extend(
+                str(doc["_id"]) for index, doc in enumerate(docs) if index not in failed
+            )
+
+        _count_cache.invalidate(self.collection.name)
+        return report
+
+    async def bulk_upsert(
+        self,
+        items: Sequence[dict[str, Any]],
+        key_fields: Sequence[str] = ("id",),
+        chunk_size: int | None = None,
+    ) -> BulkWriteReport:
+        """
+        Вставить или обновить документы пакетно по ключевым полям.
+
+        Каждый документ — UpdateOne(upsert=True): $set данных и
+        updated_at, created_at только при вставке ($setOnInsert).
+        Чанк — один bulk_write(ordered=False).
+
+        Args:
+            items: Данные документов (должны содержать key_fields).
+            key_fields: Поля, по которым ищется существующий документ
+                (для идемпотентной записи событий — внешний event_id).
+                "id" (как в bulk_update и API) и "_id" ищутся по ObjectId _id.
+            chunk_size: Размер чанка (по умолчанию BULK_CHUNK_SIZE).
+
+        Returns:
+            Отчёт с matched/modified/upserted и ошибками по документам
+            (невалидный ID — ошибка с code "INVALID_ID", документ не пишется).
+
+        Raises:
+            InvalidInputError: В документе нет ключевого поля (проверяется
+                до первой записи — при ошибке ничего не записано).
+        """
+        # Валидация до записи: исключение после первых чанков оставило бы
+        # часть документов записанной без отчёта
+        for index, item in enumerate(items):
+            missing = [key for key in key_fields if key not in item]
+            if missing:
+                raise InvalidInputError(
+                    f"Нет ключевых полей для upsert в элементе {index}: {', '.join(missing)}",
+                    field=missing[0],
+                )
+
+        report = BulkWriteReport()
+
+        for chunk_index, (offset, chunk) in enumerate(self._iter_chunks(items, chunk_size)):
+            now = datetime.now(UTC)
+            operations = []
+            positions: list[int] = []
+            for index, item in enumerate(chunk):
+                key_filter: dict[str, Any] = {}
+                invalid_ids: list[Any] = []
+                for key in key_fields:
+                    if key not in ("id", "_id"):
+                        key_filter[key] = item[key]
+                    elif ObjectId.is_valid(item[key]):
+                        key_filter["_id"] = ObjectId(item[key])
+                    else:
+                        invalid_ids.append(item[key])
+                if invalid_ids:
+                    # Строковый _id создал бы документ, недоступный get_by_id
+                    report.add_errors(chunk_index, offset, [{
+                        "index": index,
+                        "code": "INVALID_ID",
+                        "errmsg": f"Невалидный ObjectId: {invalid_ids[0]}",
+                    }])
+                    continue
+
+                values = {k: v for k, v in item.items() if k not in key_fields}
+                created_at = values.pop("created_at", now)
+                values["updated_at"] = now
+                operations.append(UpdateOne(
+                    key_filter,
+                    {"$set": values, "$setOnInsert": {"created_at": created_at}},
+                    upsert=True,
+                ))
+                positions.append(index)
+
+            if not operations:
+                continue
+
+            result, _ = await self._write_chunk(
+                "bulk_upsert",
+                "UPSERT",
+                chunk_index,
+                offset,
+                len(operations),
+                len(items),
+                lambda: self.collection.bulk_write(operations, ordered=False),
+                report,
+                positions=positions,
+            )
+            if result is not None:
+                report.matched_count += result.matched_count
+                report.modified_count += result.modified_count
+                report.upserted_count += result.upserted_count
+
+        _count_cache.invalidate(self.collection.name)
+        return report
+
+    async def bulk_update(
+        self,
+        items: Sequence[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> BulkWriteReport:
+        """
+        Обновить документы пакетно по ID.
+
+        Каждый документ — UpdateOne({"_id": id}, {"$set": ...}),
+        чанк — один bulk_write(ordered=False).
+
+        Args:
+            items: Данные обновления, каждый элемент содержит "id".
+            chunk_size: Размер чанка (по умолчанию BULK_CHUNK_SIZE).
+
+        Returns:
+            Отчёт с matched/modified и ошибками по документам
+            (невалидный ID — ошибка с code "INVALID_ID").
+
+        Raises:
+            InvalidInputError: В элементе нет "id" (проверяется до первой
+                записи — при ошибке ничего не записано).
+        """
+        # Валидация до записи, как update_many в postgres_data_api
+        for index, item in enumerate(items):
+            if "id" not in item:
+                raise InvalidInputError(
+                    f"Каждый элемент bulk_update должен содержать id (элемент {index})",
+                    field="id",
+                )
+
+        report = BulkWriteReport()
+
+        for chunk_index, (offset, chunk) in enumerate(self._iter_chunks(items, chunk_size)):
+            operations = []
+            positions: list[int] = []
+            for index, item in enumerate(chunk):
+                if not ObjectId.is_valid(item["id"]):
+                    report.add_errors(chunk_index, offset, [{
+                        "index": index,
+                        "code": "INVALID_ID",
+                        "errmsg": f"Невалидный ObjectId: {item['id']}",
+                    }])
+                    continue
+                values = {k: v for k, v in item.items() if k != "id"}
+                operations.append(UpdateOne(
+                    {"_id": ObjectId(item["id"])},
+                    {"$set": values},
+                ))
+                positions.append(index)
+
+            if not operations:
+                continue
+
+            result, _ = await self._write_chunk(
+                "bulk_update",
+                "UPDATE",
+                chunk_index,
+                offset,
+                len(operations),
+                len(items),
+                lambda: self.collection.bulk_write(operations, ordered=False),
+                report,
+                positions=positions,
+            )
+            if result is not None:
+                report.matched_count += result.matched_count
+                report.modified_count += result.modified_count
+
+        _count_cache.invalidate(self.collection.name)
+        return report
@@ -6,10 +6,11 @@ Dependency Injection для FastAPI.
 
 from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import async_session_maker
+from shared.utils.validators import parse_fields
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -30,6 +31,77 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 
+# === Проекция полей (?fields=id,name,email) ===
+
+def get_fields(
+    fields: str | None = Query(
+        default=None,
+        description="Поля ответа через запятую (проекция), например id,name,email",
+    ),
+) -> list[str] | None:
+    """
+    Получить список полей проекции из query параметра.
+
+    Args:
+        fields: Поля через запятую.
+
+    Returns:
+        Имена полей или None (все поля).
+
+    Raises:
+        HTTPException: 422 при невалидном списке полей.
+    """
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+
+FieldsDep = Annotated[list[str] | None, Depends(get_fields)]
+
+
+# === Фильтры списка (?status=new&price__gte=10&name__prefix=Jo) ===
+
+# Query параметры списка, которые не являются фильтрами
+RESERVED_QUERY_PARAMS = frozenset(
+    {"page", "page_size", "cursor", "fields", "sort_by", "sort_order"}
+)
+
+
+def get_filters(request: Request) -> dict[str, str] | None:
+    """
+    Получить фильтры из query параметров запроса.
+
+    Проверка полей по whitelist и приведение типов выполняется
+    в репозитории (BaseRepository.FILTERABLE_FIELDS).
+
+    Args:
+        request: HTTP запрос.
+
+    Returns:
+        Параметры фильтра или None (без фильтров).
+
+    Raises:
+        HTTPException: 422 при повторе параметра (status=a&status=b) —
+            несколько значений передаются через __in.
+    """
+    filters: dict[str, str] = {}
+    for key, value in request.query_params.multi_items():
+        if key in RESERVED_QUERY_PARAMS:
+            continue
+        if key in filters:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Параметр фильтра '{key}' передан несколько раз: "
+                f"используйте {key.split('__')[0]}__in=a,b",
+            )
+        filters[key] = value
+    return filters or None
+
+
+FiltersDep = Annotated[dict[str, str] | None, Depends(get_filters)]
+
+
 # === Пример зависимости репозитория ===
 # def get_{domain}_repository(
 #     session: SessionDep,
@@ -0,0 +1,78 @@
+"""
+Роутер пакетного чтения.
+
+Фабрика маршрута POST /batch для любой сущности:
+получение нескольких записей одним запросом (WHERE id = ANY(:ids)).
+Серверная часть DataAPIClient.get_by_ids.
+"""
+
+from typing import Annotated, Any, Callable
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from src.repositories.base import BaseRepository
+from shared.schemas.batch import BatchGetRequest, BatchGetResponse
+
+
+def create_batch_router(
+    get_repository: Callable[..., BaseRepository],
+    item_schema: type[BaseModel],
+) -> APIRouter:
+    """
+    Создать роутер с маршрутом POST /batch.
+
+    Args:
+        get_repository: Dependency, возвращающая репозиторий сущности.
+        item_schema: Схема ответа для одной сущности.
+
+    Returns:
+        Роутер для подключения с префиксом сущности.
+
+    Example:
+        ```python
+        api_router.include_router(
+            create_batch_router(get_user_repository, UserResponse),
+            prefix="/users",
+            tags=["Users"],
+        )
+        ```
+    """
+    router = APIRouter()
+
+    @router.post(
+        "/batch",
+        response_model=BatchGetResponse[item_schema],
+        summary="Получить несколько записей по ID",
+    )
+    async def get_batch(
+        payload: BatchGetRequest,
+        repository: Annotated[BaseRepository, Depends(get_repository)],
+    ) -> dict[str, Any]:
+        """
+        Получить записи по списку ID.
+
+        Порядок items совпадает с порядком ids в запросе;
+        ненайденные и невалидные ID возвращаются в missing_ids.
+        """
+        parsed: dict[str, UUID] = {}
+        for raw_id in payload.ids:
+            try:
+                parsed[raw_id] = UUID(raw_id)
+            except ValueError:
+                continue
+
+        entities = await repository.get_many(list(parsed.values()))
+        found = {entity.id for entity in entities}
+
+        return {
+            "items": [item_schema.model_validate(entity) for entity in entities],
+            "missing_ids": [
+                raw_id
+                for raw_id in payload.ids
+                if parsed.get(raw_id) not in found
+            ],
+        }
+
+    return router
@@ -0,0 +1,101 @@
+"""
+Роутер потоковой выгрузки.
+
+Фабрика маршрута GET /export для любой сущности:
+выгрузка всей таблицы в NDJSON или CSV через серверный курсор
+(BaseRepository.stream_all) при постоянном потреблении памяти.
+Серверная часть DataAPIClient.iter_export.
+"""
+
+from typing import AsyncIterator, Callable
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import async_session_maker
+from src.repositories.base import BaseRepository
+from shared.utils.streaming import STREAMING_HEADERS, ExportFormat, encode_stream
+
+
+def create_export_router(
+    repository_factory: Callable[[AsyncSession], BaseRepository],
+    item_schema: type[BaseModel],
+) -> APIRouter:
+    """
+    Создать роутер с маршрутом GET /export.
+
+    Сессия открывается внутри генератора ответа, а не через
+    Depends(get_session): yield-зависимости FastAPI могут закрыться
+    до окончания StreamingResponse.
+
+    Args:
+        repository_factory: Конструктор репозитория по сессии.
+        item_schema: Схема одной записи в выгрузке.
+
+    Returns:
+        Роутер для подключения с префиксом сущности
+        (до роутера домена, чтобы /export не совпал с /{id}).
+
+    Example:
+        ```python
+        api_router.include_router(
+            create_export_router(UserRepository, UserResponse),
+            prefix="/users",
+            tags=["Users"],
+        )
+        ```
+    """
+    router = APIRouter()
+
+    def export_headers(export_format: ExportFormat) -> dict[str, str]:
+        if export_format == "csv":
+            return {
+                **STREAMING_HEADERS,
+                "Content-Disposition": "attachment; filename=export.csv",
+            }
+        return STREAMING_HEADERS
+
+    def serialize(entity: object) -> dict:
+        return item_schema.model_validate(entity).model_dump(mode="json", by_alias=True)
+
+    @router.get(
+        "/export",
+        response_class=StreamingResponse,
+        summary="Потоковая выгрузка записей (NDJSON/CSV)",
+    )
+    async def export(
+        export_format: ExportFormat = Query(
+            default="ndjson",
+            alias="format",
+            description="Формат выгрузки: ndjson | csv",
+        ),
+        batch_size: int | None = Query(
+            default=None,
+            ge=1,
+            le=10000,
+            description="Строк на один fetch серверного курсора",
+        ),
+    ) -> StreamingResponse:
+        """
+        Выгрузить все записи потоком.
+
+        Строки читаются из БД пачками по batch_size только по мере
+        отправки клиенту (backpressure), память сервиса постоянна.
+        """
+
+        async def rows() -> AsyncIterator[object]:
+            async with async_session_maker() as session:
+                repository = repository_factory(session)
+                async for entity in repository.stream_all(batch_size=batch_size):
+                    yield entity
+
+        body, media_type = encode_stream(rows(), export_format, serialize=serialize)
+        return StreamingResponse(
+            body,
+            media_type=media_type,
+            headers=export_headers(export_format),
+        )
+
+    return router
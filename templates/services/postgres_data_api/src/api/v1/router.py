@@ -8,12 +8,41 @@ from fastapi import APIRouter
 
 # Импорт роутеров доменов
 # from src.api.v1.{domain} import router as {domain}_router
+# from src.api.v1.batch import create_batch_router
+# from src.api.v1.export import create_export_router
 
 api_router = APIRouter()
 
 # Подключение роутеров
+# GET /{domain}s/export — потоковая выгрузка NDJSON для DataAPIClient.iter_export
+# (подключать до роутера домена, чтобы /export не совпал с /{id})
+# api_router.include_router(
+#     create_export_router({Domain}Repository, {Domain}Response),
+#     prefix="/{domain}s",
+#     tags=["{Domain}s"],
+# )
+#
 # api_router.include_router(
 #     {domain}_router.router,
 #     prefix="/{domain}s",
 #     tags=["{Domain}s"],
 # )
+#
+# Проекция в списке домена: GET /{domain}s?fields=id,name,email
+# (поля задаются в {Domain}Repository.PROJECTABLE_FIELDS)
+# @router.get("")
+# async def list_{domain}s(repository: ..., fields: FieldsDep, ...):
+#     items = await repository.get_all(offset=offset, limit=limit, fields=fields)
+#
+# Фильтры и сортировка: GET /{domain}s?status__in=new,paid&sort_by=created_at
+# (колонки задаются в {Domain}Repository.FILTERABLE_FIELDS / SORTABLE_FIELDS)
+# async def list_{domain}s(repository: ..., filters: FiltersDep, sort_by: str | None = None, ...):
+#     items = await repository.get_all(offset, limit, filters=filters, sort_by=sort_by)
+#     total = await repository.count_by_strategy(filters=filters)
+#
+# POST /{domain}s/batch — пакетное чтение для DataAPIClient.get_by_ids
+# api_router.include_router(
+#     create_batch_router(get_{domain}_repository, {Domain}Response),
+#     prefix="/{domain}s",
+#     tags=["{Domain}s"],
+# )
@@ -7,6 +7,8 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from shared.utils.pagination import CountStrategy
+
 
 class Settings(BaseSettings):
     """Настройки приложения."""
@@ -16,10 +18,21 @@ class Settings(BaseSettings):
     app_env: str = "development"
     debug: bool = True
     log_level: str = "INFO"
+    # Неблокирующий вывод логов (кольцевой буфер + фоновый поток)
+    log_async_sink: bool = False
+    log_sink_policy: str = "drop"  # drop | block
+    # Сэмплирование request/db событий (ошибки и медленные сохраняются всегда)
+    log_sampling_enabled: bool = False
+    # Профиль логирования: dev | prod (prod — дешёвый timestamp)
+    log_profile: str = "dev"
 
     # === Reverse Proxy ===
     root_path: str = ""  # Путевой префикс (например, "/my-service")
 
+    # === JSON ===
+    # orjson/msgspec для ответов, если установлены (иначе stdlib json)
+    fast_json_enabled: bool = True
+
     # === База данных ===
     # SECURITY: Нет default значения с credentials!
     # Обязательно установить через DATABASE_URL в .env
@@ -32,6 +45,50 @@ class Settings(BaseSettings):
     db_pool_size: int = 5
     db_max_overflow: int = 10
 
+    # === Read-реплики ===
+    # JSON список URL реплик: ["postgresql+asyncpg://replica1:5432/{context}_db"]
+    # Пустой список — все запросы на primary
+    database_replica_urls: list[str] = []
+    db_replica_health_check_interval_seconds: float = 10.0
+
+    # === Пагинация ===
+    # SECURITY: Секрет подписи курсоров keyset-пагинации.
+    # Нет default значения — установить через CURSOR_SECRET в .env
+    cursor_secret: str = Field(
+        ...,
+        min_length=16,
+        description="Секрет подписи курсоров. ОБЯЗАТЕЛЬНО установите через CURSOR_SECRET (openssl rand -hex 32)",
+    )
+
+    # Стратегия подсчёта total_items: exact | estimate | cached
+    count_strategy: CountStrategy = "exact"
+    count_cache_ttl_seconds: float = 30.0
+    count_cache_max_entries: int = 10000
+
+    # === Медленные запросы ===
+    # EXPLAIN (без ANALYZE) медленных запросов в фоне, сводка плана в slow_query_detected
+    slow_query_explain_enabled: bool = False
+    slow_query_explain_interval_seconds: float = 300.0
+    slow_query_explain_timeout_seconds: float = 5.0
+
+    # === Счётчик запросов к БД на HTTP запрос ===
+    query_tracking_enabled: bool = True
+    # Повторов одной формы SQL в запросе до предупреждения n_plus_one_suspected
+    n_plus_one_threshold: int = 10
+
+    # === Потоковая выгрузка (GET /export) ===
+    # Строк на один fetch серверного курсора (память ∝ batch_size)
+    db_stream_batch_size: int = 1000
+
+    # === Идемпотентность (Idempotency-Key для POST/PATCH) ===
+    idempotency_enabled: bool = True
+    idempotency_backend: str = "memory"  # memory | redis (общий для реплик)
+    idempotency_ttl_seconds: float = 86400.0
+    idempotency_max_entries: int = 10000
+    # Суммарный размер ответов в памяти процесса (backend=memory)
+    idempotency_max_bytes: int = 64 * 1024 * 1024
+    redis_url: str = "redis://redis:6379/0"
+
     class Config:
         """Конфигурация Pydantic."""
 
@@ -4,13 +4,19 @@
 Async SQLAlchemy engine и session.
 """
 
+import time
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
 from src.core.config import settings
+from src.core.replicas import ReplicaPool, RoutingSession
+from shared.utils.query_tracker import record_query
 
 
 # Создание async engine
@@ -21,10 +27,64 @@ engine = create_async_engine(
     max_overflow=settings.db_max_overflow,
 )
 
-# Фабрика сессий
+# Read-реплики (DATABASE_REPLICA_URLS): чтение round-robin, запись на primary
+replica_pool = ReplicaPool([
+    create_async_engine(
+        replica_url,
+        echo=settings.debug,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+    for replica_url in settings.database_replica_urls
+])
+
+
+def instrument_query_tracking(async_engine: AsyncEngine) -> None:
+    """
+    Подключить счётчик запросов к событиям engine.
+
+    Каждый SQL statement (в том числе завершившийся ошибкой) учитывается
+    в QueryStats текущего HTTP запроса (см. RequestContextMiddleware).
+    EXPLAIN медленных запросов не учитывается.
+
+    Args:
+        async_engine: Async engine.
+    """
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+    @event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start_times"].pop()
+        if not statement.startswith("EXPLAIN"):
+            record_query(statement, (time.perf_counter() - start) * 1000)
+
+    @event.listens_for(async_engine.sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        # after_cursor_execute не вызывается при ошибке — снимаем время
+        # со стека соединения, иначе оно копится на соединении из пула
+        conn = exception_context.connection
+        start_times = conn.info.get("query_start_times") if conn is not None else None
+        if not start_times:
+            return
+        start = start_times.pop()
+        statement = exception_context.statement
+        if statement and not statement.startswith("EXPLAIN"):
+            record_query(statement, (time.perf_counter() - start) * 1000)
+
+
+if settings.query_tracking_enabled:
+    for tracked_engine in [engine, *replica_pool.engines]:
+        instrument_query_tracking(tracked_engine)
+
+# Фабрика сессий (RoutingSession выбирает primary/реплику на каждый запрос)
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replica_pool=replica_pool if replica_pool.engines else None,
     expire_on_commit=False,
 )
 
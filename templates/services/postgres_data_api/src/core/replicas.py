@@ -0,0 +1,166 @@
+"""
+Маршрутизация запросов между primary и read-репликами.
+
+- ReplicaPool — round-robin по здоровым репликам, фоновая проверка SELECT 1
+- RoutingSession — чтение на реплику, запись и чтение после записи на primary
+
+Сессия живёт один HTTP запрос: после первой записи (flush, INSERT/UPDATE/
+DELETE, SELECT ... FOR UPDATE) все последующие запросы сессии идут на primary,
+чтобы не читать с реплики данные, которые ещё не реплицированы.
+"""
+
+import asyncio
+import itertools
+from typing import Any
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+logger = structlog.get_logger()
+
+# Ключ Session.info: сессия закреплена за primary
+PRIMARY_PINNED_KEY = "primary_pinned"
+
+
+class ReplicaPool:
+    """
+    Пул read-реплик с round-robin выбором и проверкой здоровья.
+
+    Реплика, не ответившая на SELECT 1, исключается из выбора до
+    следующей успешной проверки. Без здоровых реплик чтение идёт на primary.
+
+    Attributes:
+        engines: Engines реплик.
+        healthy: Индексы здоровых реплик.
+    """
+
+    def __init__(self, engines: list[AsyncEngine]) -> None:
+        """
+        Инициализировать пул.
+
+        Args:
+            engines: Engines реплик (пустой список — реплик нет).
+        """
+        self.engines = engines
+        self.healthy: set[int] = set(range(len(engines)))
+        self._cycle = itertools.cycle(range(len(engines))) if engines else None
+
+    def select(self) -> Engine | None:
+        """
+        Выбрать следующую здоровую реплику.
+
+        Returns:
+            Sync engine реплики (для Session.get_bind) или None.
+        """
+        if self._cycle is None or not self.healthy:
+            return None
+        for _ in range(len(self.engines)):
+            index = next(self._cycle)
+            if index in self.healthy:
+                return self.engines[index].sync_engine
+        return None
+
+    async def check_health(self, timeout: float = 2.0) -> None:
+        """
+        Проверить все реплики (SELECT 1) и обновить набор здоровых.
+
+        Args:
+            timeout: Таймаут проверки одной реплики.
+        """
+        for index, engine in enumerate(self.engines):
+            try:
+                async with asyncio.timeout(timeout):
+                    async with engine.connect() as connection:
+                        await connection.execute(text("SELECT 1"))
+                is_healthy = True
+            except Exception as e:
+                is_healthy = False
+                error = type(e).__name__
+
+            if is_healthy != (index in self.healthy):
+                if is_healthy:
+                    self.healthy.add(index)
+                    logger.info("replica_health_changed", replica=index, healthy=True)
+                else:
+                    self.healthy.discard(index)
+                    logger.warning(
+                        "replica_health_changed",
+                        replica=index,
+                        healthy=False,
+                        error=error,
+                    )
+
+    async def run_health_checks(self, interval_seconds: float) -> None:
+        """
+        Периодически проверять реплики (фоновая задача из lifespan).
+
+        Args:
+            interval_seconds: Интервал между проверками.
+        """
+        while True:
+            await self.check_health()
+            await asyncio.sleep(interval_seconds)
+
+    async def dispose(self) -> None:
+        """Закрыть пулы соединений реплик."""
+        for engine in self.engines:
+            await engine.dispose()
+
+
+class RoutingSession(Session):
+    """
+    Sync Session с выбором engine по типу запроса.
+
+    Используется как sync_session_class для AsyncSession; bind сессии —
+    primary, ReplicaPool передаётся через replica_pool.
+
+    Маршрутизация:
+        - flush, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE → primary
+          (и закрепление сессии за primary)
+        - остальные чтения закреплённой сессии → primary
+        - остальные чтения → следующая здоровая реплика (или primary)
+    """
+
+    def __init__(self, *args: Any, replica_pool: ReplicaPool | None = None, **kwargs: Any):
+        """
+        Инициализировать сессию.
+
+        Args:
+            *args: Аргументы Session.
+            replica_pool: Пул реплик (None — только primary).
+            **kwargs: Аргументы Session.
+        """
+        super().__init__(*args, **kwargs)
+        self.replica_pool = replica_pool
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        """Выбрать engine для запроса."""
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+
+        if (
+            self._flushing
+            or isinstance(clause, UpdateBase)
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            self.info[PRIMARY_PINNED_KEY] = True
+            return primary
+
+        if self.replica_pool is None or self.info.get(PRIMARY_PINNED_KEY):
+            return primary
+
+        return self.replica_pool.select() or primary
+
+
+def use_primary(session: AsyncSession) -> None:
+    """
+    Закрепить сессию за primary (чтение без задержки репликации).
+
+    Args:
+        session: Async сессия.
+    """
+    session.info[PRIMARY_PINNED_KEY] = True
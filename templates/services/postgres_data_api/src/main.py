@@ -4,16 +4,22 @@
 Создание и настройка FastAPI приложения.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import structlog
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 from src.core.config import settings
 from src.core.logging import setup_logging
-from src.core.database import engine
+from src.core.database import engine, replica_pool
 from src.api.v1.router import api_router
+from shared.utils.json_codec import get_json_backend
+from shared.utils.responses import FastJSONResponse
+from shared.utils.idempotency import IdempotencyMiddleware, create_idempotency_store
+from shared.utils.request_id import RequestContextMiddleware
 
 
 logger = structlog.get_logger()
@@ -33,13 +39,27 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         environment=settings.app_env,
     )
 
+    # Проверка здоровья read-реплик в фоне
+    health_check_task = None
+    if replica_pool.engines:
+        health_check_task = asyncio.create_task(
+            replica_pool.run_health_checks(
+                settings.db_replica_health_check_interval_seconds,
+            )
+        )
+        logger.info("replicas_enabled", replicas=len(replica_pool.engines))
+
     yield
 
     # === Shutdown ===
     logger.info("Остановка приложения")
 
+    if health_check_task is not None:
+        health_check_task.cancel()
+
     # Закрытие подключения к БД
     await engine.dispose()
+    await replica_pool.dispose()
     logger.info("Подключение к БД закрыто")
 
 
@@ -54,6 +74,10 @@ def create_app() -> FastAPI:
     setup_logging(
         log_level=settings.log_level,
         json_logs=settings.app_env != "development",
+        async_sink=settings.log_async_sink,
+        sink_policy=settings.log_sink_policy,
+        sampling=settings.log_sampling_enabled,
+        profile=settings.log_profile,
     )
 
     # Создание приложения
@@ -65,6 +89,37 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        default_response_class=(
+            FastJSONResponse if settings.fast_json_enabled else JSONResponse
+        ),
+    )
+    logger.info(
+        "json_backend_selected",
+        backend=get_json_backend() if settings.fast_json_enabled else "json",
+    )
+
+    # Idempotency middleware: повтор POST/PATCH с тем же Idempotency-Key
+    # получает сохранённый ответ вместо повторной записи в БД
+    if settings.idempotency_enabled:
+        app.add_middleware(
+            IdempotencyMiddleware,
+            store=create_idempotency_store(
+                backend=settings.idempotency_backend,
+                redis_url=settings.redis_url,
+                max_entries=settings.idempotency_max_entries,
+                max_bytes=settings.idempotency_max_bytes,
+            ),
+            ttl_seconds=settings.idempotency_ttl_seconds,
+        )
+
+    # Контекст трассировки (request_id в логах, request_completed
+    # с итогами SQL запросов и n_plus_one_suspected).
+    # Добавляется последним — внешний слой, чтобы request_id был
+    # и в логах остальных middleware
+    app.add_middleware(
+        RequestContextMiddleware,
+        track_queries=settings.query_tracking_enabled,
+        repeat_threshold=settings.n_plus_one_threshold,
     )
 
     # Подключение роутеров
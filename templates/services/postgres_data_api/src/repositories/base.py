@@ -5,21 +5,60 @@ Generic CRUD операции для всех сущностей.
 Реализует Log-Driven Design для операций с БД.
 """
 
+import asyncio
 import time
-from typing import Any, Generic, Sequence, TypeVar
+from typing import Any, AsyncIterator, Generic, Iterator, Sequence, TypeVar, overload
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select, func
+from sqlalchemy import any_, bindparam, insert, select, func, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import ClauseElement
 
 from src.domain.entities.base import Base
 from src.core.config import settings
+from src.repositories.filters import (
+    build_filter_clauses,
+    build_order_by,
+    parse_filters,
+)
+from src.repositories.query_plan import (
+    ExplainThrottle,
+    compile_redacted,
+    explain_statement,
+    run_in_background,
+)
+from shared.utils.exceptions import InvalidInputError
 from shared.utils.log_helpers import log_db_operation, log_slow_query
+from shared.utils.query_tracker import record_operation
+from shared.utils.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    CountCache,
+    CountResult,
+    CountStrategy,
+    CursorPaginatedResult,
+    CursorPaginationMeta,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 logger = structlog.get_logger()
 
+# Кэш COUNT для стратегии "cached" (общий для всех репозиториев процесса)
+_count_cache = CountCache(
+    ttl_seconds=settings.count_cache_ttl_seconds,
+    max_entries=settings.count_cache_max_entries,
+)
+
+# Частота EXPLAIN для одного SQL медленного запроса
+_explain_throttle = ExplainThrottle(
+    interval_seconds=getattr(settings, "slow_query_explain_interval_seconds", 300.0),
+)
+
 ModelType = TypeVar("ModelType", bound=Base)
 
 
@@ -32,11 +71,42 @@ class BaseRepository(Generic[ModelType]):
     - Время выполнения (duration_ms)
     - Количество затронутых записей
     - Медленные запросы (WARNING)
+
+    Пакетные операции (create_many, update_many, upsert_many) выполняются
+    чанками: один multi-row запрос и один commit на чанк, одно агрегированное
+    событие db_operation на чанк.
+
+    При настроенных read-репликах (DATABASE_REPLICA_URLS) чтения
+    (get_by_id, get_all, count, ...) выполняет реплика, запись и все
+    запросы сессии после неё — primary (см. src.core.replicas).
     """
 
     # Порог медленного запроса в миллисекундах
     SLOW_QUERY_THRESHOLD_MS = 100.0
 
+    # Размер чанка для пакетных операций (строк на один запрос).
+    # PostgreSQL ограничивает запрос 32767 параметрами:
+    # chunk_size * количество колонок не должно превышать этот лимит.
+    BULK_CHUNK_SIZE = 1000
+
+    # Лимит параметров одного запроса (int16 в протоколе, asyncpg)
+    MAX_QUERY_PARAMS = 32767
+
+    # Строк на один fetch серверного курсора при потоковом чтении
+    STREAM_BATCH_SIZE = 1000
+
+    # Whitelist колонок для фильтров и сортировки списка (?status=new&sort_by=...).
+    # Пустой набор — фильтрация/сортировка по колонкам запрещена.
+    # Фильтр по колонке без индекса логируется как filter_on_non_indexed_column.
+    FILTERABLE_FIELDS: frozenset[str] = frozenset()
+    SORTABLE_FIELDS: frozenset[str] = frozenset()
+
+    # Whitelist колонок для проекции (?fields=id,name). Только поля,
+    # которые отдаёт {Domain}Response: проекция не должна раскрывать
+    # скрытые колонки (password_hash и т.п.). id разрешён всегда,
+    # пустой набор — проекция только по id.
+    PROJECTABLE_FIELDS: frozenset[str] = frozenset()
+
     def __init__(self, model: type[ModelType], session: AsyncSession):
         """
         Инициализация репозитория.
@@ -53,27 +123,120 @@ class BaseRepository(Generic[ModelType]):
         self,
         operation: str,
         duration_ms: float,
+        statement: ClauseElement | None = None,
     ) -> None:
         """
-        Проверить и залогировать медленный запрос.
+        Учесть операцию в счётчике запроса и проверить медленный запрос.
+
+        Операция добавляется в QueryStats.operations текущего HTTP запроса
+        (для n_plus_one_suspected). Для переданного statement в лог
+        добавляется SQL без значений параметров; при
+        slow_query_explain_enabled событие логируется после фонового
+        EXPLAIN со сводкой плана.
 
         Args:
             operation: Название операции.
             duration_ms: Время выполнения.
+            statement: Выполненный запрос (для SQL и плана).
         """
         threshold = getattr(
             settings,
             "slow_query_threshold_ms",
             self.SLOW_QUERY_THRESHOLD_MS,
         )
-        if duration_ms > threshold:
-            log_slow_query(
-                logger,
-                operation=operation,
-                table=self._table_name,
-                duration_ms=duration_ms,
-                threshold_ms=threshold,
+        record_operation(self._table_name, operation)
+        if duration_ms <= threshold:
+            return
+
+        query_fields: dict[str, Any] = {}
+        if statement is not None:
+            engine = self.session.bind
+            sql, param_count = compile_redacted(
+                statement,
+                engine.dialect if engine is not None else None,
+            )
+            query_fields = {"sql": sql, "param_count": param_count}
+
+            if (
+                engine is not None
+                and getattr(settings, "slow_query_explain_enabled", False)
+                and _explain_throttle.should_explain(sql)
+            ):
+                run_in_background(self._log_slow_query_with_plan(
+                    operation, duration_ms, threshold, statement, query_fields,
+                ))
+                return
+
+        log_slow_query(
+            logger,
+            operation=operation,
+            table=self._table_name,
+            duration_ms=duration_ms,
+            threshold_ms=threshold,
+            **query_fields,
+        )
+
+    async def _log_slow_query_with_plan(
+        self,
+        operation: str,
+        duration_ms: float,
+        threshold: float,
+        statement: ClauseElement,
+        query_fields: dict[str, Any],
+    ) -> None:
+        """
+        Снять план медленного запроса и залогировать slow_query_detected.
+
+        Ошибка EXPLAIN не теряет событие — оно логируется с plan_error.
+
+        Args:
+            operation: Название операции.
+            duration_ms: Время выполнения.
+            threshold: Порог медленного запроса.
+            statement: Выполненный запрос.
+            query_fields: SQL и количество параметров.
+        """
+        timeout = getattr(settings, "slow_query_explain_timeout_seconds", 5.0)
+        try:
+            plan = await asyncio.wait_for(
+                explain_statement(self.session.bind, statement),
+                timeout=timeout,
             )
+            query_fields = {**query_fields, "plan": plan}
+        except Exception as e:
+            query_fields = {**query_fields, "plan_error": type(e).__name__}
+
+        log_slow_query(
+            logger,
+            operation=operation,
+            table=self._table_name,
+            duration_ms=duration_ms,
+            threshold_ms=threshold,
+            **query_fields,
+        )
+
+    def _iter_chunks(
+        self,
+        items: Sequence[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> Iterator[Sequence[dict[str, Any]]]:
+        """
+        Разбить входные данные на чанки для пакетной операции.
+
+        Args:
+            items: Список словарей с данными.
+            chunk_size: Размер чанка (по умолчанию из настроек).
+
+        Yields:
+            Последовательные срезы items.
+        """
+        size = chunk_size or getattr(
+            settings,
+            "db_bulk_chunk_size",
+            self.BULK_CHUNK_SIZE,
+        )
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
 
     async def get_by_id(self, entity_id: UUID) -> ModelType | None:
         """
@@ -102,23 +265,172 @@ class BaseRepository(Generic[ModelType]):
 
         return result
 
+    async def get_many(self, entity_ids: Sequence[UUID]) -> list[ModelType]:
+        """
+        Получить несколько сущностей по ID одним запросом.
+
+        Использует WHERE id = ANY(:ids) с одним параметром-массивом,
+        поэтому форма запроса не зависит от количества ID.
+
+        Args:
+            entity_ids: UUID сущностей.
+
+        Returns:
+            Найденные сущности в порядке entity_ids (без отсутствующих
+            и дубликатов).
+        """
+        unique_ids = list(dict.fromkeys(entity_ids))
+        if not unique_ids:
+            return []
+
+        start = time.perf_counter()
+        ids_param = bindparam(
+            "ids",
+            value=unique_ids,
+            type_=ARRAY(self.model.id.type),
+        )
+        query = select(self.model).where(self.model.id == any_(ids_param))
+        result = await self.session.execute(query)
+        by_id = {entity.id: entity for entity in result.scalars().all()}
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        log_db_operation(
+            logger,
+            operation="get_many",
+            table=self._table_name,
+            query_type="SELECT",
+            duration_ms=duration_ms,
+            affected_rows=len(by_id),
+            requested=len(unique_ids),
+        )
+        self._check_slow_query("get_many", duration_ms, query)
+
+        return [by_id[entity_id] for entity_id in unique_ids if entity_id in by_id]
+
+    def _projection_columns(self, fields: Sequence[str]) -> list[Any]:
+        """
+        Получить колонки модели для проекции.
+
+        Args:
+            fields: Имена колонок.
+
+        Returns:
+            Атрибуты модели (id добавляется всегда).
+
+        Raises:
+            InvalidInputError: Колонки нет в PROJECTABLE_FIELDS или в модели.
+        """
+        attributes = self.model.__mapper__.column_attrs.keys()
+        unknown = [
+            name for name in fields
+            if name != "id"
+            and (name not in self.PROJECTABLE_FIELDS or name not in attributes)
+        ]
+        if unknown:
+            raise InvalidInputError(
+                f"Неизвестные поля: {', '.join(unknown)}",
+                field="fields",
+            )
+        names = dict.fromkeys(["id", *fields])
+        return [getattr(self.model, name) for name in names]
+
+    def _filter_clauses(self, filters: dict[str, Any] | None) -> list[Any]:
+        """
+        Построить условия WHERE из параметров фильтра.
+
+        Args:
+            filters: Параметры фильтра (status=new, price__gte=10, ...).
+
+        Returns:
+            Параметризованные условия (пустой список без фильтров).
+
+        Raises:
+            InvalidInputError: Колонка не в FILTERABLE_FIELDS или невалидное значение.
+        """
+        if not filters:
+            return []
+        return build_filter_clauses(
+            self.model,
+            parse_filters(filters),
+            self.FILTERABLE_FIELDS,
+        )
+
+    @overload
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        fields: None = None,
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+    ) -> Sequence[ModelType]: ...
+
+    @overload
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        *,
+        fields: Sequence[str],
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
     async def get_all(
         self,
         offset: int = 0,
         limit: int = 100,
-    ) -> Sequence[ModelType]:
+        fields: Sequence[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+    ) -> Sequence[ModelType] | list[dict[str, Any]]: ...
+
+    async def get_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        fields: Sequence[str] | None = None,
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+    ) -> Sequence[ModelType] | list[dict[str, Any]]:
         """
         Получить список сущностей.
 
         Args:
             offset: Смещение.
             limit: Лимит записей.
+            fields: Проекция — загрузить только эти колонки (load_only).
+            filters: Фильтры по колонкам из FILTERABLE_FIELDS.
+            sort_by: Колонка сортировки из SORTABLE_FIELDS (id как tie-breaker).
+            sort_order: Порядок сортировки (asc | desc).
 
         Returns:
-            Список сущностей.
+            Список сущностей; при fields — список словарей
+            только с запрошенными колонками (и id).
+
+        Raises:
+            InvalidInputError: Неизвестная колонка в fields, фильтр или
+                сортировка вне whitelist.
         """
         start = time.perf_counter()
-        query = select(self.model).offset(offset).limit(limit)
+        query = (
+            select(self.model)
+            .where(*self._filter_clauses(filters))
+            .order_by(*build_order_by(
+                self.model, sort_by, sort_order, self.SORTABLE_FIELDS,
+            ))
+            .offset(offset)
+            .limit(limit)
+        )
+        columns = self._projection_columns(fields) if fields is not None else None
+        if columns:
+            query = query.options(load_only(*columns, raiseload=True))
+
         result = await self.session.execute(query)
         entities = result.scalars().all()
         duration_ms = (time.perf_counter() - start) * 1000
@@ -132,20 +444,192 @@ class BaseRepository(Generic[ModelType]):
             affected_rows=len(entities),
             offset=offset,
             limit=limit,
+            fields=len(columns) if columns else None,
+            filters=len(filters) if filters else None,
+            sort_by=sort_by,
         )
-        self._check_slow_query("get_all", duration_ms)
+        self._check_slow_query("get_all", duration_ms, query)
 
+        if columns:
+            # Сериализация только загруженных атрибутов — без lazy load
+            return [
+                {column.key: getattr(entity, column.key) for column in columns}
+                for entity in entities
+            ]
         return entities
 
-    async def count(self) -> int:
+    async def get_page_after(
+        self,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: str = "created_at",
+        descending: bool = False,
+    ) -> CursorPaginatedResult[ModelType]:
+        """
+        Получить страницу keyset (cursor) пагинацией.
+
+        Вместо OFFSET использует условие WHERE (k, id) > (:k, :id),
+        которое обслуживается индексом по (order_by, id) за O(limit)
+        независимо от глубины страницы.
+
+        Args:
+            cursor: Курсор из предыдущего ответа (None — первая страница).
+            limit: Размер страницы.
+            order_by: Колонка сортировки (рекомендуется индекс (order_by, id)).
+            descending: Сортировка по убыванию.
+
+        Returns:
+            Страница сущностей и курсор следующей страницы.
+
+        Raises:
+            InvalidInputError: Неизвестная колонка или невалидный курсор.
+        """
+        if order_by not in self.model.__table__.c:
+            raise InvalidInputError(
+                f"Сортировка по полю '{order_by}' недоступна",
+                field="order_by",
+            )
+
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        sort_column = getattr(self.model, order_by)
+        id_column = self.model.id
+
+        start = time.perf_counter()
+        query = select(self.model)
+
+        if cursor:
+            position = decode_cursor(cursor, settings.cursor_secret)
+            if position.get("o") != order_by or position.get("d") != descending:
+                raise InvalidInputError(
+                    "Курсор не соответствует параметрам сортировки",
+                    field="cursor",
+                )
+
+            key = tuple_(sort_column, id_column)
+            bound = tuple_(position["k"], position["id"])
+            query = query.where(key < bound if descending else key > bound)
+
+        if descending:
+            query = query.order_by(sort_column.desc(), id_column.desc())
+        else:
+            query = query.order_by(sort_column.asc(), id_column.asc())
+
+        # +1 запись для определения has_next без COUNT
+        query = query.limit(limit + 1)
+        result = await self.session.execute(query)
+        entities = list(result.scalars().all())
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        has_next = len(entities) > limit
+        entities = entities[:limit]
+
+        next_cursor: str | None = None
+        if has_next:
+            last = entities[-1]
+            next_cursor = encode_cursor(
+                {
+                    "k": getattr(last, order_by),
+                    "id": last.id,
+                    "o": order_by,
+                    "d": descending,
+                },
+                settings.cursor_secret,
+            )
+
+        log_db_operation(
+            logger,
+            operation="get_page_after",
+            table=self._table_name,
+            query_type="SELECT",
+            duration_ms=duration_ms,
+            affected_rows=len(entities),
+            order_by=order_by,
+            has_cursor=cursor is not None,
+            has_next=has_next,
+            limit=limit,
+        )
+        self._check_slow_query("get_page_after", duration_ms, query)
+
+        return CursorPaginatedResult(
+            items=entities,
+            meta=CursorPaginationMeta(
+                next_cursor=next_cursor,
+                prev_cursor=None,
+                has_next=has_next,
+                has_prev=cursor is not None,
+            ),
+        )
+
+    async def stream_all(
+        self,
+        batch_size: int | None = None,
+        order_by: str = "id",
+    ) -> AsyncIterator[ModelType]:
+        """
+        Потоково прочитать все сущности через серверный курсор.
+
+        Строки забираются из PostgreSQL пачками по batch_size
+        (stream_scalars + yield_per), следующая пачка читается только
+        когда потребитель обработал предыдущую — память постоянна
+        при любом размере таблицы.
+
+        Args:
+            batch_size: Строк на один fetch (по умолчанию
+                settings.db_stream_batch_size или STREAM_BATCH_SIZE).
+            order_by: Колонка сортировки (стабильный порядок выгрузки).
+
+        Yields:
+            Сущности по одной.
+
+        Note:
+            Сессия занята курсором до конца итерации — не выполняйте
+            других запросов в этой сессии во время выгрузки.
+        """
+        batch_size = batch_size or getattr(
+            settings, "db_stream_batch_size", self.STREAM_BATCH_SIZE
+        )
+        query = (
+            select(self.model)
+            .order_by(getattr(self.model, order_by))
+            .execution_options(yield_per=batch_size)
+        )
+
+        start = time.perf_counter()
+        rows = 0
+        result = await self.session.stream_scalars(query)
+        try:
+            async for entity in result:
+                rows += 1
+                yield entity
+        finally:
+            await result.close()
+            log_db_operation(
+                logger,
+                operation="stream_all",
+                table=self._table_name,
+                query_type="SELECT",
+                duration_ms=(time.perf_counter() - start) * 1000,
+                affected_rows=rows,
+                batch_size=batch_size,
+                order_by=order_by,
+            )
+
+    async def count(self, filters: dict[str, Any] | None = None) -> int:
         """
         Подсчитать количество сущностей.
 
+        Args:
+            filters: Фильтры по колонкам из FILTERABLE_FIELDS.
+
         Returns:
             Количество записей.
         """
         start = time.perf_counter()
-        query = select(func.count()).select_from(self.model)
+        query = (
+            select(func.count())
+            .select_from(self.model)
+            .where(*self._filter_clauses(filters))
+        )
         result = await self.session.execute(query)
         count_value = result.scalar_one()
         duration_ms = (time.perf_counter() - start) * 1000
@@ -157,11 +641,88 @@ class BaseRepository(Generic[ModelType]):
             query_type="SELECT",
             duration_ms=duration_ms,
             count=count_value,
+            filters=len(filters) if filters else None,
         )
-        self._check_slow_query("count", duration_ms)
+        self._check_slow_query("count", duration_ms, query)
 
         return count_value
 
+    async def estimate_count(self) -> int | None:
+        """
+        Оценить количество записей по статистике планировщика.
+
+        Читает pg_class.reltuples — O(1) вместо полного сканирования.
+        Точность зависит от свежести ANALYZE/autovacuum.
+
+        Returns:
+            Оценка количества или None, если статистика ещё не собрана.
+        """
+        start = time.perf_counter()
+        query = text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE oid = to_regclass(:table_name)"
+        )
+        result = await self.session.execute(
+            query,
+            {"table_name": self._table_name},
+        )
+        estimate = result.scalar_one_or_none()
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        log_db_operation(
+            logger,
+            operation="estimate_count",
+            table=self._table_name,
+            query_type="SELECT",
+            duration_ms=duration_ms,
+            count=estimate,
+        )
+
+        # reltuples = -1 для таблицы без статистики (PostgreSQL 14+)
+        if estimate is None or estimate < 0:
+            return None
+        return estimate
+
+    async def count_by_strategy(
+        self,
+        strategy: CountStrategy | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> CountResult:
+        """
+        Подсчитать количество записей выбранной стратегией.
+
+        Используется для total_items в PaginatedResponse.create:
+        - exact: SELECT count(*) на каждый вызов
+        - estimate: pg_class.reltuples (fallback на exact без статистики)
+        - cached: точный count(*) с кэшированием на count_cache_ttl_seconds
+
+        Args:
+            strategy: Стратегия (по умолчанию settings.count_strategy).
+            filters: Фильтры (reltuples описывает всю таблицу, поэтому
+                с фильтрами estimate заменяется на exact).
+
+        Returns:
+            Количество и признак приблизительности.
+        """
+        strategy = strategy or settings.count_strategy
+
+        if strategy == "estimate" and not filters:
+            estimate = await self.estimate_count()
+            if estimate is not None:
+                return CountResult(total=estimate, is_approximate=True)
+
+        if strategy == "cached":
+            key = CountCache.make_key(self._table_name, filters)
+            cached = _count_cache.get(key)
+            if cached is not None:
+                return CountResult(total=cached)
+
+            total = await self.count(filters)
+            _count_cache.set(key, total)
+            return CountResult(total=total)
+
+        return CountResult(total=await self.count(filters))
+
     async def create(self, data: dict[str, Any]) -> ModelType:
         """
         Создать сущность.
@@ -189,6 +750,7 @@ class BaseRepository(Generic[ModelType]):
             entity_id=str(entity.id),
         )
         self._check_slow_query("create", duration_ms)
+        _count_cache.invalidate(self._table_name)
 
         return entity
 
@@ -230,6 +792,8 @@ class BaseRepository(Generic[ModelType]):
         await self.session.commit()
         await self.session.refresh(entity)
         duration_ms = (time.perf_counter() - start) * 1000
+        # Изменённая колонка могла входить в фильтр закэшированного COUNT
+        _count_cache.invalidate(self._table_name)
 
         log_db_operation(
             logger,
@@ -286,5 +850,206 @@ class BaseRepository(Generic[ModelType]):
             entity_id=str(entity_id),
         )
         self._check_slow_query("delete", duration_ms)
+        _count_cache.invalidate(self._table_name)
 
         return True
+
+    # === Пакетные операции ===
+
+    async def create_many(
+        self,
+        items: Sequence[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> list[ModelType]:
+        """
+        Создать сущности пакетно.
+
+        Каждый чанк вставляется одним multi-row INSERT ... RETURNING
+        и фиксируется одним commit.
+
+        Args:
+            items: Данные для создания.
+            chunk_size: Размер чанка (по умолчанию BULK_CHUNK_SIZE).
+
+        Returns:
+            Созданные сущности в порядке входных данных.
+        """
+        created: list[ModelType] = []
+        total_rows = len(items)
+
+        for chunk_index, chunk in enumerate(self._iter_chunks(items, chunk_size)):
+            start = time.perf_counter()
+            result = await self.session.scalars(
+                insert(self.model).returning(self.model),
+                list(chunk),
+            )
+            entities = result.all()
+            await self.session.commit()
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            log_db_operation(
+                logger,
+                operation="create_many",
+                table=self._table_name,
+                query_type="INSERT",
+                duration_ms=duration_ms,
+                affected_rows=len(entities),
+                chunk_index=chunk_index,
+                chunk_rows=len(chunk),
+                total_rows=total_rows,
+            )
+            self._check_slow_query("create_many", duration_ms)
+
+            created.extend(entities)
+
+        _count_cache.invalidate(self._table_name)
+        return created
+
+    async def update_many(
+        self,
+        items: Sequence[dict[str, Any]],
+        chunk_size: int | None = None,
+    ) -> int:
+        """
+        Обновить сущности пакетно по первичному ключу.
+
+        Каждый словарь должен содержать ключ "id". Чанк выполняется
+        одним executemany UPDATE и фиксируется одним commit.
+
+        Args:
+            items: Данные для обновления (с "id").
+            chunk_size: Размер чанка (по умолчанию BULK_CHUNK_SIZE).
+
+        Returns:
+            Количество обработанных записей.
+
+        Raises:
+            ValueError: Если у элемента отсутствует "id".
+        """
+        if any("id" not in item for item in items):
+            raise ValueError("update_many: каждый элемент должен содержать 'id'")
+
+        processed = 0
+        total_rows = len(items)
+
+        for chunk_index, chunk in enumerate(self._iter_chunks(items, chunk_size)):
+            start = time.perf_counter()
+            # ORM bulk UPDATE по первичному ключу (executemany) не возвращает
+            # rowcount — логируется размер чанка
+            await self.session.execute(update(self.model), list(chunk))
+            await self.session.commit()
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            log_db_operation(
+                logger,
+                operation="update_many",
+                table=self._table_name,
+                query_type="UPDATE",
+                duration_ms=duration_ms,
+                affected_rows=len(chunk),
+                chunk_index=chunk_index,
+                chunk_rows=len(chunk),
+                total_rows=total_rows,
+            )
+            self._check_slow_query("update_many", duration_ms)
+
+            processed += len(chunk)
+
+        _count_cache.invalidate(self._table_name)
+        return processed
+
+    async def upsert_many(
+        self,
+        items: Sequence[dict[str, Any]],
+        conflict_fields: Sequence[str] = ("id",),
+        update_fields: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+    ) -> list[ModelType]:
+        """
+        Вставить или обновить сущности пакетно.
+
+        Каждый чанк выполняется одним запросом
+        INSERT ... VALUES (...), (...) ON CONFLICT ... DO UPDATE ... RETURNING
+        и фиксируется одним commit. Все элементы должны иметь одинаковый
+        набор ключей: многострочный VALUES строится по колонкам первой строки.
+
+        Args:
+            items: Данные для вставки/обновления.
+            conflict_fields: Колонки уникального индекса для ON CONFLICT.
+            update_fields: Колонки для обновления при конфликте.
+                По умолчанию — все переданные колонки кроме conflict_fields.
+                Пустой список — ON CONFLICT DO NOTHING.
+            chunk_size: Размер чанка (по умолчанию BULK_CHUNK_SIZE);
+                ограничивается MAX_QUERY_PARAMS // число колонок.
+
+        Returns:
+            Вставленные и обновлённые сущности.
+
+        Raises:
+            ValueError: Если наборы ключей элементов различаются.
+        """
+        if items:
+            keys = items[0].keys()
+            if any(item.keys() != keys for item in items):
+                raise ValueError(
+                    "upsert_many: все элементы должны содержать одинаковый набор ключей"
+                )
+            # Один VALUES-запрос: строк * колонок параметров
+            chunk_size = min(
+                chunk_size or getattr(settings, "db_bulk_chunk_size", self.BULK_CHUNK_SIZE),
+                max(1, self.MAX_QUERY_PARAMS // max(1, len(keys))),
+            )
+
+        upserted: list[ModelType] = []
+        total_rows = len(items)
+        columns = self.model.__table__.c
+
+        for chunk_index, chunk in enumerate(self._iter_chunks(items, chunk_size)):
+            start = time.perf_counter()
+            stmt = pg_insert(self.model).values(list(chunk))
+
+            fields = (
+                update_fields
+                if update_fields is not None
+                else [key for key in chunk[0] if key not in conflict_fields]
+            )
+            if fields:
+                set_: dict[str, Any] = {
+                    field: stmt.excluded[field] for field in fields
+                }
+                if "updated_at" in columns and "updated_at" not in set_:
+                    set_["updated_at"] = func.now()
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(conflict_fields),
+                    set_=set_,
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(
+                    index_elements=list(conflict_fields),
+                )
+
+            result = await self.session.scalars(
+                stmt.returning(self.model),
+                execution_options={"populate_existing": True},
+            )
+            entities = result.all()
+            await self.session.commit()
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            log_db_operation(
+                logger,
+                operation="upsert_many",
+                table=self._table_name,
+                query_type="UPSERT",
+                duration_ms=duration_ms,
+                affected_rows=len(entities),
+                chunk_index=chunk_index,
+                chunk_rows=len(chunk),
+                total_rows=total_rows,
+            )
+            self._check_slow_query("upsert_many", duration_ms)
+
+            upserted.extend(entities)
+
+        _count_cache.invalidate(self._table_name)
+        return upserted
@@ -0,0 +1,274 @@
+"""
+Декларативные фильтры и сортировка.
+
+Преобразует query параметры списка в параметризованные выражения
+SQLAlchemy. Разрешены только колонки из whitelist репозитория.
+
+Синтаксис (совместим с DataAPIClient.get_list(filters=...)):
+    status=active                   → status = :p       (eq)
+    status__in=new,paid             → status IN (...)   (in)
+    created_at__gte=2024-01-01      → created_at >= :p  (range: gt/gte/lt/lte)
+    name__prefix=Jo                 → name LIKE 'Jo%'   (prefix, с экранированием)
+    deleted_at__is_null=true        → deleted_at IS NULL (is_null)
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from functools import cache
+from typing import Any, Literal, Mapping
+from uuid import UUID
+
+import structlog
+from sqlalchemy import ColumnElement, inspect
+from sqlalchemy.orm import InstrumentedAttribute
+
+from shared.utils.exceptions import InvalidInputError
+
+
+logger = structlog.get_logger()
+
+FilterOp = Literal["eq", "in", "gt", "gte", "lt", "lte", "prefix", "is_null"]
+
+FILTER_OPS: frozenset[str] = frozenset(
+    {"eq", "in", "gt", "gte", "lt", "lte", "prefix", "is_null"}
+)
+
+# Разделитель поля и оператора в имени параметра
+OP_SEPARATOR = "__"
+
+# Максимум значений в IN (...)
+MAX_IN_VALUES = 1000
+
+# Колонки, о фильтрации по которым без индекса уже предупредили
+_warned_columns: set[tuple[str, str]] = set()
+
+
+@dataclass(frozen=True)
+class FilterCondition:
+    """
+    Условие фильтра.
+
+    Attributes:
+        field: Имя колонки.
+        op: Оператор.
+        value: Значение (строка из query или уже типизированное).
+    """
+
+    field: str
+    op: FilterOp
+    value: Any
+
+
+def parse_filters(params: Mapping[str, Any]) -> list[FilterCondition]:
+    """
+    Разобрать query параметры в условия.
+
+    Args:
+        params: Параметры фильтра (без page/page_size/sort_*).
+
+    Returns:
+        Условия фильтра.
+
+    Raises:
+        InvalidInputError: Неизвестный оператор.
+    """
+    conditions = []
+    for key, value in params.items():
+        field, _, op = key.partition(OP_SEPARATOR)
+        op = op or "eq"
+        if op not in FILTER_OPS:
+            raise InvalidInputError(f"Неизвестный оператор фильтра: {op}", field=key)
+        conditions.append(FilterCondition(field=field, op=op, value=value))
+    return conditions
+
+
+@cache
+def get_indexed_columns(model: type) -> frozenset[str]:
+    """
+    Получить колонки, по которым фильтр использует индекс.
+
+    Учитываются первичный ключ, unique/index=True колонки и ведущие
+    колонки составных индексов таблицы. Результат кэшируется на модель:
+    метаданные таблицы не меняются во время работы процесса.
+
+    Args:
+        model: SQLAlchemy модель.
+
+    Returns:
+        Имена индексированных колонок.
+    """
+    table = model.__table__
+    indexed = {column.name for column in table.primary_key.columns}
+    indexed.update(
+        column.name for column in table.columns if column.index or column.unique
+    )
+    for index in table.indexes:
+        columns = list(index.columns)
+        if columns:
+            indexed.add(columns[0].name)
+    return frozenset(indexed)
+
+
+def _coerce(column: InstrumentedAttribute, value: Any, field: str) -> Any:
+    """
+    Привести значение из query к типу колонки.
+
+    Args:
+        column: Атрибут модели.
+        value: Значение.
+        field: Имя поля (для ошибки).
+
+    Returns:
+        Типизированное значение.
+
+    Raises:
+        InvalidInputError: Значение не приводится к типу колонки.
+    """
+    if not isinstance(value, str):
+        return value
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+
+    try:
+        if python_type is bool:
+            if value.lower() not in {"true", "false", "1", "0"}:
+                raise ValueError(value)
+            return value.lower() in {"true", "1"}
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type in (int, float, Decimal, UUID):
+            return python_type(value)
+    except (ValueError, ArithmeticError) as e:
+        raise InvalidInputError(
+            f"Невалидное значение фильтра {field}: {value}",
+            field=field,
+        ) from e
+    return value
+
+
+def build_filter_clauses(
+    model: type,
+    conditions: list[FilterCondition],
+    allowed_fields: frozenset[str],
+) -> list[ColumnElement[bool]]:
+    """
+    Построить параметризованные условия WHERE.
+
+    Args:
+        model: SQLAlchemy модель.
+        conditions: Условия фильтра.
+        allowed_fields: Whitelist колонок модели для фильтрации.
+
+    Returns:
+        Выражения для query.where(*clauses).
+
+    Raises:
+        InvalidInputError: Поле не в whitelist или невалидное значение.
+    """
+    table_name = model.__tablename__
+    indexed = get_indexed_columns(model)
+    clauses: list[ColumnElement[bool]] = []
+
+    for condition in conditions:
+        field, op, value = condition.field, condition.op, condition.value
+        if field not in allowed_fields:
+            raise InvalidInputError(
+                f"Фильтрация по полю {field} не разрешена",
+                field=field,
+            )
+
+        if field not in indexed and (table_name, field) not in _warned_columns:
+            _warned_columns.add((table_name, field))
+            logger.warning(
+                "filter_on_non_indexed_column",
+                table=table_name,
+                column=field,
+                op=op,
+            )
+
+        column: InstrumentedAttribute = getattr(model, field)
+
+        if op == "is_null":
+            if _coerce_bool(value, field):
+                clauses.append(column.is_(None))
+            else:
+                clauses.append(column.is_not(None))
+        elif op == "in":
+            raw = value.split(",") if isinstance(value, str) else list(value)
+            if not raw or len(raw) > MAX_IN_VALUES:
+                raise InvalidInputError(
+                    f"Фильтр {field}__in: от 1 до {MAX_IN_VALUES} значений",
+                    field=field,
+                )
+            clauses.append(column.in_([_coerce(column, item, field) for item in raw]))
+        elif op == "prefix":
+            # autoescape: % и _ в значении не работают как шаблон
+            clauses.append(column.startswith(str(value), autoescape=True))
+        else:
+            typed = _coerce(column, value, field)
+            clauses.append({
+                "eq": column.__eq__,
+                "gt": column.__gt__,
+                "gte": column.__ge__,
+                "lt": column.__lt__,
+                "lte": column.__le__,
+            }[op](typed))
+
+    return clauses
+
+
+def _coerce_bool(value: Any, field: str) -> bool:
+    """Привести значение is_null к bool."""
+    if isinstance(value, bool):
+        return value
+    if str(value).lower() in {"true", "1"}:
+        return True
+    if str(value).lower() in {"false", "0"}:
+        return False
+    raise InvalidInputError(f"Фильтр {field}__is_null: true или false", field=field)
+
+
+def build_order_by(
+    model: type,
+    sort_by: str | None,
+    sort_order: str,
+    allowed_fields: frozenset[str],
+) -> list[ColumnElement[Any]]:
+    """
+    Построить ORDER BY со стабильным порядком (id как tie-breaker).
+
+    Args:
+        model: SQLAlchemy модель.
+        sort_by: Колонка сортировки (None — только по id).
+        sort_order: "asc" или "desc".
+        allowed_fields: Whitelist колонок для сортировки.
+
+    Returns:
+        Выражения для query.order_by(*clauses).
+
+    Raises:
+        InvalidInputError: Колонка не в whitelist или неверный порядок.
+    """
+    if sort_order not in {"asc", "desc"}:
+        raise InvalidInputError("sort_order: asc или desc", field="sort_order")
+
+    primary_key = inspect(model).primary_key[0]
+    if sort_by is None:
+        return [primary_key.desc() if sort_order == "desc" else primary_key.asc()]
+
+    if sort_by not in allowed_fields:
+        raise InvalidInputError(
+            f"Сортировка по полю {sort_by} не разрешена",
+            field="sort_by",
+        )
+
+    column = getattr(model, sort_by)
+    if sort_order == "desc":
+        return [column.desc(), primary_key.desc()]
+    return [column.asc(), primary_key.asc()]
@@ -0,0 +1,176 @@
+"""
+План медленных запросов.
+
+Для slow_query_detected:
+- SQL запроса без значений параметров (только плейсхолдеры)
+- EXPLAIN (FORMAT JSON) в фоне — без ANALYZE, запрос не выполняется;
+  в лог попадает сводка плана (seq scan, оценка строк, стоимость),
+  по которой видно недостающие индексы.
+"""
+
+import asyncio
+import time
+from typing import Any, Coroutine
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql import ClauseElement
+
+from shared.utils.json_codec import json_loads
+
+
+# Максимальная длина SQL в логе
+MAX_SQL_LENGTH = 2000
+
+# Максимум отслеживаемых запросов в ExplainThrottle
+MAX_TRACKED_STATEMENTS = 1000
+
+# Фоновые задачи EXPLAIN (сильные ссылки, иначе задачу может собрать GC)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def compile_redacted(
+    statement: ClauseElement,
+    dialect: Dialect | None = None,
+) -> tuple[str, int]:
+    """
+    Скомпилировать запрос в SQL без значений параметров.
+
+    Значения не подставляются (в логе только плейсхолдеры), поэтому
+    персональные данные из условий WHERE не попадают в логи.
+
+    Args:
+        statement: SQLAlchemy запрос.
+        dialect: Диалект (по умолчанию PostgreSQL).
+
+    Returns:
+        Tuple (SQL, количество параметров).
+    """
+    compiled = statement.compile(dialect=dialect or postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    if len(sql) > MAX_SQL_LENGTH:
+        sql = sql[:MAX_SQL_LENGTH] + "..."
+    return sql, len(compiled.params)
+
+
+def summarize_plan(plan: Any) -> dict[str, Any]:
+    """
+    Получить сводку плана EXPLAIN (FORMAT JSON).
+
+    Args:
+        plan: Результат EXPLAIN — JSON строка или распарсенный список.
+
+    Returns:
+        Словарь с root_node, estimated_rows, total_cost, seq_scans, index_scans.
+    """
+    if isinstance(plan, (str, bytes)):
+        plan = json_loads(plan)
+    root = plan[0]["Plan"]
+
+    seq_scans: list[str] = []
+    index_scans: list[str] = []
+    nodes = [root]
+    while nodes:
+        node = nodes.pop()
+        node_type = node.get("Node Type", "")
+        if node_type == "Seq Scan":
+            seq_scans.append(node.get("Relation Name", "?"))
+        elif "Index Name" in node:
+            index_scans.append(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+
+    return {
+        "root_node": root.get("Node Type"),
+        "estimated_rows": root.get("Plan Rows"),
+        "total_cost": root.get("Total Cost"),
+        "seq_scans": seq_scans,
+        "index_scans": index_scans,
+    }
+
+
+async def explain_statement(
+    engine: AsyncEngine,
+    statement: ClauseElement,
+) -> dict[str, Any]:
+    """
+    Выполнить EXPLAIN (FORMAT JSON) на отдельном соединении.
+
+    Соединение сессии запроса не используется — EXPLAIN не мешает
+    транзакции и может завершиться после ответа клиенту.
+
+    Args:
+        engine: Async engine.
+        statement: SQLAlchemy запрос.
+
+    Returns:
+        Сводка плана (см. summarize_plan).
+    """
+    compiled = statement.compile(
+        dialect=engine.dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    params: Any = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+
+    async with engine.connect() as connection:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (ANALYZE false, FORMAT JSON) {compiled}",
+            params,
+        )
+        return summarize_plan(result.scalar_one())
+
+
+class ExplainThrottle:
+    """
+    Ограничение частоты EXPLAIN для одного и того же SQL.
+
+    Медленный запрос обычно повторяется — план достаточно
+    снимать раз в interval_seconds.
+
+    Attributes:
+        interval_seconds: Минимальный интервал между EXPLAIN одного SQL.
+    """
+
+    def __init__(self, interval_seconds: float = 300.0) -> None:
+        """
+        Инициализировать ограничитель.
+
+        Args:
+            interval_seconds: Минимальный интервал между EXPLAIN одного SQL.
+        """
+        self.interval_seconds = interval_seconds
+        self._last_explained: dict[str, float] = {}
+
+    def should_explain(self, sql: str) -> bool:
+        """
+        Проверить, пора ли снимать план для SQL (и отметить попытку).
+
+        Args:
+            sql: SQL запроса (из compile_redacted).
+
+        Returns:
+            True если план нужно снять.
+        """
+        now = time.monotonic()
+        last = self._last_explained.get(sql)
+        if last is not None and now - last < self.interval_seconds:
+            return False
+
+        if len(self._last_explained) >= MAX_TRACKED_STATEMENTS:
+            self._last_explained.clear()
+        self._last_explained[sql] = now
+        return True
+
+
+def run_in_background(coroutine: Coroutine[Any, Any, None]) -> None:
+    """
+    Запустить корутину в фоне, не дожидаясь результата.
+
+    Args:
+        coroutine: Корутина.
+    """
+    task = asyncio.get_running_loop().create_task(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
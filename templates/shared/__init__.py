@@ -6,4 +6,5 @@
 - schemas/ — Pydantic схемы
 - http_clients/ — HTTP клиенты
 - testing/ — тестовые утилиты
+- benchmarks/ — микробенчмарки (python -m shared.benchmarks.<name>)
 """
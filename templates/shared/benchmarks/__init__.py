@@ -0,0 +1,9 @@
+"""
+Микробенчмарки общих компонентов.
+
+Запуск из каталога с пакетом shared:
+    python -m shared.benchmarks.bench_json_serialization
+    python -m shared.benchmarks.bench_log_helpers
+    python -m shared.benchmarks.bench_log_sanitizer
+    python -m shared.benchmarks.bench_logging_profiles
+"""
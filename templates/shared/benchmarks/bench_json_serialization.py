@@ -0,0 +1,150 @@
+"""
+Бенчмарк сериализации PaginatedResponse.
+
+Сравнивает стоимость рендеринга ответа из 1000 элементов:
+- stdlib — путь FastAPI по умолчанию (model_dump + JSONResponse.render)
+- fast — model_dump + FastJSONResponse (orjson/msgspec, если установлены)
+- pydantic — model_dump_json (справочно, сериализация в Rust без dict)
+
+и разбора того же ответа клиентом (response.json() против json_loads).
+
+Запуск:
+    python -m shared.benchmarks.bench_json_serialization [--items 1000] [--rounds 200]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from shared.schemas.base import BaseResponseSchema
+from shared.schemas.pagination import PaginatedResponse
+from shared.utils.json_codec import get_json_backend, json_dumps, json_loads
+
+
+class BenchItem(BaseResponseSchema):
+    """Типичная сущность ответа Data API."""
+
+    id: UUID
+    name: str
+    email: str
+    price: Decimal
+    is_active: bool
+    tags: list[str]
+    created_at: datetime
+    updated_at: datetime
+
+
+def build_response(items: int) -> PaginatedResponse[BenchItem]:
+    """
+    Построить пагинированный ответ.
+
+    Args:
+        items: Количество элементов.
+
+    Returns:
+        PaginatedResponse с items элементами.
+    """
+    now = datetime.now(timezone.utc)
+    return PaginatedResponse[BenchItem].create(
+        items=[
+            BenchItem(
+                id=uuid4(),
+                name=f"Пользователь {i}",
+                email=f"user{i}@example.com",
+                price=Decimal("1999.90"),
+                is_active=i % 2 == 0,
+                tags=["alpha", "beta", "gamma"],
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(items)
+        ],
+        page=1,
+        page_size=items,
+        total_items=items * 10,
+    )
+
+
+def stdlib_render(content: Any) -> bytes:
+    """Рендеринг как в starlette.responses.JSONResponse."""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def measure(func: Callable[[], Any], rounds: int) -> float:
+    """
+    Измерить среднее время вызова.
+
+    Args:
+        func: Измеряемая функция.
+        rounds: Количество повторов.
+
+    Returns:
+        Среднее время в миллисекундах.
+    """
+    func()  # прогрев
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def main() -> None:
+    """Запустить бенчмарк и вывести таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    response = build_response(args.items)
+    content = response.model_dump(mode="json", by_alias=True)
+    body = stdlib_render(content)
+
+    results = {
+        "encode: model_dump + stdlib json (before)": measure(
+            lambda: stdlib_render(response.model_dump(mode="json", by_alias=True)),
+            args.rounds,
+        ),
+        f"encode: model_dump + {get_json_backend()} (after)": measure(
+            lambda: json_dumps(response.model_dump(mode="json", by_alias=True)),
+            args.rounds,
+        ),
+        "encode: render only, stdlib json": measure(
+            lambda: stdlib_render(content),
+            args.rounds,
+        ),
+        f"encode: render only, {get_json_backend()}": measure(
+            lambda: json_dumps(content),
+            args.rounds,
+        ),
+        "encode: pydantic model_dump_json": measure(
+            lambda: response.model_dump_json(by_alias=True),
+            args.rounds,
+        ),
+        "decode: stdlib json.loads (before)": measure(
+            lambda: json.loads(body),
+            args.rounds,
+        ),
+        f"decode: {get_json_backend()} json_loads (after)": measure(
+            lambda: json_loads(body),
+            args.rounds,
+        ),
+    }
+
+    print(f"PaginatedResponse: {args.items} items, {len(body)} bytes, {args.rounds} rounds")
+    width = max(len(name) for name in results)
+    for name, duration_ms in results.items():
+        print(f"{name:<{width}}  {duration_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Бенчмарк хелперов log_helpers при выключенном уровне.
+
+Измеряет стоимость вызова DEBUG-хелперов (log_db_operation,
+log_auth_context) в production-конфигурации (минимальный уровень INFO)
+и, для сравнения, INFO-хелпера log_state_change, который выводится.
+
+Хелперы сравнивают уровень с минимальным из setup_logging
+(set_min_log_level) до построения полей, поэтому выключенный вызов
+стоит только передачи аргументов.
+
+Вывод не пишется в stdout (ReturnLoggerFactory).
+
+Запуск:
+    python -m shared.benchmarks.bench_log_helpers [--events 200000]
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable
+
+import structlog
+
+from shared.utils.log_helpers import (
+    log_auth_context,
+    log_db_operation,
+    log_state_change,
+    set_min_log_level,
+)
+
+
+def measure(call: Callable[[], None], events: int) -> float:
+    """
+    Измерить пропускную способность вызова.
+
+    Args:
+        call: Вызов хелпера.
+        events: Количество вызовов.
+
+    Returns:
+        Вызовов в секунду.
+    """
+    call()  # прогрев и кэширование logger
+    start = time.perf_counter()
+    for _ in range(events):
+        call()
+    return events / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Запустить бенчмарк и вывести таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    structlog.configure(
+        processors=[structlog.processors.JSONRenderer()],
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        context_class=dict,
+        logger_factory=structlog.ReturnLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    set_min_log_level(logging.INFO)
+    logger = structlog.get_logger()
+
+    results = {
+        "log_db_operation (DEBUG, off)": measure(
+            lambda: log_db_operation(
+                logger,
+                operation="get_all",
+                table="orders",
+                query_type="SELECT",
+                duration_ms=3.21,
+                affected_rows=20,
+                offset=0,
+                limit=20,
+            ),
+            args.events,
+        ),
+        "log_auth_context (DEBUG, off)": measure(
+            lambda: log_auth_context(
+                logger,
+                user_id="42",
+                roles=["admin"],
+                auth_method="jwt",
+            ),
+            args.events,
+        ),
+        "log_state_change (INFO, on)": measure(
+            lambda: log_state_change(
+                logger,
+                entity_type="Order",
+                entity_id="42",
+                from_state="PENDING",
+                to_state="CONFIRMED",
+                transition_reason="payment_received",
+            ),
+            args.events,
+        ),
+    }
+
+    print(f"log_helpers при уровне INFO: {args.events} calls")
+    width = max(len(name) for name in results)
+    for name, calls_per_second in results.items():
+        print(f"{name:<{width}}  {calls_per_second:12,.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Бенчмарк профилей логирования dev и prod.
+
+Сравнивает стоимость одного вызова logger.info(...) через полную
+цепочку процессоров build_processors (JSON renderer):
+- dev — TimeStamper(fmt="iso") и CallsiteParameterAdder (инспекция стека)
+- prod — CachedTimeStamper, без инспекции стека
+
+Вывод не пишется в stdout (ReturnLoggerFactory) — измеряются только
+процессоры и рендеринг.
+
+Запуск:
+    python -m shared.benchmarks.bench_logging_profiles [--events 50000]
+"""
+
+import argparse
+import logging
+import time
+
+import structlog
+
+from shared.utils.logger import LogProfile, build_processors
+
+
+def configure(profile: LogProfile) -> None:
+    """
+    Настроить structlog на профиль без вывода.
+
+    Args:
+        profile: Профиль логирования.
+    """
+    structlog.configure(
+        processors=build_processors(json_logs=True, profile=profile),
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        context_class=dict,
+        logger_factory=structlog.ReturnLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+
+def measure(profile: LogProfile, events: int) -> float:
+    """
+    Измерить пропускную способность профиля.
+
+    Args:
+        profile: Профиль логирования.
+        events: Количество событий.
+
+    Returns:
+        Событий в секунду.
+    """
+    configure(profile)
+    logger = structlog.get_logger()
+
+    def log_once() -> None:
+        logger.info(
+            "db_operation",
+            operation="get_all",
+            table="orders",
+            query_type="SELECT",
+            duration_ms=3.21,
+            affected_rows=20,
+        )
+
+    log_once()  # прогрев и кэширование logger
+    start = time.perf_counter()
+    for _ in range(events):
+        log_once()
+    return events / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Запустить бенчмарк и вывести таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=50_000)
+    args = parser.parse_args()
+
+    structlog.contextvars.bind_contextvars(
+        service="orders_api",
+        request_id="req-7f3c2a9e-2b41-4c1d-9a6e-0f5b8d2c1e47",
+    )
+    results = {
+        "dev (callsite + iso timestamp)": measure("dev", args.events),
+        "prod (cached timestamp)": measure("prod", args.events),
+    }
+    structlog.contextvars.clear_contextvars()
+
+    print(f"logger.info через build_processors(json_logs=True): {args.events} events")
+    width = max(len(name) for name in results)
+    for name, events_per_second in results.items():
+        print(f"{name:<{width}}  {events_per_second:12,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
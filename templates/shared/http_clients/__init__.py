@@ -5,9 +5,36 @@ HTTP клиенты.
 """
 
 from .base_client import BaseHTTPClient
-from .data_api_client import DataAPIClient
+from .data_api_client import DataAPIClient, normalize_entity_id
+from .data_loader import DataLoader
+from .resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    configure_resilience,
+    decorrelated_jitter,
+    get_circuit_breaker,
+    get_retry_budget,
+)
+from .response_cache import (
+    ResponseCache,
+    InMemoryResponseCache,
+    RedisResponseCache,
+)
+from .single_flight import SingleFlight
 
 __all__ = [
     "BaseHTTPClient",
     "DataAPIClient",
+    "normalize_entity_id",
+    "DataLoader",
+    "CircuitBreaker",
+    "RetryBudget",
+    "configure_resilience",
+    "decorrelated_jitter",
+    "get_circuit_breaker",
+    "get_retry_budget",
+    "ResponseCache",
+    "InMemoryResponseCache",
+    "RedisResponseCache",
+    "SingleFlight",
 ]
@@ -5,12 +5,20 @@
 """
 
 import asyncio
-from typing import Any, TypeVar
+import uuid
+from typing import Any, AsyncIterator, TypeVar
 from urllib.parse import urljoin
 
 import httpx
 import structlog
 
+from ..utils.json_codec import json_loads
+from ..utils.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENT_METHODS,
+    is_read_only_request,
+)
+from ..utils.streaming import NDJSON_MEDIA_TYPE
 from ..utils.request_id import (
     REQUEST_ID_HEADER,
     get_or_create_request_id,
@@ -21,6 +29,14 @@ from ..utils.exceptions import (
     TimeoutError as AppTimeoutError,
     NotFoundError,
 )
+from .resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    decorrelated_jitter,
+    get_circuit_breaker,
+    get_retry_budget,
+)
+from .single_flight import SingleFlight
 
 
 logger = structlog.get_logger(__name__)
@@ -34,9 +50,19 @@ class BaseHTTPClient:
 
     Особенности:
         - Автоматическая передача request_id.
-        - Retry логика с экспоненциальной задержкой.
+        - Retry логика с decorrelated jitter и бюджетом повторов.
+        - Повтор только идемпотентных запросов (GET/PUT/DELETE...),
+          POST-чтения (/batch, /search) или запросов с Idempotency-Key
+          (auto_idempotency_key=True — только для сервисов с
+          IdempotencyMiddleware и общим хранилищем ключей).
+        - Ответ 409 "ещё выполняется" на повтор с ключом — ожидание
+          и повтор, а не ошибка вызывающему.
+        - Circuit breaker на сервис (fail fast при отказе зависимости).
         - Стандартизированная обработка ошибок.
+        - Разбор JSON через orjson/msgspec, если установлены.
         - Логирование запросов и ответов.
+        - Опциональное объединение одинаковых конкурентных GET
+          (single-flight, coalesce_requests=True).
 
     Использование:
         ```python
@@ -60,6 +86,11 @@ class BaseHTTPClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         headers: dict[str, str] | None = None,
+        coalesce_requests: bool = False,
+        retry_max_delay: float = 10.0,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
+        auto_idempotency_key: bool = False,
     ) -> None:
         """
         Инициализировать клиент.
@@ -71,14 +102,31 @@ class BaseHTTPClient:
             max_retries: Максимальное количество повторных попыток.
             retry_delay: Начальная задержка между попытками.
             headers: Дополнительные заголовки.
+            coalesce_requests: Объединять одинаковые конкурентные GET
+                (method, path, params) в один запрос.
+            retry_max_delay: Максимальная задержка между попытками.
+            circuit_breaker: Breaker (по умолчанию общий для service_name).
+            retry_budget: Бюджет повторов (по умолчанию общий для service_name).
+            auto_idempotency_key: Добавлять Idempotency-Key к POST/PATCH
+                (кроме POST-чтения) и повторять их при таймаутах. Включать
+                только для сервиса, который дедуплицирует ключи
+                (IdempotencyMiddleware с хранилищем, общим для реплик) —
+                иначе повтор дублирует запись.
         """
         self.base_url = base_url.rstrip("/")
         self.service_name = service_name
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(service_name)
+        self.retry_budget = retry_budget or get_retry_budget(service_name)
+        self.auto_idempotency_key = auto_idempotency_key
         self._default_headers = headers or {}
         self._client: httpx.AsyncClient | None = None
+        self._single_flight: SingleFlight | None = (
+            SingleFlight() if coalesce_requests else None
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
         """
@@ -142,15 +190,40 @@ class BaseHTTPClient:
             HTTP ответ.
 
         Raises:
-            ServiceUnavailableError: Сервис недоступен.
+            ServiceUnavailableError: Сервис недоступен или breaker открыт.
             AppTimeoutError: Превышен таймаут.
             ExternalServiceError: Другая ошибка сервиса.
         """
+        # Fail fast: не занимаем event loop ожиданием недоступного сервиса
+        if not self.circuit_breaker.allow_request():
+            logger.warning(
+                "circuit_breaker_rejected",
+                service=self.service_name,
+                method=method,
+                path=path,
+                state=self.circuit_breaker.state,
+            )
+            raise ServiceUnavailableError(
+                service=self.service_name,
+                details={"circuit_breaker": self.circuit_breaker.state},
+            )
+
         client = await self._get_client()
 
         # Добавляем заголовки
         headers = self._build_headers(kwargs.pop("headers", None))
 
+        # Неидемпотентный запрос безопасно повторять только с ключом;
+        # POST-чтение (/batch) повторяется без ключа — сервер не хранит ответ
+        safe_to_repeat = method.upper() in IDEMPOTENT_METHODS or is_read_only_request(method, path)
+        has_idempotency_key = any(
+            name.lower() == IDEMPOTENCY_KEY_HEADER.lower() for name in headers
+        )
+        if not safe_to_repeat and self.auto_idempotency_key and not has_idempotency_key:
+            headers[IDEMPOTENCY_KEY_HEADER] = str(uuid.uuid4())
+            has_idempotency_key = True
+        retryable = safe_to_repeat or has_idempotency_key
+
         # Логируем запрос
         log = logger.bind(
             service=self.service_name,
@@ -160,8 +233,12 @@ class BaseHTTPClient:
         )
 
         last_exception: Exception | None = None
+        delay = self.retry_delay
+        attempts = 0
+        self.retry_budget.record_request()
 
         for attempt in range(self.max_retries):
+            attempts = attempt + 1
             try:
                 log.debug(
                     "HTTP запрос",
@@ -182,6 +259,25 @@ class BaseHTTPClient:
                     elapsed_ms=response.elapsed.total_seconds() * 1000,
                 )
 
+                # Первый запрос с этим ключом ещё выполняется на сервере:
+                # ждём и повторяем — ответ будет воспроизведён из хранилища
+                if (
+                    response.status_code == 409
+                    and has_idempotency_key
+                    and "retry-after" in response.headers
+                    and attempt < self.max_retries - 1
+                ):
+                    log.info("idempotent_request_in_progress_wait", attempt=attempt + 1)
+                    await asyncio.sleep(self._retry_after_seconds(response))
+                    continue
+
+                # 5xx — признак деградации зависимости для breaker
+                # (ответ не повторяется — одна ошибка на запрос)
+                if response.status_code >= 500:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+
                 return response
 
             except httpx.TimeoutException as e:
@@ -208,15 +304,37 @@ class BaseHTTPClient:
                     error=str(e),
                 )
 
-            # Экспоненциальная задержка перед следующей попыткой
-            if attempt < self.max_retries - 1:
-                delay = self.retry_delay * (2 ** attempt)
-                await asyncio.sleep(delay)
+            if attempt >= self.max_retries - 1:
+                break
+
+            # Без ключа повторяем только если запрос не дошёл до сервера
+            if not retryable and not isinstance(
+                last_exception, (httpx.ConnectError, httpx.ConnectTimeout)
+            ):
+                log.warning("retry_skipped_non_idempotent", attempt=attempt + 1)
+                break
+
+            # Повтор только если breaker не открылся и бюджет не исчерпан
+            if not self.circuit_breaker.allow_request():
+                break
+            if not self.retry_budget.try_acquire():
+                log.warning(
+                    "retry_budget_exhausted",
+                    attempt=attempt + 1,
+                    tokens=round(self.retry_budget.tokens, 2),
+                )
+                break
+
+            delay = decorrelated_jitter(self.retry_delay, self.retry_max_delay, delay)
+            await asyncio.sleep(delay)
 
-        # Все попытки исчерпаны
+        # Все попытки исчерпаны: одна ошибка breaker на логический запрос,
+        # а не на каждую попытку (иначе порог достигается за пару вызовов)
+        self.circuit_breaker.record_failure()
         log.error(
             "Все попытки запроса исчерпаны",
-            total_attempts=self.max_retries,
+            total_attempts=attempts,
+            circuit_breaker=self.circuit_breaker.state,
         )
 
         if isinstance(last_exception, httpx.TimeoutException):
@@ -232,6 +350,22 @@ class BaseHTTPClient:
                 original_error=last_exception,
             )
 
+    def _retry_after_seconds(self, response: httpx.Response) -> float:
+        """
+        Получить задержку из заголовка Retry-After.
+
+        Args:
+            response: HTTP ответ.
+
+        Returns:
+            Задержка в секундах (не больше retry_max_delay).
+        """
+        try:
+            delay = float(response.headers["retry-after"])
+        except (KeyError, ValueError):
+            delay = self.retry_delay
+        return min(max(delay, 0.0), self.retry_max_delay)
+
     def _handle_error_response(self, response: httpx.Response) -> None:
         """
         Обработать ошибочный ответ.
@@ -278,6 +412,48 @@ class BaseHTTPClient:
         """
         Выполнить GET запрос.
 
+        Args:
+            path: Путь.
+            params: Query параметры.
+            **kwargs: Дополнительные параметры.
+
+        Returns:
+            JSON ответ.
+
+        Note:
+            При coalesce_requests=True конкурентные вызовы с одинаковыми
+            path/params без дополнительных kwargs получают общий результат —
+            его нельзя изменять на месте.
+        """
+        if self._single_flight is None or kwargs:
+            return await self._fetch_json(path, params, **kwargs)
+
+        key = SingleFlight.make_key("GET", path, params)
+        result, shared = await self._single_flight.do(
+            key,
+            lambda: self._fetch_json(path, params),
+        )
+
+        if shared:
+            logger.debug(
+                "http_request_coalesced",
+                service=self.service_name,
+                method="GET",
+                path=path,
+                **self._single_flight.stats,
+            )
+
+        return result
+
+    async def _fetch_json(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Выполнить GET запрос и разобрать JSON ответ.
+
         Args:
             path: Путь.
             params: Query параметры.
@@ -291,7 +467,20 @@ class BaseHTTPClient:
         if not response.is_success:
             self._handle_error_response(response)
 
-        return response.json()
+        return json_loads(response.content)
+
+    @property
+    def coalescing_stats(self) -> dict[str, int]:
+        """
+        Статистика объединения запросов.
+
+        Returns:
+            Счётчики executed/coalesced/in_flight (пустой словарь,
+            если объединение выключено).
+        """
+        if self._single_flight is None:
+            return {}
+        return self._single_flight.stats
 
     async def _post(
         self,
@@ -315,7 +504,7 @@ class BaseHTTPClient:
         if not response.is_success:
             self._handle_error_response(response)
 
-        return response.json()
+        return json_loads(response.content)
 
     async def _put(
         self,
@@ -339,7 +528,7 @@ class BaseHTTPClient:
         if not response.is_success:
             self._handle_error_response(response)
 
-        return response.json()
+        return json_loads(response.content)
 
     async def _patch(
         self,
@@ -363,7 +552,7 @@ class BaseHTTPClient:
         if not response.is_success:
             self._handle_error_response(response)
 
-        return response.json()
+        return json_loads(response.content)
 
     async def _delete(
         self,
@@ -388,7 +577,72 @@ class BaseHTTPClient:
         if response.status_code == 204:
             return None
 
-        return response.json()
+        return json_loads(response.content)
+
+    async def _stream_lines(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Выполнить GET и читать ответ построчно по мере поступления.
+
+        Тело не буферизуется целиком — память постоянна для ответа
+        любого размера (NDJSON выгрузки).
+
+        Args:
+            path: Путь.
+            params: Query параметры.
+
+        Yields:
+            Непустые строки ответа.
+
+        Raises:
+            ServiceUnavailableError: Сервис недоступен или breaker открыт.
+            AppTimeoutError: Превышен таймаут чтения.
+
+        Note:
+            Без retry: оборванный поток нельзя продолжить с середины,
+            повтор — ответственность вызывающего.
+        """
+        if not self.circuit_breaker.allow_request():
+            raise ServiceUnavailableError(
+                service=self.service_name,
+                details={"circuit_breaker": self.circuit_breaker.state},
+            )
+
+        client = await self._get_client()
+        headers = self._build_headers({"Accept": NDJSON_MEDIA_TYPE})
+
+        try:
+            async with client.stream(
+                "GET",
+                path,
+                params=params,
+                headers=headers,
+            ) as response:
+                if response.status_code >= 500:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+
+                if not response.is_success:
+                    await response.aread()
+                    self._handle_error_response(response)
+
+                async for line in response.aiter_lines():
+                    if line:
+                        yield line
+
+        except httpx.TimeoutException:
+            self.circuit_breaker.record_failure()
+            raise AppTimeoutError(
+                service=self.service_name,
+                timeout_seconds=self.timeout,
+            )
+        except httpx.ConnectError:
+            self.circuit_breaker.record_failure()
+            raise ServiceUnavailableError(service=self.service_name)
 
     # === Health check ===
 
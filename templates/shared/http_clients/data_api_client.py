@@ -4,12 +4,18 @@
 HTTP клиент для взаимодействия с Data API сервисами.
 """
 
-from typing import Any, TypeVar
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
 from uuid import UUID
 
 import structlog
 
 from .base_client import BaseHTTPClient
+from .data_loader import DEFAULT_MAX_BATCH_SIZE, DataLoader
+from .response_cache import ResponseCache
+from ..utils.exceptions import NotFoundError
+from ..utils.json_codec import json_loads
 from ..utils.pagination import (
     PaginationParams,
     PaginatedResult,
@@ -22,6 +28,36 @@ logger = structlog.get_logger(__name__)
 T = TypeVar("T")
 
 
+def normalize_entity_id(entity_id: Any) -> str:
+    """
+    Привести идентификатор к каноническому строковому виду.
+
+    UUID в любом регистре/формате → str(UUID) (нижний регистр, с дефисами),
+    ObjectId (24 hex) → нижний регистр, остальные → str как есть.
+    Нужен, чтобы сопоставлять запрошенные ID с ID из ответа Data API.
+
+    Args:
+        entity_id: Идентификатор (UUID, str, int).
+
+    Returns:
+        Нормализованный идентификатор.
+    """
+    if isinstance(entity_id, UUID):
+        return str(entity_id)
+    value = str(entity_id).strip()
+    try:
+        return str(UUID(value))
+    except ValueError:
+        pass
+    if len(value) == 24:
+        try:
+            int(value, 16)
+            return value.lower()
+        except ValueError:
+            pass
+    return value
+
+
 class DataAPIClient(BaseHTTPClient):
     """
     Клиент для Data API сервиса.
@@ -41,9 +77,36 @@ class DataAPIClient(BaseHTTPClient):
         # CRUD операции
         user = await client.get_by_id(user_id)
         users = await client.get_list(page=1, page_size=20)
+        names = await client.get_list(fields=["id", "name"])  # проекция
         created = await client.create({"name": "John", "email": "john@example.com"})
         updated = await client.update(user_id, {"name": "John Doe"})
         await client.delete(user_id)
+
+        # Read-through кэш чтений (инвалидируется записями той же сущности)
+        cached_client = DataAPIClient(
+            base_url="http://users-data:8001",
+            service_name="users-data",
+            entity_name="users",
+            cache=InMemoryResponseCache(max_entries=2048),
+            cache_ttl=300.0,
+        )
+
+        # Автоматический батчинг: N параллельных get_by_id → один POST /batch
+        batching_client = DataAPIClient(
+            base_url="http://users-data:8001",
+            service_name="users-data",
+            entity_name="users",
+            batch_get_by_id=True,
+        )
+        users = await asyncio.gather(*(batching_client.get_by_id(i) for i in ids))
+
+        # Обход всех страниц (следующая страница загружается заранее)
+        async for user in client.iter_all(page_size=500):
+            await process(user)
+
+        # Потоковая выгрузка NDJSON (GET /export), постоянная память
+        async for user in client.iter_export():
+            await process(user)
         ```
     """
 
@@ -53,6 +116,10 @@ class DataAPIClient(BaseHTTPClient):
         service_name: str,
         entity_name: str,
         api_version: str = "v1",
+        cache: ResponseCache | None = None,
+        cache_ttl: float = 60.0,
+        batch_get_by_id: bool = False,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
         **kwargs: Any,
     ) -> None:
         """
@@ -63,12 +130,120 @@ class DataAPIClient(BaseHTTPClient):
             service_name: Название сервиса для логов.
             entity_name: Название сущности (например, "users").
             api_version: Версия API (по умолчанию "v1").
+            cache: Кэш ответов для get_by_id/get_list/count/search
+                (None — без кэширования).
+            cache_ttl: TTL кэша для этой сущности в секундах.
+            batch_get_by_id: Объединять get_by_id одного такта event loop
+                в один вызов get_by_ids (DataLoader).
+            max_batch_size: Максимальный размер batch-запроса.
             **kwargs: Дополнительные параметры для BaseHTTPClient.
         """
         super().__init__(base_url, service_name, **kwargs)
         self.entity_name = entity_name
         self.api_version = api_version
         self._base_path = f"/api/{api_version}/{entity_name}"
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self._cache_prefix = f"{service_name}:{entity_name}:"
+        self.max_batch_size = max_batch_size
+        self._loader: DataLoader[str, dict[str, Any]] | None = (
+            self.create_loader() if batch_get_by_id else None
+        )
+
+    # === Батчинг ===
+
+    def create_loader(self) -> DataLoader[str, dict[str, Any]]:
+        """
+        Создать DataLoader поверх get_by_ids.
+
+        Для явного per-request использования (например, в FastAPI
+        dependency), когда batch_get_by_id выключен.
+
+        Returns:
+            DataLoader, разрешающий ID в данные сущности.
+        """
+        return DataLoader(self._load_batch, max_batch_size=self.max_batch_size)
+
+    async def _load_batch(
+        self,
+        entity_ids: list[str],
+    ) -> list[dict[str, Any] | Exception]:
+        """
+        Загрузить батч сущностей для DataLoader.
+
+        Args:
+            entity_ids: Идентификаторы (уникальные).
+
+        Returns:
+            Данные сущностей в порядке entity_ids; NotFoundError
+            для отсутствующих.
+        """
+        items = await self.get_by_ids(entity_ids)
+        by_id = {normalize_entity_id(item.get("id")): item for item in items}
+
+        logger.debug(
+            "data_loader_batch",
+            service=self.service_name,
+            entity=self.entity_name,
+            requested=len(entity_ids),
+            found=len(by_id),
+        )
+
+        return [
+            by_id.get(normalize_entity_id(entity_id))
+            or NotFoundError(entity=self.entity_name, identifier=entity_id)
+            for entity_id in entity_ids
+        ]
+
+    # === Кэширование ===
+
+    async def _cached_get(
+        self,
+        operation: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """
+        Выполнить GET через read-through кэш.
+
+        Args:
+            operation: Название операции (часть ключа кэша).
+            path: Путь.
+            params: Query параметры.
+
+        Returns:
+            JSON ответ (из кэша или сети).
+        """
+        if self.cache is None:
+            return await self._get(path, params=params)
+
+        key = (
+            f"{self._cache_prefix}{operation}:{path}:"
+            f"{json.dumps(params or {}, sort_keys=True, default=str)}"
+        )
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Поколение до запроса: если запись сущности инвалидирует кэш,
+        # пока ответ в пути, устаревший ответ не будет сохранён
+        generation = await self.cache.get_generation(self._cache_prefix)
+        response = await self._get(path, params=params)
+        await self.cache.set(key, response, self.cache_ttl, generation=generation)
+        return response
+
+    async def _invalidate_cache(self) -> None:
+        """Сбросить кэш чтений этой сущности после записи."""
+        if self.cache is None:
+            return
+
+        await self.cache.invalidate_prefix(self._cache_prefix)
+        logger.debug(
+            "http_cache_invalidated",
+            service=self.service_name,
+            entity=self.entity_name,
+            **self.cache.stats,
+        )
 
     # === CRUD операции ===
 
@@ -84,8 +259,18 @@ class DataAPIClient(BaseHTTPClient):
 
         Raises:
             NotFoundError: Сущность не найдена.
+
+        Note:
+            При batch_get_by_id=True вызов идёт через DataLoader
+            (минуя кэш ответов).
         """
-        return await self._get(f"{self._base_path}/{entity_id}")
+        if self._loader is not None:
+            return await self._loader.load(normalize_entity_id(entity_id))
+
+        return await self._cached_get(
+            "get_by_id",
+            f"{self._base_path}/{entity_id}",
+        )
 
     async def get_list(
         self,
@@ -94,6 +279,7 @@ class DataAPIClient(BaseHTTPClient):
         filters: dict[str, Any] | None = None,
         sort_by: str | None = None,
         sort_order: str = "asc",
+        fields: list[str] | None = None,
     ) -> PaginatedResult[dict[str, Any]]:
         """
         Получить список сущностей с пагинацией.
@@ -104,6 +290,7 @@ class DataAPIClient(BaseHTTPClient):
             filters: Фильтры (передаются как query параметры).
             sort_by: Поле для сортировки.
             sort_order: Порядок сортировки ("asc" или "desc").
+            fields: Проекция — вернуть только эти поля (и id).
 
         Returns:
             Пагинированный результат.
@@ -120,7 +307,10 @@ class DataAPIClient(BaseHTTPClient):
             params["sort_by"] = sort_by
             params["sort_order"] = sort_order
 
-        response = await self._get(self._base_path, params=params)
+        if fields:
+            params["fields"] = ",".join(fields)
+
+        response = await self._cached_get("get_list", self._base_path, params)
 
         # Парсим пагинированный ответ
         items = response.get("items", [])
@@ -133,6 +323,7 @@ class DataAPIClient(BaseHTTPClient):
             total_pages=pagination.get("total_pages", 1),
             has_next=pagination.get("has_next", False),
             has_prev=pagination.get("has_prev", False),
+            is_approximate=pagination.get("is_approximate", False),
         )
 
         return PaginatedResult(items=items, meta=meta)
@@ -147,7 +338,9 @@ class DataAPIClient(BaseHTTPClient):
         Returns:
             Созданная сущность.
         """
-        return await self._post(self._base_path, data=data)
+        result = await self._post(self._base_path, data=data)
+        await self._invalidate_cache()
+        return result
 
     async def update(
         self,
@@ -167,7 +360,9 @@ class DataAPIClient(BaseHTTPClient):
         Raises:
             NotFoundError: Сущность не найдена.
         """
-        return await self._put(f"{self._base_path}/{entity_id}", data=data)
+        result = await self._put(f"{self._base_path}/{entity_id}", data=data)
+        await self._invalidate_cache()
+        return result
 
     async def partial_update(
         self,
@@ -187,7 +382,9 @@ class DataAPIClient(BaseHTTPClient):
         Raises:
             NotFoundError: Сущность не найдена.
         """
-        return await self._patch(f"{self._base_path}/{entity_id}", data=data)
+        result = await self._patch(f"{self._base_path}/{entity_id}", data=data)
+        await self._invalidate_cache()
+        return result
 
     async def delete(self, entity_id: UUID | str) -> None:
         """
@@ -200,6 +397,7 @@ class DataAPIClient(BaseHTTPClient):
             NotFoundError: Сущность не найдена.
         """
         await self._delete(f"{self._base_path}/{entity_id}")
+        await self._invalidate_cache()
 
     # === Дополнительные операции ===
 
@@ -230,13 +428,18 @@ class DataAPIClient(BaseHTTPClient):
             entity_ids: Список идентификаторов.
 
         Returns:
-            Список найденных сущностей.
+            Список найденных сущностей в порядке entity_ids.
         """
-        return await self._post(
+        response = await self._post(
             f"{self._base_path}/batch",
             data={"ids": [str(id) for id in entity_ids]},
         )
 
+        # Ответ Data API: {"items": [...], "missingIds": [...]}
+        if isinstance(response, dict):
+            return response.get("items", [])
+        return response
+
     async def count(
         self,
         filters: dict[str, Any] | None = None,
@@ -251,7 +454,11 @@ class DataAPIClient(BaseHTTPClient):
             Количество сущностей.
         """
         params = filters or {}
-        response = await self._get(f"{self._base_path}/count", params=params)
+        response = await self._cached_get(
+            "count",
+            f"{self._base_path}/count",
+            params,
+        )
         return response.get("count", 0)
 
     async def search(
@@ -282,7 +489,11 @@ class DataAPIClient(BaseHTTPClient):
         if fields:
             params["fields"] = ",".join(fields)
 
-        response = await self._get(f"{self._base_path}/search", params=params)
+        response = await self._cached_get(
+            "search",
+            f"{self._base_path}/search",
+            params,
+        )
 
         items = response.get("items", [])
         pagination = response.get("pagination", {})
@@ -294,6 +505,7 @@ class DataAPIClient(BaseHTTPClient):
             total_pages=pagination.get("total_pages", 1),
             has_next=pagination.get("has_next", False),
             has_prev=pagination.get("has_prev", False),
+            is_approximate=pagination.get("is_approximate", False),
         )
 
         return PaginatedResult(items=items, meta=meta)
@@ -336,6 +548,165 @@ class DataAPIClient(BaseHTTPClient):
             total_pages=pagination.get("total_pages", 1),
             has_next=pagination.get("has_next", False),
             has_prev=pagination.get("has_prev", False),
+            is_approximate=pagination.get("is_approximate", False),
         )
 
         return PaginatedResult(items=items, meta=meta)
+
+    # === Потоковый обход ===
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[PaginatedResult[dict[str, Any]]]],
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Обойти все страницы с предзагрузкой следующей.
+
+        Пока потребитель обрабатывает элементы страницы N,
+        запрос страницы N+1 уже выполняется. В памяти не больше
+        двух страниц.
+
+        Args:
+            fetch_page: Загрузка страницы по номеру.
+
+        Yields:
+            Элементы всех страниц по порядку.
+        """
+        page = 1
+        result = await fetch_page(page)
+
+        while True:
+            has_next = result.meta.has_next and bool(result.items)
+            next_page: asyncio.Future | None = (
+                asyncio.ensure_future(fetch_page(page + 1)) if has_next else None
+            )
+
+            try:
+                for item in result.items:
+                    yield item
+            except BaseException:
+                # Потребитель прервал обход — предзагрузка не нужна
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+
+            if next_page is None:
+                return
+
+            page += 1
+            result = await next_page
+
+    def iter_all(
+        self,
+        page_size: int = 100,
+        filters: dict[str, Any] | None = None,
+        sort_by: str | None = None,
+        sort_order: str = "asc",
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Итерировать все сущности постранично.
+
+        Args:
+            page_size: Размер страницы.
+            filters: Фильтры.
+            sort_by: Поле для сортировки (рекомендуется стабильное,
+                иначе offset-пагинация может пропускать/дублировать записи).
+            sort_order: Порядок сортировки.
+            fields: Проекция — вернуть только эти поля (и id).
+
+        Returns:
+            Асинхронный итератор сущностей.
+        """
+        return self._iter_pages(
+            lambda page: self.get_list(
+                page=page,
+                page_size=page_size,
+                filters=filters,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                fields=fields,
+            )
+        )
+
+    def iter_search(
+        self,
+        query: str,
+        page_size: int = 100,
+        fields: list[str] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Итерировать все результаты поиска постранично.
+
+        Args:
+            query: Поисковый запрос.
+            page_size: Размер страницы.
+            fields: Поля для поиска.
+
+        Returns:
+            Асинхронный итератор сущностей.
+        """
+        return self._iter_pages(
+            lambda page: self.search(
+                query,
+                page=page,
+                page_size=page_size,
+                fields=fields,
+            )
+        )
+
+    def iter_related(
+        self,
+        entity_id: UUID | str,
+        relation_name: str,
+        page_size: int = 100,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Итерировать все связанные сущности постранично.
+
+        Args:
+            entity_id: ID основной сущности.
+            relation_name: Название связи.
+            page_size: Размер страницы.
+
+        Returns:
+            Асинхронный итератор связанных сущностей.
+        """
+        return self._iter_pages(
+            lambda page: self.get_related(
+                entity_id,
+                relation_name,
+                page=page,
+                page_size=page_size,
+            )
+        )
+
+    async def iter_export(
+        self,
+        batch_size: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Потоково выгрузить все сущности (GET /export, NDJSON).
+
+        Строки разбираются по мере чтения ответа — память постоянна
+        при выгрузке любого размера.
+
+        Args:
+            batch_size: Размер пачки серверного курсора Data API.
+
+        Yields:
+            Сущности по одной.
+        """
+        params = {"batch_size": batch_size} if batch_size else None
+        rows = 0
+
+        async for line in self._stream_lines(f"{self._base_path}/export", params):
+            rows += 1
+            yield json_loads(line)
+
+        logger.info(
+            "data_api_export_completed",
+            service=self.service_name,
+            entity=self.entity_name,
+            rows=rows,
+        )
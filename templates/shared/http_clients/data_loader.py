@@ -0,0 +1,160 @@
+"""
+Автоматический батчинг запросов (DataLoader).
+
+Собирает вызовы load(key), сделанные в одном такте event loop,
+и выполняет их одним batch-вызовом вместо N отдельных (N+1 → 1).
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_BATCH_SIZE = 100
+
+# Задачи батчей (сильные ссылки, иначе задачу может собрать GC
+# до разрешения futures)
+_batch_tasks: set[asyncio.Task] = set()
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Батчинг вызовов по ключу в пределах одного такта event loop.
+
+    Особенности:
+        - Ключи, запрошенные в одном такте, уходят одним batch_fn.
+        - Повторяющиеся ключи в батче запрашиваются один раз.
+        - Батч больше max_batch_size делится на чанки (параллельно).
+        - Результаты не кэшируются между тактами — данные не устаревают.
+
+    Attributes:
+        max_batch_size: Максимальный размер одного batch-вызова.
+        batches: Количество выполненных batch-вызовов.
+        loads: Количество вызовов load().
+
+    Использование:
+        ```python
+        async def load_users(ids: list[str]) -> list[dict | Exception]:
+            ...
+
+        loader = DataLoader(load_users, max_batch_size=100)
+        users = await asyncio.gather(*(loader.load(uid) for uid in ids))
+        ```
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[list[V | Exception]]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """
+        Инициализировать загрузчик.
+
+        Args:
+            batch_fn: Функция загрузки батча. Должна вернуть список той же
+                длины и в том же порядке, что и ключи; Exception в позиции
+                ключа пробрасывается только вызывающему этот ключ.
+            max_batch_size: Максимальный размер одного batch-вызова.
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._pending: dict[K, list[asyncio.Future]] = {}
+        self.batches = 0
+        self.loads = 0
+
+    async def load(self, key: K) -> V:
+        """
+        Загрузить значение по ключу (в составе батча).
+
+        Args:
+            key: Ключ.
+
+        Returns:
+            Значение для ключа.
+
+        Raises:
+            Exception: Ошибка batch_fn или ошибка для конкретного ключа.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+
+        # Первый ключ в такте планирует отправку батча
+        if not self._pending:
+            loop.call_soon(self._dispatch)
+
+        self._pending.setdefault(key, []).append(future)
+        self.loads += 1
+        return await future
+
+    def _dispatch(self) -> None:
+        """Отправить накопленные ключи чанками по max_batch_size."""
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        loop = asyncio.get_running_loop()
+
+        for start in range(0, len(keys), self.max_batch_size):
+            chunk = keys[start:start + self.max_batch_size]
+            task = loop.create_task(self._run_batch(chunk, pending))
+            _batch_tasks.add(task)
+            task.add_done_callback(_batch_tasks.discard)
+
+    async def _run_batch(
+        self,
+        keys: list[K],
+        pending: dict[K, list[asyncio.Future]],
+    ) -> None:
+        """
+        Выполнить batch_fn и разрешить futures ключей.
+
+        Args:
+            keys: Ключи чанка.
+            pending: Ожидающие futures по ключам.
+        """
+        self.batches += 1
+
+        try:
+            results = await self.batch_fn(keys)
+            if len(results) != len(keys):
+                raise ValueError(
+                    f"batch_fn вернул {len(results)} значений для {len(keys)} ключей"
+                )
+        except Exception as e:
+            for key in keys:
+                self._resolve(pending[key], e)
+            return
+
+        for key, result in zip(keys, results):
+            self._resolve(pending[key], result)
+
+    @staticmethod
+    def _resolve(futures: list[asyncio.Future], result: Any) -> None:
+        """
+        Установить результат или исключение в futures.
+
+        Args:
+            futures: Futures одного ключа.
+            result: Значение или Exception.
+        """
+        for future in futures:
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика батчинга.
+
+        Returns:
+            Словарь с loads, batches, pending.
+        """
+        return {
+            "loads": self.loads,
+            "batches": self.batches,
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,287 @@
+"""
+Устойчивость HTTP вызовов.
+
+Компоненты для BaseHTTPClient._request:
+- CircuitBreaker — closed/open/half_open на сервис, fail fast при отказе
+- RetryBudget — token bucket, ограничивающий долю повторных запросов
+- decorrelated_jitter — задержка между попытками без синхронных волн
+
+Параметры по умолчанию задаются из настроек сервиса через
+configure_resilience() при старте.
+"""
+
+import random
+import time
+from typing import Literal
+
+import structlog
+
+from ..utils.log_helpers import log_circuit_breaker_state_change
+
+
+logger = structlog.get_logger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker для одного внешнего сервиса.
+
+    Состояния:
+        - closed: запросы проходят, считаются подряд идущие ошибки.
+        - open: запросы сразу отклоняются до истечения recovery_timeout.
+        - half_open: пропускается half_open_max_calls пробных запросов;
+          успех закрывает breaker, ошибка снова открывает.
+
+    Attributes:
+        service: Имя сервиса (для логов).
+        failure_threshold: Ошибок подряд до открытия.
+        recovery_timeout: Секунд в open до пробного запроса.
+        half_open_max_calls: Пробных запросов в half_open.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """
+        Инициализировать breaker.
+
+        Args:
+            service: Имя сервиса (для логов).
+            failure_threshold: Ошибок подряд до открытия.
+            recovery_timeout: Секунд в open до пробного запроса.
+            half_open_max_calls: Пробных запросов в half_open.
+        """
+        self.service = service
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state: CircuitState = "closed"
+        self.failure_count = 0
+        self._opened_at = 0.0
+        self._half_open_at = 0.0
+        self._half_open_calls = 0
+
+    def _transition(self, to_state: CircuitState, reason: str) -> None:
+        """
+        Сменить состояние и залогировать переход.
+
+        Args:
+            to_state: Новое состояние.
+            reason: Причина перехода.
+        """
+        from_state = self.state
+        self.state = to_state
+
+        if to_state == "open":
+            self._opened_at = time.monotonic()
+        if to_state == "half_open":
+            self._half_open_at = time.monotonic()
+            self._half_open_calls = 0
+        if to_state == "closed":
+            self.failure_count = 0
+
+        log_circuit_breaker_state_change(
+            logger,
+            service=self.service,
+            from_state=from_state,
+            to_state=to_state,
+            reason=reason,
+            failure_count=self.failure_count,
+            recovery_timeout_seconds=(
+                self.recovery_timeout if to_state == "open" else None
+            ),
+        )
+
+    def allow_request(self) -> bool:
+        """
+        Проверить, можно ли выполнить запрос.
+
+        Returns:
+            True если запрос разрешён.
+        """
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                return False
+            self._transition("half_open", "recovery_timeout_elapsed")
+
+        if self.state == "half_open":
+            # Пробный запрос мог быть отменён без результата — даём новый слот
+            if time.monotonic() - self._half_open_at >= self.recovery_timeout:
+                self._half_open_at = time.monotonic()
+                self._half_open_calls = 0
+            if self._half_open_calls >= self.half_open_max_calls:
+                return False
+            self._half_open_calls += 1
+
+        return True
+
+    def record_success(self) -> None:
+        """Учесть успешный вызов."""
+        if self.state == "half_open":
+            self._transition("closed", "trial_succeeded")
+        else:
+            self.failure_count = 0
+
+    def record_failure(self) -> None:
+        """Учесть неуспешный вызов."""
+        self.failure_count += 1
+
+        if self.state == "half_open":
+            self._transition("open", "trial_failed")
+        elif self.state == "closed" and self.failure_count >= self.failure_threshold:
+            self._transition("open", "failure_threshold_reached")
+
+
+class RetryBudget:
+    """
+    Бюджет повторных запросов (token bucket).
+
+    Каждый исходный запрос пополняет бюджет на retry_ratio токена,
+    каждый повтор тратит один токен. При массовом отказе зависимости
+    доля повторов ограничена retry_ratio и не усиливает нагрузку.
+
+    Attributes:
+        retry_ratio: Допустимая доля повторов от исходных запросов.
+        max_tokens: Ёмкость бюджета.
+        tokens: Текущий остаток.
+    """
+
+    def __init__(
+        self,
+        retry_ratio: float = 0.2,
+        max_tokens: float = 10.0,
+    ) -> None:
+        """
+        Инициализировать бюджет.
+
+        Args:
+            retry_ratio: Допустимая доля повторов от исходных запросов.
+            max_tokens: Ёмкость бюджета (и начальный остаток).
+        """
+        self.retry_ratio = retry_ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def record_request(self) -> None:
+        """Учесть исходный запрос (пополнить бюджет)."""
+        self.tokens = min(self.max_tokens, self.tokens + self.retry_ratio)
+
+    def try_acquire(self) -> bool:
+        """
+        Взять токен на повтор.
+
+        Returns:
+            True если повтор разрешён.
+        """
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+def decorrelated_jitter(base: float, cap: float, previous: float) -> float:
+    """
+    Вычислить задержку перед повтором (decorrelated jitter).
+
+    sleep = min(cap, random(base, previous * 3)) — клиенты
+    не повторяют запросы синхронными волнами.
+
+    Args:
+        base: Минимальная задержка.
+        cap: Максимальная задержка.
+        previous: Предыдущая задержка (base для первой попытки).
+
+    Returns:
+        Задержка в секундах.
+    """
+    return min(cap, random.uniform(base, max(base, previous * 3)))
+
+
+# === Реестр breaker/бюджетов по сервисам ===
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_retry_budgets: dict[str, RetryBudget] = {}
+
+# Параметры по умолчанию для новых breaker/бюджетов (configure_resilience)
+_breaker_defaults: dict[str, float] = {}
+_budget_defaults: dict[str, float] = {}
+
+
+def configure_resilience(
+    failure_threshold: int = 5,
+    recovery_timeout: float = 30.0,
+    retry_ratio: float = 0.2,
+    retry_max_tokens: float = 10.0,
+) -> None:
+    """
+    Задать параметры breaker и бюджета повторов для процесса.
+
+    Вызывается при старте сервиса из настроек, до создания клиентов:
+    уже созданные breaker/бюджеты не меняются.
+
+    Args:
+        failure_threshold: Ошибок подряд до открытия breaker.
+        recovery_timeout: Секунд в open до пробного запроса.
+        retry_ratio: Допустимая доля повторов от исходных запросов.
+        retry_max_tokens: Ёмкость бюджета повторов.
+
+    Example:
+        ```python
+        configure_resilience(
+            failure_threshold=settings.http_circuit_failure_threshold,
+            recovery_timeout=settings.http_circuit_recovery_timeout,
+            retry_ratio=settings.http_retry_budget_ratio,
+            retry_max_tokens=settings.http_retry_budget_max_tokens,
+        )
+        ```
+    """
+    _breaker_defaults.update(
+        failure_threshold=failure_threshold,
+        recovery_timeout=recovery_timeout,
+    )
+    _budget_defaults.update(
+        retry_ratio=retry_ratio,
+        max_tokens=retry_max_tokens,
+    )
+
+
+def get_circuit_breaker(service: str, **kwargs: float) -> CircuitBreaker:
+    """
+    Получить общий для процесса breaker сервиса.
+
+    Args:
+        service: Имя сервиса.
+        **kwargs: Параметры CircuitBreaker при первом создании
+            (поверх configure_resilience).
+
+    Returns:
+        Экземпляр CircuitBreaker.
+    """
+    if service not in _circuit_breakers:
+        _circuit_breakers[service] = CircuitBreaker(
+            service, **{**_breaker_defaults, **kwargs}
+        )
+    return _circuit_breakers[service]
+
+
+def get_retry_budget(service: str, **kwargs: float) -> RetryBudget:
+    """
+    Получить общий для процесса бюджет повторов сервиса.
+
+    Args:
+        service: Имя сервиса.
+        **kwargs: Параметры RetryBudget при первом создании
+            (поверх configure_resilience).
+
+    Returns:
+        Экземпляр RetryBudget.
+    """
+    if service not in _retry_budgets:
+        _retry_budgets[service] = RetryBudget(**{**_budget_defaults, **kwargs})
+    return _retry_budgets[service]
@@ -0,0 +1,290 @@
+"""
+Кэш ответов HTTP клиентов.
+
+Read-through кэш для операций чтения DataAPIClient:
+- InMemoryResponseCache — LRU в памяти процесса с TTL
+- RedisResponseCache — общий кэш в Redis (redis.asyncio)
+
+Инвалидация выполняется по префиксу (сервис + сущность) при
+create/update/partial_update/delete той же сущности. Каждая инвалидация
+увеличивает поколение префикса: ответ, прочитанный до инвалидации,
+не записывается после неё (set с устаревшим generation пропускается).
+
+Оба backend хранят сериализованный JSON: каждый get возвращает
+новую копию, изменение результата вызывающим не портит кэш.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from ..utils.json_codec import json_dumps, json_loads
+
+
+def _prefix_group(key: str) -> str:
+    """Группа инвалидации ключа: первые два сегмента (service:entity)."""
+    return ":".join(key.split(":", 2)[:2])
+
+
+class ResponseCache(ABC):
+    """
+    Базовый класс кэша ответов.
+
+    Attributes:
+        hits: Количество попаданий.
+        misses: Количество промахов.
+        invalidations: Количество инвалидаций по префиксу.
+    """
+
+    def __init__(self) -> None:
+        """Инициализировать счётчики."""
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        """
+        Получить значение.
+
+        Args:
+            key: Ключ кэша.
+
+        Returns:
+            Значение или None при промахе.
+        """
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Сохранить значение.
+
+        Args:
+            key: Ключ кэша.
+            value: JSON-совместимое значение.
+            ttl: Время жизни в секундах.
+            generation: Поколение префикса, прочитанное до запроса
+                (get_generation). Если префикс с тех пор инвалидирован,
+                значение не сохраняется.
+        """
+
+    @abstractmethod
+    async def get_generation(self, prefix: str) -> int:
+        """
+        Получить поколение префикса (растёт при каждой инвалидации).
+
+        Args:
+            prefix: Префикс ключей.
+
+        Returns:
+            Номер поколения.
+        """
+
+    @abstractmethod
+    async def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Удалить все ключи с префиксом и увеличить его поколение.
+
+        Args:
+            prefix: Префикс ключей.
+        """
+
+    def _record(self, hit: bool) -> None:
+        """Учесть попадание или промах."""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """
+        Метрики кэша.
+
+        Returns:
+            Словарь с hits, misses, invalidations, hit_ratio.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    LRU кэш в памяти процесса с TTL.
+
+    Значения хранятся сериализованными (как в Redis), get
+    возвращает независимую копию.
+
+    Attributes:
+        max_entries: Максимальное количество записей.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        Инициализировать кэш.
+
+        Args:
+            max_entries: Максимальное количество записей (LRU вытеснение).
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+
+    async def get(self, key: str) -> Any | None:
+        """Получить значение (с обновлением LRU-позиции)."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self._record(hit=False)
+            return None
+
+        self._entries.move_to_end(key)
+        self._record(hit=True)
+        return json_loads(entry[1])
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        generation: int | None = None,
+    ) -> None:
+        """Сохранить значение, вытеснив самое старое при переполнении."""
+        if (
+            generation is not None
+            and self._generations.get(_prefix_group(key), 0) != generation
+        ):
+            return
+        self._entries[key] = (time.monotonic() + ttl, json_dumps(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_generation(self, prefix: str) -> int:
+        """Получить поколение префикса."""
+        return self._generations.get(_prefix_group(prefix), 0)
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        """Удалить все ключи с префиксом и увеличить его поколение."""
+        group = _prefix_group(prefix)
+        self._generations[group] = self._generations.get(group, 0) + 1
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+        self.invalidations += 1
+
+
+class RedisResponseCache(ResponseCache):
+    """
+    Кэш в Redis, общий для всех реплик сервиса.
+
+    Ключи каждого префикса дополнительно регистрируются в Redis SET,
+    чтобы инвалидация не требовала SCAN по всему keyspace. Поколение
+    префикса — счётчик в Redis; проверка поколения и запись выполняются
+    одним Lua скриптом (атомарно относительно инвалидации с других реплик).
+
+    Attributes:
+        redis: Клиент redis.asyncio.Redis.
+        namespace: Префикс всех ключей кэша.
+    """
+
+    def __init__(self, redis: Any, namespace: str = "http_cache") -> None:
+        """
+        Инициализировать кэш.
+
+        Args:
+            redis: Клиент redis.asyncio.Redis.
+            namespace: Префикс всех ключей кэша.
+        """
+        super().__init__()
+        self.redis = redis
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        """Полный ключ значения."""
+        return f"{self.namespace}:{key}"
+
+    def _index_key(self, key: str) -> str:
+        """Ключ SET-индекса для префикса сущности (service:entity)."""
+        return f"{self.namespace}:index:{_prefix_group(key)}"
+
+    def _generation_key(self, key: str) -> str:
+        """Ключ счётчика поколения для префикса сущности."""
+        return f"{self.namespace}:gen:{_prefix_group(key)}"
+
+    async def get(self, key: str) -> Any | None:
+        """Получить значение."""
+        raw = await self.redis.get(self._key(key))
+        self._record(hit=raw is not None)
+        return json_loads(raw) if raw is not None else None
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        generation: int | None = None,
+    ) -> None:
+        """Сохранить значение и зарегистрировать ключ в индексе."""
+        index_key = self._index_key(key)
+        ttl_ms = int(ttl * 1000)
+        if generation is not None:
+            await self.redis.eval(
+                _SET_IF_GENERATION_SCRIPT,
+                3,
+                self._generation_key(key),
+                self._key(key),
+                index_key,
+                str(generation),
+                json_dumps(value),
+                ttl_ms,
+            )
+            return
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(key), json_dumps(value), px=ttl_ms)
+            pipe.sadd(index_key, self._key(key))
+            pipe.pexpire(index_key, ttl_ms)
+            await pipe.execute()
+
+    async def get_generation(self, prefix: str) -> int:
+        """Получить поколение префикса."""
+        raw = await self.redis.get(self._generation_key(prefix))
+        return int(raw) if raw is not None else 0
+
+    async def invalidate_prefix(self, prefix: str) -> None:
+        """Удалить все ключи группы (service:entity) префикса."""
+        index_key = self._index_key(prefix)
+        # Поколение увеличивается до удаления: чтение, начатое раньше,
+        # уже не запишет свой ответ
+        await self.redis.incr(self._generation_key(prefix))
+        keys = await self.redis.smembers(index_key)
+        if keys:
+            await self.redis.delete(*keys, index_key)
+        self.invalidations += 1
+
+
+# KEYS: поколение, значение, индекс; ARGV: поколение, значение, ttl_ms.
+# Запись только если поколение не изменилось с начала чтения.
+_SET_IF_GENERATION_SCRIPT = """
+if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[2], ARGV[2], 'PX', ARGV[3])
+redis.call('SADD', KEYS[3], KEYS[2])
+redis.call('PEXPIRE', KEYS[3], ARGV[3])
+return 1
+"""
@@ -0,0 +1,117 @@
+"""
+Объединение одинаковых конкурентных запросов (single-flight).
+
+Если N корутин одновременно запрашивают один и тот же ресурс,
+выполняется один запрос, а его результат (или исключение)
+раздаётся всем ожидающим.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Группа single-flight вызовов.
+
+    Особенности:
+        - Один in-flight вызов на ключ.
+        - Отмена ожидающей корутины не отменяет общий вызов.
+        - Счётчики выполненных и объединённых вызовов.
+
+    Attributes:
+        executed: Количество реально выполненных вызовов.
+        coalesced: Количество вызовов, получивших чужой результат.
+
+    Использование:
+        ```python
+        flight = SingleFlight()
+        data = await flight.do(("GET", "/users/1"), lambda: fetch_user(1))
+        ```
+
+    Note:
+        Все ожидающие получают один и тот же объект результата —
+        его нельзя изменять на месте.
+    """
+
+    def __init__(self) -> None:
+        """Инициализировать группу."""
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> Hashable:
+        """
+        Построить ключ запроса.
+
+        Args:
+            method: HTTP метод.
+            path: Путь запроса.
+            params: Query параметры.
+
+        Returns:
+            Хэшируемый ключ (method, path, отсортированные params).
+        """
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return (method.upper(), path, items)
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """
+        Выполнить вызов или присоединиться к уже выполняющемуся.
+
+        Args:
+            key: Ключ вызова.
+            func: Фабрика корутины, выполняющей запрос.
+
+        Returns:
+            Tuple (результат, был ли вызов объединён с чужим).
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task), shared
+
+    def _release(self, key: Hashable, task: asyncio.Task) -> None:
+        """
+        Удалить завершённый вызов из in-flight.
+
+        Args:
+            key: Ключ вызова.
+            task: Завершённая задача.
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Забираем исключение, если все ожидающие были отменены
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика объединения.
+
+        Returns:
+            Словарь с executed, coalesced, in_flight.
+        """
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
@@ -17,6 +17,12 @@ from .pagination import (
     PaginatedResponse,
     CursorPaginationQueryParams,
     CursorPaginationResponse,
+    CursorPaginatedResponse,
+)
+from .batch import (
+    MAX_BATCH_IDS,
+    BatchGetRequest,
+    BatchGetResponse,
 )
 from .errors import (
     ErrorDetail,
@@ -38,6 +44,11 @@ __all__ = [
     "PaginatedResponse",
     "CursorPaginationQueryParams",
     "CursorPaginationResponse",
+    "CursorPaginatedResponse",
+    # Batch
+    "MAX_BATCH_IDS",
+    "BatchGetRequest",
+    "BatchGetResponse",
     # Errors
     "ErrorDetail",
     "ErrorResponse",
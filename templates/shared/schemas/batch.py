@@ -0,0 +1,51 @@
+"""
+Схемы пакетного чтения.
+
+Pydantic схемы для POST /{entity}/batch — получения нескольких
+сущностей одним запросом (используется DataAPIClient.get_by_ids).
+"""
+
+from typing import Generic, TypeVar
+
+from pydantic import Field
+
+from .base import BaseSchema, BaseResponseSchema
+
+
+T = TypeVar("T")
+
+# Максимальное количество ID в одном batch-запросе
+MAX_BATCH_IDS = 1000
+
+
+class BatchGetRequest(BaseSchema):
+    """
+    Запрос пакетного чтения.
+
+    Attributes:
+        ids: Идентификаторы сущностей (порядок сохраняется в ответе).
+    """
+
+    ids: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_IDS,
+        description="Идентификаторы сущностей",
+    )
+
+
+class BatchGetResponse(BaseResponseSchema, Generic[T]):
+    """
+    Ответ пакетного чтения.
+
+    Attributes:
+        items: Найденные сущности в порядке запроса.
+        missing_ids: Идентификаторы, которые не найдены.
+    """
+
+    items: list[T] = Field(..., description="Найденные сущности в порядке запроса")
+    missing_ids: list[str] = Field(
+        default_factory=list,
+        alias="missingIds",
+        description="Идентификаторы, которые не найдены",
+    )
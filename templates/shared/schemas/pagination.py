@@ -70,7 +70,7 @@ class CursorPaginationQueryParams(BaseSchema):
 
     cursor: str | None = Field(
         default=None,
-        description="Курсор (ID последнего элемента)",
+        description="Непрозрачный курсор (nextCursor из предыдущего ответа)",
     )
     limit: int = Field(
         default=20,
@@ -98,6 +98,7 @@ class PaginationResponse(BaseResponseSchema):
         total_pages: Общее количество страниц.
         has_next: Есть ли следующая страница.
         has_prev: Есть ли предыдущая страница.
+        is_approximate: total_items — оценка (стратегия estimate).
     """
 
     page: int = Field(..., ge=1, description="Текущая страница")
@@ -129,6 +130,11 @@ class PaginationResponse(BaseResponseSchema):
         alias="hasPrev",
         description="Есть предыдущая страница",
     )
+    is_approximate: bool = Field(
+        False,
+        alias="isApproximate",
+        description="totalItems является оценкой, а не точным значением",
+    )
 
 
 class PaginatedResponse(BaseResponseSchema, Generic[T]):
@@ -160,6 +166,7 @@ class PaginatedResponse(BaseResponseSchema, Generic[T]):
         page: int,
         page_size: int,
         total_items: int,
+        is_approximate: bool = False,
     ) -> "PaginatedResponse[T]":
         """
         Создать пагинированный ответ.
@@ -169,6 +176,7 @@ class PaginatedResponse(BaseResponseSchema, Generic[T]):
             page: Текущая страница.
             page_size: Размер страницы.
             total_items: Общее количество.
+            is_approximate: total_items получен оценкой.
 
         Returns:
             Пагинированный ответ.
@@ -186,6 +194,7 @@ class PaginatedResponse(BaseResponseSchema, Generic[T]):
                 total_pages=total_pages,
                 has_next=page < total_pages,
                 has_prev=page > 1,
+                is_approximate=is_approximate,
             ),
         )
 
@@ -224,10 +233,77 @@ class CursorPaginationResponse(BaseResponseSchema):
 
 
 class CursorPaginatedResponse(BaseResponseSchema, Generic[T]):
-    """Generic cursor-пагинированный ответ."""
+    """
+    Generic cursor-пагинированный ответ.
+
+    Использование:
+        ```python
+        @router.get("/items", response_model=CursorPaginatedResponse[ItemResponse])
+        async def list_items(
+            pagination: Annotated[CursorPaginationQueryParams, Query()],
+            repo: ItemRepositoryDep,
+        ):
+            result = await repo.get_page_after(pagination.cursor, pagination.limit)
+            return CursorPaginatedResponse.from_result(result)
+        ```
+    """
 
     items: list[T] = Field(..., description="Список элементов")
     pagination: CursorPaginationResponse = Field(
         ...,
         description="Метаданные пагинации",
     )
+
+    @classmethod
+    def create(
+        cls,
+        items: list[T],
+        next_cursor: str | None,
+        has_next: bool,
+        prev_cursor: str | None = None,
+        has_prev: bool = False,
+    ) -> "CursorPaginatedResponse[T]":
+        """
+        Создать cursor-пагинированный ответ.
+
+        Args:
+            items: Список элементов.
+            next_cursor: Курсор следующей страницы.
+            has_next: Есть ли следующая страница.
+            prev_cursor: Курсор предыдущей страницы.
+            has_prev: Есть ли предыдущая страница.
+
+        Returns:
+            Cursor-пагинированный ответ.
+        """
+        return cls(
+            items=items,
+            pagination=CursorPaginationResponse(
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor,
+                has_next=has_next,
+                has_prev=has_prev,
+            ),
+        )
+
+    @classmethod
+    def from_result(
+        cls,
+        result: Any,
+    ) -> "CursorPaginatedResponse[T]":
+        """
+        Создать ответ из CursorPaginatedResult репозитория.
+
+        Args:
+            result: Результат get_page_after (CursorPaginatedResult).
+
+        Returns:
+            Cursor-пагинированный ответ.
+        """
+        return cls.create(
+            items=result.items,
+            next_cursor=result.meta.next_cursor,
+            has_next=result.meta.has_next,
+            prev_cursor=result.meta.prev_cursor,
+            has_prev=result.meta.has_prev,
+        )
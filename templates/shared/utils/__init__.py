@@ -5,6 +5,8 @@
 """
 
 from .logger import setup_logging, get_logger
+from .log_sink import AsyncLogSink, create_logger_factory, get_log_sink
+from .log_sampling import DEFAULT_SAMPLE_RATES, LogSampler
 from .validators import (
     validate_email,
     validate_phone,
@@ -15,6 +17,7 @@ from .validators import (
     validate_range,
     validate_length,
     validate_not_empty,
+    parse_fields,
     pydantic_email_validator,
     pydantic_phone_validator,
     pydantic_slug_validator,
@@ -40,6 +43,9 @@ from .pagination import (
     DEFAULT_PAGE,
     DEFAULT_PAGE_SIZE,
     MAX_PAGE_SIZE,
+    CountStrategy,
+    CountResult,
+    CountCache,
     PaginationParams,
     PaginationMeta,
     PaginatedResult,
@@ -47,6 +53,36 @@ from .pagination import (
     CursorPaginationParams,
     CursorPaginationMeta,
     CursorPaginatedResult,
+    encode_cursor,
+    decode_cursor,
+)
+from .idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    IDEMPOTENT_METHODS,
+    READ_ONLY_PATH_SUFFIXES,
+    IdempotencyStore,
+    InMemoryIdempotencyStore,
+    RedisIdempotencyStore,
+    IdempotencyMiddleware,
+    create_idempotency_store,
+    is_read_only_request,
+)
+from .json_codec import json_dumps, json_loads, get_json_backend
+from .query_tracker import (
+    QueryStats,
+    start_query_tracking,
+    stop_query_tracking,
+    get_query_stats,
+    record_query,
+    record_operation,
+)
+from .streaming import (
+    NDJSON_MEDIA_TYPE,
+    CSV_MEDIA_TYPE,
+    ExportFormat,
+    iter_ndjson,
+    iter_csv,
+    encode_stream,
 )
 from .request_id import (
     REQUEST_ID_HEADER,
@@ -59,12 +95,18 @@ from .request_id import (
     with_request_id,
     extract_request_id_from_headers,
     create_request_id_headers,
+    RequestContextMiddleware,
 )
 
 __all__ = [
     # Logger
     "setup_logging",
     "get_logger",
+    "AsyncLogSink",
+    "create_logger_factory",
+    "get_log_sink",
+    "DEFAULT_SAMPLE_RATES",
+    "LogSampler",
     # Validators
     "validate_email",
     "validate_phone",
@@ -75,6 +117,7 @@ __all__ = [
     "validate_range",
     "validate_length",
     "validate_not_empty",
+    "parse_fields",
     "pydantic_email_validator",
     "pydantic_phone_validator",
     "pydantic_slug_validator",
@@ -98,6 +141,9 @@ __all__ = [
     "DEFAULT_PAGE",
     "DEFAULT_PAGE_SIZE",
     "MAX_PAGE_SIZE",
+    "CountStrategy",
+    "CountResult",
+    "CountCache",
     "PaginationParams",
     "PaginationMeta",
     "PaginatedResult",
@@ -105,6 +151,36 @@ __all__ = [
     "CursorPaginationParams",
     "CursorPaginationMeta",
     "CursorPaginatedResult",
+    "encode_cursor",
+    "decode_cursor",
+    # Idempotency
+    "IDEMPOTENCY_KEY_HEADER",
+    "IDEMPOTENT_METHODS",
+    "READ_ONLY_PATH_SUFFIXES",
+    "IdempotencyStore",
+    "InMemoryIdempotencyStore",
+    "RedisIdempotencyStore",
+    "IdempotencyMiddleware",
+    "create_idempotency_store",
+    "is_read_only_request",
+    # JSON
+    "json_dumps",
+    "json_loads",
+    "get_json_backend",
+    # Query tracking
+    "QueryStats",
+    "start_query_tracking",
+    "stop_query_tracking",
+    "get_query_stats",
+    "record_query",
+    "record_operation",
+    # Streaming
+    "NDJSON_MEDIA_TYPE",
+    "CSV_MEDIA_TYPE",
+    "ExportFormat",
+    "iter_ndjson",
+    "iter_csv",
+    "encode_stream",
     # Request ID
     "REQUEST_ID_HEADER",
     "CORRELATION_ID_HEADER",
@@ -116,4 +192,5 @@ __all__ = [
     "with_request_id",
     "extract_request_id_from_headers",
     "create_request_id_headers",
+    "RequestContextMiddleware",
 ]
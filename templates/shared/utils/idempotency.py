@@ -0,0 +1,560 @@
+"""
+Идемпотентность неидемпотентных HTTP запросов.
+
+Клиент передаёт заголовок Idempotency-Key для POST/PATCH, сервер
+сохраняет ответ на первый запрос с этим ключом и на повтор отдаёт
+сохранённый ответ вместо повторного выполнения обработчика.
+
+Ключ хранится со скоупом вызывающего (хэш Authorization / X-API-Key,
+иначе IP клиента), метода и пути: одинаковые ключи разных клиентов
+не получают чужие ответы.
+
+POST без побочных эффектов (READ_ONLY_PATH_SUFFIXES: /batch, /search)
+не требуют ключа: клиент его не добавляет, middleware не сохраняет ответ.
+
+Компоненты:
+- IdempotencyStore — хранилище ответов (InMemory LRU / Redis)
+- IdempotencyMiddleware — ASGI middleware для FastAPI приложений
+- create_idempotency_store — выбор хранилища по настройкам
+"""
+
+import base64
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import structlog
+
+from .exceptions import ConflictError, InvalidInputError
+
+
+logger = structlog.get_logger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Методы, повтор которых безопасен без ключа идемпотентности (RFC 9110)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# POST-маршруты чтения: повтор безопасен, ответ не сохраняется
+READ_ONLY_PATH_SUFFIXES = ("/batch", "/search")
+
+# Заголовки, по которым определяется вызывающий (значение хэшируется)
+CALLER_HEADERS = ("authorization", "x-api-key")
+
+DEFAULT_IDEMPOTENCY_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_STORED_BODY_BYTES = 1024 * 1024
+DEFAULT_MAX_STORE_BYTES = 64 * 1024 * 1024
+
+# Retry-After ответа 409 "ещё выполняется": клиент ждёт и повторяет
+IN_PROGRESS_RETRY_AFTER_SECONDS = 1
+
+
+def is_read_only_request(method: str, path: str) -> bool:
+    """
+    Проверить, что POST-запрос только читает данные.
+
+    Args:
+        method: HTTP метод.
+        path: Путь запроса (без query).
+
+    Returns:
+        True для POST на маршруты из READ_ONLY_PATH_SUFFIXES.
+    """
+    return method.upper() == "POST" and path.rstrip("/").endswith(READ_ONLY_PATH_SUFFIXES)
+
+
+@dataclass
+class StoredResponse:
+    """
+    Сохранённый ответ на запрос с ключом идемпотентности.
+
+    Attributes:
+        fingerprint: Хэш метода, пути и тела исходного запроса.
+        status_code: HTTP статус.
+        headers: Заголовки ответа (raw ASGI пары).
+        body: Тело ответа.
+    """
+
+    fingerprint: str
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+    @property
+    def size(self) -> int:
+        """Примерный размер в памяти (тело и заголовки), байт."""
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+    def to_json(self) -> str:
+        """Сериализовать для внешнего хранилища."""
+        return json.dumps({
+            "fingerprint": self.fingerprint,
+            "status_code": self.status_code,
+            "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers],
+            "body": base64.b64encode(self.body).decode("ascii"),
+        })
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "StoredResponse":
+        """Восстановить из внешнего хранилища."""
+        data = json.loads(raw)
+        return cls(
+            fingerprint=data["fingerprint"],
+            status_code=data["status_code"],
+            headers=[(k.encode("latin-1"), v.encode("latin-1")) for k, v in data["headers"]],
+            body=base64.b64decode(data["body"]),
+        )
+
+
+# === Хранилища ===
+
+class IdempotencyStore(ABC):
+    """
+    Базовый класс хранилища ответов.
+
+    Ключ сначала блокируется (lock) на время выполнения обработчика,
+    затем либо сохраняется ответ (save), либо блокировка снимается
+    (release), чтобы повтор выполнил обработчик заново.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> StoredResponse | None:
+        """
+        Получить сохранённый ответ.
+
+        Args:
+            key: Ключ идемпотентности (со скоупом метода и пути).
+
+        Returns:
+            Ответ или None.
+        """
+
+    @abstractmethod
+    async def lock(self, key: str, ttl: float) -> bool:
+        """
+        Захватить ключ на время выполнения запроса.
+
+        Args:
+            key: Ключ идемпотентности.
+            ttl: Время жизни блокировки в секундах.
+
+        Returns:
+            True если ключ захвачен, False если запрос уже выполняется.
+        """
+
+    @abstractmethod
+    async def save(self, key: str, response: StoredResponse, ttl: float) -> None:
+        """
+        Сохранить ответ и снять блокировку.
+
+        Args:
+            key: Ключ идемпотентности.
+            response: Ответ.
+            ttl: Время хранения в секундах.
+        """
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """
+        Снять блокировку без сохранения ответа.
+
+        Args:
+            key: Ключ идемпотентности.
+        """
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """
+    LRU хранилище в памяти процесса.
+
+    Подходит для одного инстанса сервиса; для нескольких реплик
+    используйте RedisIdempotencyStore. Ограничено и количеством
+    ответов, и их суммарным размером.
+
+    Attributes:
+        max_entries: Максимальное количество сохранённых ответов.
+        max_bytes: Максимальный суммарный размер ответов.
+        total_bytes: Текущий суммарный размер ответов.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int = DEFAULT_MAX_STORE_BYTES,
+    ) -> None:
+        """
+        Инициализировать хранилище.
+
+        Args:
+            max_entries: Максимальное количество ответов (LRU вытеснение).
+            max_bytes: Максимальный суммарный размер ответов (LRU вытеснение).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._responses: OrderedDict[str, tuple[float, StoredResponse]] = OrderedDict()
+        self._locks: dict[str, float] = {}
+
+    async def get(self, key: str) -> StoredResponse | None:
+        """Получить сохранённый ответ (с обновлением LRU-позиции)."""
+        entry = self._responses.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._discard(key)
+            return None
+        self._responses.move_to_end(key)
+        return entry[1]
+
+    async def lock(self, key: str, ttl: float) -> bool:
+        """Захватить ключ, если он не захвачен или блокировка истекла."""
+        now = time.monotonic()
+        expires_at = self._locks.get(key)
+        if expires_at is not None and expires_at > now:
+            return False
+        self._locks[key] = now + ttl
+        return True
+
+    async def save(self, key: str, response: StoredResponse, ttl: float) -> None:
+        """Сохранить ответ, вытеснив самые старые при переполнении."""
+        self._locks.pop(key, None)
+        if response.size > self.max_bytes:
+            return
+        self._discard(key)
+        self._responses[key] = (time.monotonic() + ttl, response)
+        self.total_bytes += response.size
+        while len(self._responses) > self.max_entries or self.total_bytes > self.max_bytes:
+            _, (_, evicted) = self._responses.popitem(last=False)
+            self.total_bytes -= evicted.size
+
+    async def release(self, key: str) -> None:
+        """Снять блокировку."""
+        self._locks.pop(key, None)
+
+    def _discard(self, key: str) -> None:
+        """Удалить ответ с учётом его размера."""
+        entry = self._responses.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1].size
+
+
+class RedisIdempotencyStore(IdempotencyStore):
+    """
+    Хранилище в Redis, общее для всех реплик сервиса.
+
+    Блокировка — SET NX с TTL, ответ — JSON с телом в base64.
+
+    Attributes:
+        redis: Клиент redis.asyncio.Redis.
+        namespace: Префикс ключей.
+    """
+
+    def __init__(self, redis: Any, namespace: str = "idempotency") -> None:
+        """
+        Инициализировать хранилище.
+
+        Args:
+            redis: Клиент redis.asyncio.Redis.
+            namespace: Префикс ключей.
+        """
+        self.redis = redis
+        self.namespace = namespace
+
+    def _response_key(self, key: str) -> str:
+        """Ключ сохранённого ответа."""
+        return f"{self.namespace}:response:{key}"
+
+    def _lock_key(self, key: str) -> str:
+        """Ключ блокировки."""
+        return f"{self.namespace}:lock:{key}"
+
+    async def get(self, key: str) -> StoredResponse | None:
+        """Получить сохранённый ответ."""
+        raw = await self.redis.get(self._response_key(key))
+        return StoredResponse.from_json(raw) if raw is not None else None
+
+    async def lock(self, key: str, ttl: float) -> bool:
+        """Захватить ключ (SET NX)."""
+        return bool(
+            await self.redis.set(self._lock_key(key), "1", nx=True, px=int(ttl * 1000))
+        )
+
+    async def save(self, key: str, response: StoredResponse, ttl: float) -> None:
+        """Сохранить ответ и снять блокировку."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._response_key(key), response.to_json(), px=int(ttl * 1000))
+            pipe.delete(self._lock_key(key))
+            await pipe.execute()
+
+    async def release(self, key: str) -> None:
+        """Снять блокировку."""
+        await self.redis.delete(self._lock_key(key))
+
+
+def create_idempotency_store(
+    backend: str = "memory",
+    redis_url: str | None = None,
+    max_entries: int = 10_000,
+    max_bytes: int = DEFAULT_MAX_STORE_BYTES,
+    namespace: str = "idempotency",
+) -> IdempotencyStore:
+    """
+    Создать хранилище ответов по настройкам сервиса.
+
+    Args:
+        backend: memory (LRU в памяти процесса) | redis (общее для реплик).
+        redis_url: URL Redis (для backend="redis").
+        max_entries: Максимальное количество ответов в памяти.
+        max_bytes: Максимальный суммарный размер ответов в памяти.
+        namespace: Префикс ключей в Redis.
+
+    Returns:
+        Хранилище ответов.
+
+    Raises:
+        ValueError: Неизвестный backend или не задан redis_url.
+    """
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("Для IDEMPOTENCY_BACKEND=redis нужен REDIS_URL")
+        from redis import asyncio as aioredis
+
+        return RedisIdempotencyStore(aioredis.from_url(redis_url), namespace=namespace)
+    if backend != "memory":
+        raise ValueError(f"Неизвестный backend идемпотентности: {backend}")
+    return InMemoryIdempotencyStore(max_entries=max_entries, max_bytes=max_bytes)
+
+
+# === ASGI Middleware ===
+
+ASGIApp = Callable[[dict, Callable, Callable], Awaitable[None]]
+
+
+class IdempotencyMiddleware:
+    """
+    ASGI middleware идемпотентности для неидемпотентных методов.
+
+    Поведение для запросов POST/PATCH с заголовком Idempotency-Key:
+        - Первый запрос выполняется, ответ (кроме 5xx) сохраняется.
+        - Повтор с тем же ключом и телом получает сохранённый ответ
+          с заголовком Idempotent-Replayed: true, обработчик не вызывается.
+        - Повтор, пока первый запрос ещё выполняется → 409 CONFLICT
+          с Retry-After (BaseHTTPClient ждёт и повторяет).
+        - Тот же ключ с другим телом → 422 INVALID_INPUT.
+
+    Ключ хранится со скоупом вызывающего (хэш заголовка из CALLER_HEADERS,
+    иначе IP клиента), метода и пути. POST на маршруты чтения
+    (READ_ONLY_PATH_SUFFIXES) пропускаются без сохранения ответа.
+
+    Реализован как чистый ASGI middleware (без BaseHTTPMiddleware),
+    чтобы не буферизовать ответы запросов без ключа.
+
+    Использование:
+        ```python
+        app.add_middleware(
+            IdempotencyMiddleware,
+            store=create_idempotency_store(max_entries=10_000),
+            ttl_seconds=settings.idempotency_ttl_seconds,
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: IdempotencyStore,
+        ttl_seconds: float = DEFAULT_IDEMPOTENCY_TTL_SECONDS,
+        lock_timeout_seconds: float = 60.0,
+        max_body_bytes: int = DEFAULT_MAX_STORED_BODY_BYTES,
+    ) -> None:
+        """
+        Инициализировать middleware.
+
+        Args:
+            app: ASGI приложение.
+            store: Хранилище ответов.
+            ttl_seconds: Время хранения ответа.
+            lock_timeout_seconds: Максимальное время блокировки ключа.
+            max_body_bytes: Ответы больше этого размера не сохраняются.
+        """
+        self.app = app
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        """Обработать ASGI вызов."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] in IDEMPOTENT_METHODS
+            or is_read_only_request(scope["method"], scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        idempotency_key = _get_header(scope, IDEMPOTENCY_KEY_HEADER)
+        if not idempotency_key:
+            await self.app(scope, receive, send)
+            return
+
+        # Тело читаем заранее — оно нужно для fingerprint
+        body = await _read_body(receive)
+        fingerprint = hashlib.sha256(
+            scope["method"].encode() + b" " + scope["path"].encode() + b"\n" + body
+        ).hexdigest()
+        key = f"{_caller_scope(scope)}:{scope['method']}:{scope['path']}:{idempotency_key}"
+        log = logger.bind(idempotency_key=idempotency_key, path=scope["path"])
+
+        stored = await self.store.get(key)
+        if stored is not None:
+            if stored.fingerprint != fingerprint:
+                log.warning("idempotency_key_reused")
+                await _send_error(send, 422, InvalidInputError(
+                    "Ключ идемпотентности уже использован с другим телом запроса",
+                    field=IDEMPOTENCY_KEY_HEADER,
+                ).to_dict())
+                return
+            log.info("idempotent_response_replayed", status_code=stored.status_code)
+            await _send_stored(send, stored)
+            return
+
+        if not await self.store.lock(key, self.lock_timeout_seconds):
+            log.warning("idempotent_request_in_progress")
+            await _send_error(send, 409, ConflictError(
+                "Запрос с этим ключом идемпотентности ещё выполняется",
+                details={"idempotency_key": idempotency_key},
+            ).to_dict(), headers=[
+                (b"retry-after", str(IN_PROGRESS_RETRY_AFTER_SECONDS).encode()),
+            ])
+            return
+
+        # Первый запрос мог завершиться между get() и lock()
+        stored = await self.store.get(key)
+        if stored is not None:
+            await self.store.release(key)
+            await _send_stored(send, stored)
+            return
+
+        captured: dict[str, Any] = {"status": 500, "headers": [], "chunks": [], "size": 0}
+
+        async def send_wrapper(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                captured["status"] = message["status"]
+                captured["headers"] = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                captured["size"] += len(chunk)
+                if captured["size"] <= self.max_body_bytes:
+                    captured["chunks"].append(chunk)
+            await send(message)
+
+        try:
+            await self.app(scope, _replay_body(body, receive), send_wrapper)
+        except BaseException:
+            await self.store.release(key)
+            raise
+
+        # 5xx и слишком большие ответы не сохраняем — повтор выполнит обработчик
+        if captured["status"] >= 500 or captured["size"] > self.max_body_bytes:
+            await self.store.release(key)
+            return
+
+        await self.store.save(
+            key,
+            StoredResponse(
+                fingerprint=fingerprint,
+                status_code=captured["status"],
+                headers=captured["headers"],
+                body=b"".join(captured["chunks"]),
+            ),
+            self.ttl_seconds,
+        )
+
+
+def _get_header(scope: dict, name: str) -> str | None:
+    """Получить заголовок запроса из ASGI scope."""
+    target = name.lower().encode("latin-1")
+    for key, value in scope.get("headers", []):
+        if key == target:
+            return value.decode("latin-1")
+    return None
+
+
+def _caller_scope(scope: dict) -> str:
+    """
+    Определить вызывающего для скоупа ключа идемпотентности.
+
+    Args:
+        scope: ASGI scope запроса.
+
+    Returns:
+        Хэш учётных данных (Authorization / X-API-Key) или IP клиента.
+    """
+    for name in CALLER_HEADERS:
+        value = _get_header(scope, name)
+        if value:
+            return "auth-" + hashlib.sha256(value.encode("latin-1")).hexdigest()[:32]
+    client = scope.get("client")
+    return f"ip-{client[0]}" if client else "anonymous"
+
+
+async def _read_body(receive: Callable) -> bytes:
+    """Прочитать тело запроса целиком."""
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def _replay_body(body: bytes, receive: Callable) -> Callable[[], Awaitable[dict]]:
+    """Построить receive, отдающий уже прочитанное тело."""
+    sent = False
+
+    async def replay() -> dict:
+        nonlocal sent
+        # Дальше — исходный receive (ожидание http.disconnect)
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+async def _send_stored(send: Callable, stored: StoredResponse) -> None:
+    """Отправить сохранённый ответ."""
+    headers = [
+        (k, v) for k, v in stored.headers
+        if k.lower() != IDEMPOTENT_REPLAYED_HEADER.lower().encode()
+    ]
+    headers.append((IDEMPOTENT_REPLAYED_HEADER.lower().encode(), b"true"))
+    await send({"type": "http.response.start", "status": stored.status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": stored.body})
+
+
+async def _send_error(
+    send: Callable,
+    status: int,
+    payload: dict[str, Any],
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> None:
+    """Отправить JSON ответ об ошибке."""
+    body = json.dumps(payload, ensure_ascii=False).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *(headers or []),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,97 @@
+"""
+Быстрый JSON кодек.
+
+Выбирает самую быструю доступную библиотеку:
+orjson → msgspec → стандартный json. Обе ускоренные библиотеки
+опциональны: без них модуль работает на стандартном json.
+
+Используется:
+- FastJSONResponse (shared.utils.responses) — ответы FastAPI
+- BaseHTTPClient — разбор JSON ответов
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Literal
+from uuid import UUID
+
+
+JSONBackend = Literal["orjson", "msgspec", "json"]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - опциональная зависимость
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - опциональная зависимость
+    msgspec = None
+
+
+def _default(obj: Any) -> Any:
+    """Сериализация типов, не поддерживаемых кодеком напрямую."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (UUID, Decimal)):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Тип {type(obj).__name__} не сериализуется в JSON")
+
+
+def get_json_backend() -> JSONBackend:
+    """
+    Получить используемую JSON библиотеку.
+
+    Returns:
+        "orjson", "msgspec" или "json".
+    """
+    if orjson is not None:
+        return "orjson"
+    if msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def json_dumps(obj: Any) -> bytes:
+        """Сериализовать в компактный UTF-8 JSON."""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+    def json_loads(data: bytes | str) -> Any:
+        """Разобрать JSON."""
+        return orjson.loads(data)
+
+elif msgspec is not None:
+    _encoder = msgspec.json.Encoder(enc_hook=_default)
+    _decoder = msgspec.json.Decoder()
+
+    def json_dumps(obj: Any) -> bytes:
+        """Сериализовать в компактный UTF-8 JSON."""
+        return _encoder.encode(obj)
+
+    def json_loads(data: bytes | str) -> Any:
+        """Разобрать JSON."""
+        return _decoder.decode(data)
+
+else:
+
+    def json_dumps(obj: Any) -> bytes:
+        """Сериализовать в компактный UTF-8 JSON."""
+        return json.dumps(
+            obj,
+            default=_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+
+    def json_loads(data: bytes | str) -> Any:
+        """Разобрать JSON."""
+        return json.loads(data)
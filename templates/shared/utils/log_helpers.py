@@ -9,8 +9,14 @@
 - Ошибки валидации
 - Rate limiting
 - Контекст авторизации
+
+Хелперы сравнивают уровень события с минимальным уровнем из
+setup_logging до построения полей: при выключенном уровне (DEBUG
+в production) вызов сводится к одному сравнению. Дополнительные
+поля пишутся прямо в kwargs — без промежуточного словаря log_data.
 """
 
+import logging
 import time
 from typing import Any, Literal
 
@@ -39,6 +45,42 @@ ErrorCode = Literal[
 ]
 
 
+# === Минимальный уровень ===
+
+# Уровень из setup_logging (NOTSET — логирование не настроено, выводится всё,
+# как у structlog без configure)
+_min_level: int = logging.NOTSET
+
+
+def set_min_log_level(log_level: str | int) -> None:
+    """
+    Запомнить минимальный уровень логирования.
+
+    Вызывается из setup_logging вместе с make_filtering_bound_logger,
+    чтобы хелперы отсекали выключенные уровни до построения полей.
+
+    Args:
+        log_level: Уровень (DEBUG, INFO, ... или число logging).
+    """
+    global _min_level
+    if isinstance(log_level, str):
+        log_level = logging.getLevelName(log_level)
+    _min_level = log_level
+
+
+def _is_enabled(level: int) -> bool:
+    """
+    Проверить, будет ли обработано событие уровня level.
+
+    Args:
+        level: Уровень logging (logging.DEBUG, logging.INFO, ...).
+
+    Returns:
+        True, если уровень не ниже заданного в setup_logging.
+    """
+    return level >= _min_level
+
+
 def get_error_code_from_status(status_code: int, error_type: str | None = None) -> str:
     """
     Определить стандартный error_code по HTTP статусу и типу ошибки.
@@ -137,6 +179,9 @@ def log_validation_errors(
         log_validation_errors(logger, errors, source="business_logic")
         ```
     """
+    if not _is_enabled(logging.WARNING):
+        return
+
     # Нормализация формата ошибок
     if isinstance(errors, list):
         # Pydantic format: [{"loc": [...], "msg": "...", "type": "..."}]
@@ -149,24 +194,17 @@ def log_validation_errors(
             if err.get("type"):
                 error_types.append(err["type"])
 
-        log_data: dict[str, Any] = {
-            "invalid_fields": invalid_fields,
-            "error_count": len(errors),
-            "source": source,
-        }
+        error_count = len(errors)
         if error_types:
-            log_data["error_types"] = list(set(error_types))
+            kwargs.setdefault("error_types", list(set(error_types)))
     else:
         # Simple dict format: {"field": ["error1", "error2"]}
-        log_data = {
-            "invalid_fields": list(errors.keys()),
-            "error_count": sum(len(v) if isinstance(v, list) else 1 for v in errors.values()),
-            "source": source,
-        }
+        invalid_fields = list(errors.keys())
+        error_count = sum(len(v) if isinstance(v, list) else 1 for v in errors.values())
 
-    log_data.update(kwargs)
-
-    logger.warning("validation_failed", **log_data)
+    kwargs.setdefault("invalid_fields", invalid_fields)
+    kwargs.setdefault("error_count", error_count)
+    logger.warning("validation_failed", source=source, **kwargs)
 
 
 # === Логирование rate limiting ===
@@ -208,25 +246,23 @@ def log_rate_limit_status(
     """
     usage_percent = round((1 - remaining / limit) * 100, 1) if limit > 0 else 100
 
-    log_data: dict[str, Any] = {
-        "limit": limit,
-        "remaining": remaining,
-        "usage_percent": usage_percent,
-    }
+    # WARNING если использовано > 80%, INFO если > 50%
+    approaching = usage_percent >= 80
+    if not _is_enabled(logging.WARNING if approaching else logging.INFO):
+        return
 
     if reset_at:
-        log_data["reset_at"] = reset_at
+        kwargs["reset_at"] = reset_at
 
     if identifier:
-        log_data["identifier"] = identifier
+        kwargs["identifier"] = identifier
 
-    log_data.update(kwargs)
+    kwargs.setdefault("usage_percent", usage_percent)
 
-    # WARNING если использовано > 80%, INFO если > 50%
-    if usage_percent >= 80:
-        logger.warning("rate_limit_approaching", **log_data)
+    if approaching:
+        logger.warning("rate_limit_approaching", limit=limit, remaining=remaining, **kwargs)
     else:
-        logger.info("rate_limit_status", **log_data)
+        logger.info("rate_limit_status", limit=limit, remaining=remaining, **kwargs)
 
 
 def log_rate_limit_exceeded(
@@ -248,22 +284,19 @@ def log_rate_limit_exceeded(
         retry_after: Секунд до повтора.
         **kwargs: Дополнительные поля для лога.
     """
-    log_data: dict[str, Any] = {
-        "limit": limit,
-    }
+    if not _is_enabled(logging.WARNING):
+        return
 
     if reset_at:
-        log_data["reset_at"] = reset_at
+        kwargs["reset_at"] = reset_at
 
     if identifier:
-        log_data["identifier"] = identifier
+        kwargs["identifier"] = identifier
 
     if retry_after is not None:
-        log_data["retry_after"] = retry_after
-
-    log_data.update(kwargs)
+        kwargs["retry_after"] = retry_after
 
-    logger.warning("rate_limit_exceeded", **log_data)
+    logger.warning("rate_limit_exceeded", limit=limit, **kwargs)
 
 
 # === Логирование контекста авторизации ===
@@ -305,24 +338,23 @@ def log_auth_context(
             return user
         ```
     """
-    log_data: dict[str, Any] = {}
+    if not _is_enabled(logging.DEBUG):
+        return
 
     if user_id:
-        log_data["user_id"] = user_id
+        kwargs["user_id"] = user_id
 
     if roles:
-        log_data["roles"] = roles
+        kwargs["roles"] = roles
 
     if permissions:
-        log_data["permissions"] = permissions
+        kwargs["permissions"] = permissions
 
     if auth_method:
-        log_data["auth_method"] = auth_method
+        kwargs["auth_method"] = auth_method
 
-    log_data.update(kwargs)
-
-    if log_data:
-        logger.debug("auth_context_set", **log_data)
+    if kwargs:
+        logger.debug("auth_context_set", **kwargs)
 
 
 # === Логирование решений ===
@@ -367,29 +399,24 @@ def log_decision(
             raise FraudDetectedError(...)
         ```
     """
-    log_data: dict[str, Any] = {
-        "decision": decision,
-        "reason": reason,
-    }
+    # Уровень логирования зависит от решения
+    is_warning = decision in ("REJECT", "RETRY", "FALLBACK")
+    if not _is_enabled(logging.WARNING if is_warning else logging.INFO):
+        return
 
     if evaluated_conditions:
-        log_data["evaluated_conditions"] = evaluated_conditions
+        kwargs["evaluated_conditions"] = evaluated_conditions
 
     if threshold_values:
-        log_data["threshold_values"] = threshold_values
+        kwargs["threshold_values"] = threshold_values
 
     if actual_values:
-        log_data["actual_values"] = actual_values
-
-    log_data.update(kwargs)
+        kwargs["actual_values"] = actual_values
 
-    # Уровень логирования зависит от решения
-    if decision == "REJECT":
-        logger.warning("decision_made", **log_data)
-    elif decision in ("RETRY", "FALLBACK"):
-        logger.warning("decision_made", **log_data)
+    if is_warning:
+        logger.warning("decision_made", decision=decision, reason=reason, **kwargs)
     else:
-        logger.info("decision_made", **log_data)
+        logger.info("decision_made", decision=decision, reason=reason, **kwargs)
 
 
 # === Логирование переходов состояний ===
@@ -438,21 +465,22 @@ def log_state_change(
         )
         ```
     """
-    log_data: dict[str, Any] = {
-        "entity_type": entity_type,
-        "entity_id": entity_id,
-        "from_state": from_state,
-        "to_state": to_state,
-        "transition_reason": transition_reason,
-        "is_terminal_state": is_terminal_state,
-    }
+    if not _is_enabled(logging.INFO):
+        return
 
     if valid_next_states is not None:
-        log_data["valid_next_states"] = valid_next_states
-
-    log_data.update(kwargs)
+        kwargs["valid_next_states"] = valid_next_states
 
-    logger.info("state_changed", **log_data)
+    logger.info(
+        "state_changed",
+        entity_type=entity_type,
+        entity_id=entity_id,
+        from_state=from_state,
+        to_state=to_state,
+        transition_reason=transition_reason,
+        is_terminal_state=is_terminal_state,
+        **kwargs,
+    )
 
 
 def log_invalid_state_transition(
@@ -536,14 +564,15 @@ def log_external_call_start(
             )
         ```
     """
-    logger.debug(
-        "external_call_started",
-        service=service,
-        operation=operation,
-        method=method,
-        endpoint=endpoint,
-        **kwargs,
-    )
+    if _is_enabled(logging.DEBUG):
+        logger.debug(
+            "external_call_started",
+            service=service,
+            operation=operation,
+            method=method,
+            endpoint=endpoint,
+            **kwargs,
+        )
     return time.perf_counter()
 
 
@@ -570,31 +599,86 @@ def log_external_call_end(
         is_retryable: Можно ли повторить запрос.
         **kwargs: Дополнительные поля для лога.
     """
-    duration_ms = (time.perf_counter() - start_time) * 1000
+    # Уровень логирования зависит от результата
+    # Log-Driven Design: успешные вызовы логируются на INFO для полной трассировки
+    is_warning = bool(error_type) or bool(status_code and status_code >= 400)
+    if not _is_enabled(logging.WARNING if is_warning else logging.INFO):
+        return
 
-    log_data: dict[str, Any] = {
-        "service": service,
-        "operation": operation,
-        "duration_ms": round(duration_ms, 2),
-    }
+    kwargs.setdefault("duration_ms", round((time.perf_counter() - start_time) * 1000, 2))
 
     if status_code is not None:
-        log_data["status_code"] = status_code
+        kwargs["status_code"] = status_code
 
     if error_type is not None:
-        log_data["error_type"] = error_type
-        log_data["is_retryable"] = is_retryable
+        kwargs["error_type"] = error_type
+        kwargs["is_retryable"] = is_retryable
 
-    log_data.update(kwargs)
-
-    # Уровень логирования зависит от результата
-    # Log-Driven Design: успешные вызовы логируются на INFO для полной трассировки
     if error_type:
-        logger.warning("external_call_failed", **log_data)
-    elif status_code and status_code >= 400:
-        logger.warning("external_call_completed", **log_data)
+        logger.warning("external_call_failed", service=service, operation=operation, **kwargs)
+    elif is_warning:
+        logger.warning("external_call_completed", service=service, operation=operation, **kwargs)
     else:
-        logger.info("external_call_completed", **log_data)
+        logger.info("external_call_completed", service=service, operation=operation, **kwargs)
+
+
+def log_circuit_breaker_state_change(
+    logger: structlog.BoundLogger,
+    service: str,
+    from_state: str,
+    to_state: str,
+    reason: str,
+    failure_count: int | None = None,
+    recovery_timeout_seconds: float | None = None,
+    **kwargs: Any,
+) -> None:
+    """
+    Залогировать переход состояния circuit breaker.
+
+    Args:
+        logger: Логгер structlog.
+        service: Имя сервиса, к которому относится breaker.
+        from_state: Предыдущее состояние (closed/open/half_open).
+        to_state: Новое состояние.
+        reason: Причина перехода (failure_threshold_reached,
+            recovery_timeout_elapsed, trial_succeeded, trial_failed).
+        failure_count: Количество подряд идущих ошибок.
+        recovery_timeout_seconds: Время до пробного запроса (для open).
+        **kwargs: Дополнительные поля для лога.
+
+    Example:
+        ```python
+        log_circuit_breaker_state_change(
+            logger,
+            service="users-data",
+            from_state="closed",
+            to_state="open",
+            reason="failure_threshold_reached",
+            failure_count=5,
+            recovery_timeout_seconds=30.0,
+        )
+        ```
+    """
+    # open — деградация зависимости, остальные переходы — восстановление
+    level = logging.WARNING if to_state == "open" else logging.INFO
+    if not _is_enabled(level):
+        return
+
+    if failure_count is not None:
+        kwargs["failure_count"] = failure_count
+
+    if recovery_timeout_seconds is not None:
+        kwargs["recovery_timeout_seconds"] = recovery_timeout_seconds
+
+    logger.log(
+        level,
+        "circuit_breaker_state_changed",
+        service=service,
+        from_state=from_state,
+        to_state=to_state,
+        reason=reason,
+        **kwargs,
+    )
 
 
 # === Логирование операций с БД ===
@@ -640,22 +724,23 @@ def log_db_operation(
         )
         ```
     """
-    log_data: dict[str, Any] = {
-        "operation": operation,
-        "table": table,
-        "query_type": query_type,
-        "duration_ms": round(duration_ms, 2),
-    }
+    if not _is_enabled(logging.DEBUG):
+        return
 
     if affected_rows is not None:
-        log_data["affected_rows"] = affected_rows
+        kwargs["affected_rows"] = affected_rows
 
     if found is not None:
-        log_data["found"] = found
+        kwargs["found"] = found
 
-    log_data.update(kwargs)
-
-    logger.debug("db_operation", **log_data)
+    logger.debug(
+        "db_operation",
+        operation=operation,
+        table=table,
+        query_type=query_type,
+        duration_ms=round(duration_ms, 2),
+        **kwargs,
+    )
 
 
 def log_slow_query(
@@ -689,6 +774,35 @@ def log_slow_query(
     )
 
 
+def log_n_plus_one_suspected(
+    logger: structlog.BoundLogger,
+    statement: str,
+    count: int,
+    threshold: int,
+    **kwargs: Any,
+) -> None:
+    """
+    Залогировать подозрение на N+1 (повтор одной формы запроса).
+
+    Вызывается когда в одном HTTP запросе форма SQL запроса
+    повторилась больше threshold раз — кандидат на get_many/JOIN.
+
+    Args:
+        logger: Логгер structlog.
+        statement: Нормализованный SQL (без параметров).
+        count: Количество повторов.
+        threshold: Допустимое количество повторов.
+        **kwargs: Дополнительные поля для лога.
+    """
+    logger.warning(
+        "n_plus_one_suspected",
+        statement=statement,
+        count=count,
+        threshold=threshold,
+        **kwargs,
+    )
+
+
 # === Логирование запуска сервиса ===
 
 
@@ -737,27 +851,28 @@ def log_service_started(
         )
         ```
     """
-    log_data: dict[str, Any] = {
-        "service_name": service_name,
-        "service_version": service_version,
-        "environment": environment,
-    }
+    if not _is_enabled(logging.INFO):
+        return
 
     if python_version:
-        log_data["python_version"] = python_version
+        kwargs["python_version"] = python_version
 
     if feature_flags:
-        log_data["feature_flags"] = feature_flags
+        kwargs["feature_flags"] = feature_flags
 
     if dependencies:
-        log_data["dependencies"] = dependencies
+        kwargs["dependencies"] = dependencies
 
     if config_hash:
-        log_data["config_hash"] = config_hash
+        kwargs["config_hash"] = config_hash
 
-    log_data.update(kwargs)
-
-    logger.info("service_started", **log_data)
+    logger.info(
+        "service_started",
+        service_name=service_name,
+        service_version=service_version,
+        environment=environment,
+        **kwargs,
+    )
 
 
 def log_service_stopped(
@@ -777,17 +892,13 @@ def log_service_stopped(
         uptime_seconds: Время работы в секундах.
         **kwargs: Дополнительные поля для лога.
     """
-    log_data: dict[str, Any] = {
-        "service_name": service_name,
-        "reason": reason,
-    }
+    if not _is_enabled(logging.INFO):
+        return
 
     if uptime_seconds is not None:
-        log_data["uptime_seconds"] = round(uptime_seconds, 2)
-
-    log_data.update(kwargs)
+        kwargs["uptime_seconds"] = round(uptime_seconds, 2)
 
-    logger.info("service_stopped", **log_data)
+    logger.info("service_stopped", service_name=service_name, reason=reason, **kwargs)
 
 
 # === Логирование HTTP запросов (для middleware) ===
@@ -842,41 +953,37 @@ def log_request_started(
         )
         ```
     """
-    log_data: dict[str, Any] = {
-        "method": method,
-        "path": path,
-    }
+    if not _is_enabled(logging.INFO):
+        return time.perf_counter()
 
     if query_params:
-        log_data["query_params"] = query_params
+        kwargs["query_params"] = query_params
 
     if path_params:
-        log_data["path_params"] = path_params
+        kwargs["path_params"] = path_params
 
     if request_body_size is not None:
-        log_data["request_body_size"] = request_body_size
+        kwargs["request_body_size"] = request_body_size
 
     if client_ip:
-        log_data["client_ip"] = client_ip
+        kwargs["client_ip"] = client_ip
 
     if user_agent:
-        log_data["user_agent"] = user_agent
+        kwargs["user_agent"] = user_agent
 
     if api_version:
-        log_data["api_version"] = api_version
+        kwargs["api_version"] = api_version
 
     # auth_context: {user_id, roles, permissions}
     if auth_context:
-        log_data["auth_context"] = auth_context
+        kwargs["auth_context"] = auth_context
 
     # Rate limit информация (если приближается к лимиту)
     if rate_limit_remaining is not None and rate_limit_limit is not None:
-        log_data["rate_limit_remaining"] = rate_limit_remaining
-        log_data["rate_limit_limit"] = rate_limit_limit
-
-    log_data.update(kwargs)
+        kwargs["rate_limit_remaining"] = rate_limit_remaining
+        kwargs["rate_limit_limit"] = rate_limit_limit
 
-    logger.info("request_started", **log_data)
+    logger.info("request_started", method=method, path=path, **kwargs)
     return time.perf_counter()
 
 
@@ -918,34 +1025,33 @@ def log_request_completed(
         )
         ```
     """
-    duration_ms = (time.perf_counter() - start_time) * 1000
+    if status_code >= 500:
+        level = logging.ERROR
+    elif status_code >= 400:
+        level = logging.WARNING
+    else:
+        level = logging.INFO
+    if not _is_enabled(level):
+        return
 
-    log_data: dict[str, Any] = {
-        "method": method,
-        "path": path,
-        "status_code": status_code,
-        "duration_ms": round(duration_ms, 2),
-    }
+    kwargs.setdefault("duration_ms", round((time.perf_counter() - start_time) * 1000, 2))
 
     if response_body_size is not None:
-        log_data["response_body_size"] = response_body_size
+        kwargs["response_body_size"] = response_body_size
 
     # Добавляем error_code для 4xx/5xx ответов
     if status_code >= 400:
-        if error_code:
-            log_data["error_code"] = error_code
-        else:
-            # Автоматически определяем error_code по статусу
-            log_data["error_code"] = get_error_code_from_status(status_code)
+        # Без явного error_code определяем его по статусу
+        kwargs["error_code"] = error_code or get_error_code_from_status(status_code)
 
         if error_message:
-            log_data["error_message"] = error_message
+            kwargs["error_message"] = error_message
 
-    log_data.update(kwargs)
-
-    if status_code >= 500:
-        logger.error("request_completed", **log_data)
-    elif status_code >= 400:
-        logger.warning("request_completed", **log_data)
-    else:
-        logger.info("request_completed", **log_data)
+    logger.log(
+        level,
+        "request_completed",
+        method=method,
+        path=path,
+        status_code=status_code,
+        **kwargs,
+    )
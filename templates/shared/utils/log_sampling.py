@@ -0,0 +1,222 @@
+"""
+Сэмплирование высокочастотных событий Log-Driven Design.
+
+LogSampler оборачивает renderer (последний процессор structlog):
+- Частота по имени события: rates={"request_started": 0.01} — из
+  успешных запросов сохраняется 1%. Решение детерминировано по
+  request_id: выбранный запрос сохраняется целиком.
+- Ошибки, warning+, status_code >= 400 и медленные события
+  (duration_ms >= slow_ms) сохраняются всегда.
+- Tail-based: невыбранные события запроса буферизуются по request_id;
+  если запрос завершился ошибкой, буфер выводится перед ошибкой,
+  иначе отбрасывается на событии завершения (request_completed).
+- Дедупликация: одинаковые warning в пределах dedup_window_seconds
+  выводятся один раз, следующее после окна — с полем repeated
+  (error и выше не подавляются).
+
+Выборка по запросу и tail-буфер требуют request_id в контексте structlog:
+его привязывают RequestLoggingMiddleware (Business API),
+RequestContextMiddleware (Data API) и middleware бота. Без request_id
+решение принимается по каждому событию случайно.
+
+Использование:
+    ```python
+    processors = shared_processors + [
+        LogSampler(structlog.processors.JSONRenderer(), rates=DEFAULT_SAMPLE_RATES),
+    ]
+    ```
+"""
+
+import random
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable
+
+from structlog import DropEvent
+
+
+# Частоты по умолчанию: событие на каждый запрос/запрос к БД/update
+DEFAULT_SAMPLE_RATES: dict[str, float] = {
+    "request_started": 0.01,
+    "request_completed": 0.01,
+    "db_operation": 0.01,
+    "external_call_completed": 0.01,
+    "telegram_update_received": 0.01,
+    "telegram_update_processed": 0.01,
+}
+
+# События завершения запроса: буфер запроса после них не нужен
+REQUEST_END_EVENTS: frozenset[str] = frozenset({
+    "request_completed",
+    "telegram_update_processed",
+})
+
+# Уровни, которые сохраняются всегда
+_IMPORTANT_LEVELS = frozenset({"warning", "warn", "error", "critical", "exception", "fatal"})
+
+# Уровни, повторы которых подавляются
+_DEDUP_LEVELS = frozenset({"warning", "warn"})
+
+# Поля, различающиеся у одинаковых предупреждений (не входят в ключ дедупликации)
+_VOLATILE_FIELDS = frozenset({
+    "timestamp",
+    "request_id",
+    "correlation_id",
+    "causation_id",
+    "user_id",
+    "duration_ms",
+    "lineno",
+})
+
+_HASH_BUCKETS = 10_000
+
+
+class LogSampler:
+    """
+    Renderer-обёртка: сэмплирование, tail-буфер по request_id, дедупликация.
+
+    Attributes:
+        rates: Доля сохраняемых событий по имени (остальные — 100%).
+        slow_ms: Порог duration_ms, с которого событие сохраняется всегда.
+        max_buffered_requests: Максимум запросов в tail-буфере.
+        max_events_per_request: Максимум событий одного запроса в буфере.
+        dedup_window_seconds: Окно дедупликации warning (0 — выключено).
+        sampled_out: Количество отброшенных событий.
+    """
+
+    def __init__(
+        self,
+        renderer: Callable[[Any, str, dict[str, Any]], Any],
+        rates: dict[str, float] | None = None,
+        slow_ms: float = 1000.0,
+        max_buffered_requests: int = 1000,
+        max_events_per_request: int = 50,
+        dedup_window_seconds: float = 60.0,
+    ) -> None:
+        """
+        Инициализировать sampler.
+
+        Args:
+            renderer: Финальный renderer (JSONRenderer, ConsoleRenderer).
+            rates: Доля сохраняемых событий по имени.
+            slow_ms: Порог duration_ms, с которого событие сохраняется всегда.
+            max_buffered_requests: Максимум запросов в tail-буфере.
+            max_events_per_request: Максимум событий одного запроса в буфере.
+            dedup_window_seconds: Окно дедупликации warning.
+        """
+        self.renderer = renderer
+        self.rates = DEFAULT_SAMPLE_RATES if rates is None else rates
+        self.slow_ms = slow_ms
+        self.max_buffered_requests = max_buffered_requests
+        self.max_events_per_request = max_events_per_request
+        self.dedup_window_seconds = dedup_window_seconds
+        self.sampled_out = 0
+
+        self._buffers: OrderedDict[str, list[tuple[str, dict[str, Any]]]] = OrderedDict()
+        # ключ предупреждения → (время первого вывода, подавлено повторов)
+        self._seen_warnings: dict[int, list[float | int]] = {}
+
+    def __call__(self, logger: Any, method_name: str, event_dict: dict[str, Any]) -> Any:
+        """Принять решение по событию и отрендерить сохраняемое."""
+        event = event_dict.get("event")
+        request_id = event_dict.get("request_id")
+
+        if self._is_important(method_name, event_dict):
+            if (
+                self.dedup_window_seconds
+                and method_name in _DEDUP_LEVELS
+                and self._is_duplicate(method_name, event_dict)
+            ):
+                if request_id is not None and event in REQUEST_END_EVENTS:
+                    # Запрос завершён, а повтор подавлен — буфер больше не нужен
+                    self._buffers.pop(request_id, None)
+                raise DropEvent
+            if request_id is not None:
+                self._flush_request(logger, request_id)
+            return self.renderer(logger, method_name, event_dict)
+
+        rate = self.rates.get(event, 1.0)
+        if rate >= 1.0 or self._is_sampled(request_id, rate):
+            if request_id is not None and event in REQUEST_END_EVENTS:
+                # Выбранный запрос выводится целиком
+                self._flush_request(logger, request_id)
+            return self.renderer(logger, method_name, event_dict)
+
+        self.sampled_out += 1
+        if request_id is not None:
+            if event in REQUEST_END_EVENTS:
+                self._buffers.pop(request_id, None)
+            else:
+                self._buffer(request_id, method_name, event_dict)
+        raise DropEvent
+
+    def _is_important(self, method_name: str, event_dict: dict[str, Any]) -> bool:
+        """Событие сохраняется всегда (ошибка, warning+, 4xx/5xx, медленное)."""
+        if method_name in _IMPORTANT_LEVELS or event_dict.get("level") in _IMPORTANT_LEVELS:
+            return True
+        status_code = event_dict.get("status_code")
+        if isinstance(status_code, int) and status_code >= 400:
+            return True
+        duration_ms = event_dict.get("duration_ms")
+        return isinstance(duration_ms, (int, float)) and duration_ms >= self.slow_ms
+
+    @staticmethod
+    def _is_sampled(request_id: Any, rate: float) -> bool:
+        """
+        Попадает ли событие в выборку.
+
+        По request_id решение одинаково для всех событий запроса,
+        без request_id — случайное.
+        """
+        if request_id is None:
+            return random.random() < rate
+        bucket = zlib.crc32(str(request_id).encode()) % _HASH_BUCKETS
+        return bucket < rate * _HASH_BUCKETS
+
+    def _buffer(self, request_id: str, method_name: str, event_dict: dict[str, Any]) -> None:
+        """Отложить событие запроса до его завершения."""
+        events = self._buffers.get(request_id)
+        if events is None:
+            if len(self._buffers) >= self.max_buffered_requests:
+                self._buffers.popitem(last=False)
+            events = self._buffers[request_id] = []
+        if len(events) < self.max_events_per_request:
+            events.append((method_name, event_dict))
+
+    def _flush_request(self, logger: Any, request_id: str) -> None:
+        """Вывести отложенные события запроса (до текущего события)."""
+        events = self._buffers.pop(request_id, None)
+        if not events:
+            return
+        for method_name, event_dict in events:
+            self.sampled_out -= 1
+            logger.msg(self.renderer(logger, method_name, event_dict))
+
+    def _is_duplicate(self, method_name: str, event_dict: dict[str, Any]) -> bool:
+        """
+        Проверить повтор предупреждения в окне дедупликации.
+
+        Первое вне окна событие получает repeated — число подавленных повторов.
+        """
+        try:
+            key = hash((method_name, tuple(sorted(
+                (name, repr(value))
+                for name, value in event_dict.items()
+                if name not in _VOLATILE_FIELDS
+            ))))
+        except TypeError:
+            return False
+
+        now = time.monotonic()
+        seen = self._seen_warnings.get(key)
+        if seen is not None and now - seen[0] < self.dedup_window_seconds:
+            seen[1] += 1
+            return True
+
+        if seen is not None and seen[1]:
+            event_dict["repeated"] = seen[1]
+        if len(self._seen_warnings) >= self.max_buffered_requests:
+            self._seen_warnings.clear()
+        self._seen_warnings[key] = [now, 0]
+        return False
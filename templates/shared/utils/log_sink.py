@@ -0,0 +1,278 @@
+"""
+Неблокирующий вывод логов.
+
+PrintLoggerFactory пишет в stdout синхронно в потоке вызова: при
+заполненном pipe (медленный сборщик логов) блокируется event loop.
+
+AsyncLogSink:
+- строка рендерится процессорами structlog в потоке вызова
+- кладётся в ограниченный кольцевой буфер (deque)
+- фоновый поток пишет пачками по batch_size строк
+- при переполнении: policy="drop" вытесняет старейшие строки,
+  policy="block" ждёт до block_timeout_seconds, затем вытесняет
+- счётчик dropped и событие log_events_dropped в самом потоке логов
+
+Использование:
+    ```python
+    structlog.configure(
+        ...,
+        logger_factory=create_logger_factory(async_sink=True, policy="drop"),
+    )
+    ```
+"""
+
+import atexit
+import json
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Literal, TextIO
+
+import structlog
+
+
+SinkPolicy = Literal["drop", "block"]
+
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.2
+
+# Текущий sink процесса (один на процесс, пересоздаётся в setup_logging)
+_log_sink: "AsyncLogSink | None" = None
+
+
+class AsyncLogSink:
+    """
+    Кольцевой буфер строк лога с записью из фонового потока.
+
+    Attributes:
+        max_queue_size: Ёмкость буфера (строк).
+        batch_size: Строк на одну запись в поток вывода.
+        flush_interval_seconds: Максимальная задержка записи.
+        policy: Поведение при переполнении (drop | block).
+        block_timeout_seconds: Ожидание места при policy="block".
+        dropped: Количество вытесненных строк (приблизительно
+            при записи из нескольких потоков).
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        policy: SinkPolicy = "drop",
+        block_timeout_seconds: float = 1.0,
+    ) -> None:
+        """
+        Инициализировать sink и запустить фоновый поток.
+
+        Args:
+            stream: Поток вывода (по умолчанию sys.stdout).
+            max_queue_size: Ёмкость буфера (строк).
+            batch_size: Строк на одну запись в поток вывода.
+            flush_interval_seconds: Максимальная задержка записи.
+            policy: Поведение при переполнении (drop | block).
+            block_timeout_seconds: Ожидание места при policy="block".
+        """
+        self.stream = stream or sys.stdout
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.policy = policy
+        self.block_timeout_seconds = block_timeout_seconds
+        self.dropped = 0
+
+        self._buffer: deque[str] = deque(maxlen=max_queue_size)
+        self._wakeup = threading.Event()
+        self._drained = threading.Event()
+        self._closed = False
+        self._reported_dropped = 0
+        self._thread = threading.Thread(
+            target=self._run,
+            name="log-sink",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        """
+        Поставить строку в очередь (не блокирует при policy="drop").
+
+        Args:
+            line: Отрендеренная строка лога.
+        """
+        buffer = self._buffer
+        if len(buffer) >= self.max_queue_size:
+            if self.policy == "block":
+                deadline = time.monotonic() + self.block_timeout_seconds
+                while len(buffer) >= self.max_queue_size and time.monotonic() < deadline:
+                    self._wakeup.set()
+                    self._drained.wait(0.01)
+            if len(buffer) >= self.max_queue_size:
+                # deque(maxlen) вытеснит старейшую строку
+                self.dropped += 1
+
+        buffer.append(line)
+        if len(buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    def _run(self) -> None:
+        """Цикл фонового потока: запись пачками."""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            self._flush()
+
+    def _flush(self) -> None:
+        """Записать всё содержимое буфера пачками по batch_size."""
+        buffer = self._buffer
+        while buffer:
+            batch = []
+            while buffer and len(batch) < self.batch_size:
+                batch.append(buffer.popleft())
+            self._write_batch(batch)
+            self._drained.set()
+            self._drained.clear()
+
+        if self.dropped != self._reported_dropped:
+            # Через structlog нельзя — событие снова попадёт в этот sink
+            self._write_batch([json.dumps({
+                "event": "log_events_dropped",
+                "level": "warning",
+                "dropped": self.dropped - self._reported_dropped,
+                "dropped_total": self.dropped,
+                "policy": self.policy,
+            })])
+            self._reported_dropped = self.dropped
+
+    def _write_batch(self, batch: list[str]) -> None:
+        """
+        Записать пачку строк одним вызовом write.
+
+        Args:
+            batch: Строки лога.
+        """
+        try:
+            self.stream.write("\n".join(batch) + "\n")
+            self.stream.flush()
+        except (OSError, ValueError):
+            # Закрытый stdout при завершении процесса — логи не критичны
+            self.dropped += len(batch)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Остановить фоновый поток и дописать буфер.
+
+        Args:
+            timeout: Максимальное ожидание потока.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._flush()
+
+
+class AsyncSinkLogger:
+    """
+    Logger для structlog, передающий отрендеренные строки в AsyncLogSink.
+
+    Аналог structlog.PrintLogger без синхронной записи.
+    """
+
+    def __init__(self, sink: AsyncLogSink) -> None:
+        """
+        Инициализировать logger.
+
+        Args:
+            sink: Sink для строк лога.
+        """
+        self._sink = sink
+
+    def msg(self, message: str | bytes) -> None:
+        """Поставить строку лога в очередь."""
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+        self._sink.write(message)
+
+    log = debug = info = warn = warning = err = error = critical = exception = failure = fatal = msg
+
+
+class AsyncLoggerFactory:
+    """Фабрика loggers для structlog.configure(logger_factory=...)."""
+
+    def __init__(self, sink: AsyncLogSink) -> None:
+        """
+        Инициализировать фабрику.
+
+        Args:
+            sink: Общий sink процесса.
+        """
+        self._logger = AsyncSinkLogger(sink)
+
+    def __call__(self, *args: Any) -> AsyncSinkLogger:
+        """Вернуть общий logger (без состояния, один на процесс)."""
+        return self._logger
+
+
+def start_log_sink(**kwargs: Any) -> AsyncLogSink:
+    """
+    Создать sink процесса (предыдущий закрывается с записью буфера).
+
+    Args:
+        **kwargs: Параметры AsyncLogSink.
+
+    Returns:
+        Запущенный sink.
+    """
+    global _log_sink
+    if _log_sink is not None:
+        _log_sink.close()
+    _log_sink = AsyncLogSink(**kwargs)
+    return _log_sink
+
+
+def get_log_sink() -> AsyncLogSink | None:
+    """
+    Получить sink процесса (для dropped в метриках/health).
+
+    Returns:
+        Sink или None, если используется синхронный вывод.
+    """
+    return _log_sink
+
+
+def close_log_sink() -> None:
+    """Дописать буфер и остановить sink процесса."""
+    if _log_sink is not None:
+        _log_sink.close()
+
+
+def create_logger_factory(
+    async_sink: bool = False,
+    policy: SinkPolicy = "drop",
+    max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+) -> Callable[..., Any]:
+    """
+    Выбрать logger_factory для structlog.configure.
+
+    Args:
+        async_sink: Неблокирующий вывод через AsyncLogSink.
+        policy: Поведение при переполнении (drop | block).
+        max_queue_size: Ёмкость буфера (строк).
+
+    Returns:
+        AsyncLoggerFactory или structlog.PrintLoggerFactory.
+    """
+    if not async_sink:
+        return structlog.PrintLoggerFactory()
+    return AsyncLoggerFactory(
+        start_log_sink(policy=policy, max_queue_size=max_queue_size),
+    )
+
+
+# Буфер дописывается при нормальном завершении процесса
+atexit.register(close_log_sink)
@@ -10,11 +10,17 @@
 
 import logging
 import re
-from typing import Any
+import time
+from functools import lru_cache
+from typing import Any, Literal
 
 import structlog
 from structlog.types import Processor
 
+from .log_helpers import set_min_log_level
+from .log_sampling import LogSampler
+from .log_sink import SinkPolicy, create_logger_factory
+
 
 # === Конфигурация секретных данных ===
 
@@ -86,6 +92,62 @@ SENSITIVE_VALUE_PATTERNS: list[re.Pattern] = [
 # Значение для замены секретов
 REDACTED_VALUE = "***REDACTED***"
 
+# Все паттерны одним регулярным выражением: один проход по строке вместо
+# пяти. Флаги паттернов сохраняются локально через (?i:...)
+_SENSITIVE_VALUE_REGEX = re.compile("|".join(
+    f"(?i:{pattern.pattern})" if pattern.flags & re.IGNORECASE else f"(?:{pattern.pattern})"
+    for pattern in SENSITIVE_VALUE_PATTERNS
+))
+
+# Строки короче не совпадают ни с одним паттерном ("://a:b@" — 7 символов)
+_MIN_SENSITIVE_VALUE_LENGTH = 7
+
+# Стандартные поля, значения которых не проверяются паттернами.
+# ВАЖНО: не подставлять секреты в текст события (event) — он не сканируется
+SAFE_FIELD_NAMES: frozenset[str] = frozenset({
+    "event",
+    "level",
+    "timestamp",
+    "logger",
+    "service",
+    "module",
+    "func_name",
+    "lineno",
+    "request_id",
+    "correlation_id",
+    "causation_id",
+    "user_id",
+    "entity_id",
+    "duration_ms",
+    "status_code",
+    "method",
+    "operation",
+    "table",
+})
+
+# Решение по имени поля
+_SCAN_VALUE = 0
+_REDACT_VALUE = 1
+_SKIP_VALUE = 2
+
+
+@lru_cache(maxsize=4096)
+def _field_decision(field_name: str) -> int:
+    """
+    Получить решение для поля по имени (с кэшем на имя).
+
+    Args:
+        field_name: Имя поля.
+
+    Returns:
+        _REDACT_VALUE, _SKIP_VALUE или _SCAN_VALUE.
+    """
+    if _is_sensitive_field(field_name):
+        return _REDACT_VALUE
+    if field_name in SAFE_FIELD_NAMES:
+        return _SKIP_VALUE
+    return _SCAN_VALUE
+
 
 def _is_sensitive_field(field_name: str) -> bool:
     """
@@ -105,51 +167,63 @@ def _mask_sensitive_value(value: Any) -> Any:
     """
     Замаскировать секретное значение.
 
+    Вложенные dict/list/tuple копируются только при наличии секрета —
+    объекты вызывающего кода не изменяются.
+
     Args:
         value: Значение для маскировки.
 
     Returns:
-        Замаскированное значение или оригинал если не секрет.
+        Замаскированное значение или тот же объект, если секретов нет.
     """
-    if value is None:
-        return value
-
     if isinstance(value, str):
-        # Проверяем паттерны в строковых значениях
-        for pattern in SENSITIVE_VALUE_PATTERNS:
-            if pattern.search(value):
-                return REDACTED_VALUE
+        if (
+            len(value) >= _MIN_SENSITIVE_VALUE_LENGTH
+            and _SENSITIVE_VALUE_REGEX.search(value)
+        ):
+            return REDACTED_VALUE
         return value
 
     if isinstance(value, dict):
         return _sanitize_dict(value)
 
     if isinstance(value, (list, tuple)):
-        return type(value)(_mask_sensitive_value(item) for item in value)
+        masked: list[Any] | None = None
+        for index, item in enumerate(value):
+            masked_item = _mask_sensitive_value(item)
+            if masked_item is not item:
+                if masked is None:
+                    masked = list(value)
+                masked[index] = masked_item
+        if masked is None:
+            return value
+        return masked if type(value) is list else type(value)(masked)
 
     return value
 
 
-def _sanitize_dict(data: dict[str, Any]) -> dict[str, Any]:
+def _sanitize_dict(data: dict[str, Any], in_place: bool = False) -> dict[str, Any]:
     """
     Рекурсивно очистить словарь от секретных данных.
 
     Args:
         data: Словарь для очистки.
+        in_place: Изменять data (event_dict процессора) вместо копии.
 
     Returns:
-        Очищенный словарь.
+        Очищенный словарь; без секретов и in_place=False — тот же объект.
     """
-    result = {}
+    result = data
     for key, value in data.items():
-        if _is_sensitive_field(key):
-            result[key] = REDACTED_VALUE
-        elif isinstance(value, dict):
-            result[key] = _sanitize_dict(value)
-        elif isinstance(value, (list, tuple)):
-            result[key] = type(value)(_mask_sensitive_value(item) for item in value)
-        else:
-            result[key] = _mask_sensitive_value(value)
+        decision = _field_decision(key) if isinstance(key, str) else _SCAN_VALUE
+        if decision == _SKIP_VALUE:
+            continue
+
+        masked = REDACTED_VALUE if decision == _REDACT_VALUE else _mask_sensitive_value(value)
+        if masked is not value:
+            if result is data and not in_place:
+                result = dict(data)
+            result[key] = masked
     return result
 
 
@@ -166,6 +240,9 @@ def sanitize_sensitive_data(
     - Значения, соответствующие паттернам секретов (JWT, API keys)
     - Вложенные структуры (dict, list)
 
+    event_dict изменяется на месте (structlog создаёт его на каждый вызов),
+    значения полей из SAFE_FIELD_NAMES не сканируются.
+
     Args:
         logger: Логгер (не используется).
         method_name: Название метода логирования.
@@ -179,7 +256,7 @@ def sanitize_sensitive_data(
         >>> sanitize_sensitive_data(None, "info", event)
         {"user": "john", "password": "***REDACTED***"}
     """
-    return _sanitize_dict(event_dict)
+    return _sanitize_dict(event_dict, in_place=True)
 
 
 def add_tracing_context(
@@ -234,65 +311,151 @@ def add_tracing_context(
     return event_dict
 
 
-def setup_logging(
-    log_level: str = "INFO",
+# === Профили логирования ===
+
+# dev — callsite (func_name, lineno) и полный ISO timestamp;
+# prod — без инспекции стека и с кэшированным timestamp
+LogProfile = Literal["dev", "prod"]
+
+
+class CachedTimeStamper:
+    """
+    Процессор timestamp для prod профиля.
+
+    Префикс ISO строки до секунд форматируется один раз в секунду,
+    миллисекунды добавляются к нему: "2024-01-15T10:30:00.123Z".
+    """
+
+    def __init__(self) -> None:
+        """Инициализировать кэш секунды."""
+        self._second = -1
+        self._prefix = ""
+
+    def __call__(
+        self,
+        logger: Any,
+        method_name: str,
+        event_dict: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Добавить timestamp в событие."""
+        now = time.time()
+        second = int(now)
+        if second != self._second:
+            self._prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = second
+        event_dict["timestamp"] = f"{self._prefix}.{int((now - second) * 1000):03d}Z"
+        return event_dict
+
+
+def get_timestamper(profile: LogProfile = "dev") -> Processor:
+    """
+    Получить процессор timestamp для профиля.
+
+    Args:
+        profile: dev — TimeStamper(fmt="iso"), prod — CachedTimeStamper.
+
+    Returns:
+        Процессор timestamp.
+    """
+    if profile == "prod":
+        return CachedTimeStamper()
+    return structlog.processors.TimeStamper(fmt="iso")
+
+
+def build_processors(
     json_logs: bool = True,
-    service_name: str = "app",
-) -> None:
+    profile: LogProfile = "dev",
+    sampling: bool = False,
+) -> list[Processor]:
     """
-    Настроить структурированное логирование.
+    Собрать цепочку процессоров structlog.
 
     Args:
-        log_level: Уровень логирования (DEBUG, INFO, WARNING, ERROR).
-        json_logs: Использовать JSON формат (True для production).
-        service_name: Название сервиса для логов.
+        json_logs: JSON renderer (иначе консольный).
+        profile: dev — с callsite, prod — без инспекции стека.
+        sampling: Обернуть renderer в LogSampler.
+
+    Returns:
+        Процессоры для structlog.configure.
     """
-    # Общие процессоры
-    shared_processors: list[Processor] = [
+    processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         add_tracing_context,  # Log-Driven Design: добавляем request_id, correlation_id, causation_id
         sanitize_sensitive_data,  # SECURITY: фильтрация секретных данных ПЕРЕД логированием
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
+        get_timestamper(profile),
         structlog.processors.StackInfoRenderer(),
-        # Добавление названия сервиса и callsite
-        structlog.processors.CallsiteParameterAdder(
-            [
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-            ]
-        ),
     ]
 
+    if profile != "prod":
+        # Callsite: инспекция стека на каждый вызов — только для разработки
+        processors.append(
+            structlog.processors.CallsiteParameterAdder(
+                [
+                    structlog.processors.CallsiteParameter.FUNC_NAME,
+                    structlog.processors.CallsiteParameter.LINENO,
+                ]
+            )
+        )
+
     if json_logs:
         # Production: JSON формат
-        processors = shared_processors + [
+        processors += [
             structlog.processors.format_exc_info,
             structlog.processors.JSONRenderer(),
         ]
     else:
         # Development: Консольный формат с цветами
-        processors = shared_processors + [
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+        processors.append(structlog.dev.ConsoleRenderer(colors=True))
+
+    # Сэмплирование: 1% успешных запросов, ошибки и медленные — всегда
+    if sampling:
+        processors[-1] = LogSampler(processors[-1])
+
+    return processors
 
+
+def setup_logging(
+    log_level: str = "INFO",
+    json_logs: bool = True,
+    service_name: str = "app",
+    async_sink: bool = False,
+    sink_policy: SinkPolicy = "drop",
+    sampling: bool = False,
+    profile: LogProfile = "dev",
+) -> None:
+    """
+    Настроить структурированное логирование.
+
+    Args:
+        log_level: Уровень логирования (DEBUG, INFO, WARNING, ERROR).
+        json_logs: Использовать JSON формат (True для production).
+        service_name: Название сервиса для логов.
+        async_sink: Неблокирующий вывод (буфер + фоновый поток, см. log_sink).
+        sink_policy: При переполнении буфера: drop | block.
+        sampling: Сэмплирование высокочастотных событий (см. log_sampling).
+        profile: dev — с callsite, prod — без инспекции стека.
+    """
     structlog.configure(
-        processors=processors,
+        processors=build_processors(json_logs, profile, sampling),
         wrapper_class=structlog.make_filtering_bound_logger(
             logging.getLevelName(log_level)
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=create_logger_factory(async_sink, policy=sink_policy),
         cache_logger_on_first_use=True,
     )
+    set_min_log_level(log_level)
+    get_logger.cache_clear()
 
     # Привязка названия сервиса
     structlog.contextvars.bind_contextvars(service=service_name)
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str | None = None) -> structlog.BoundLogger:
     """
-    Получить логгер.
+    Получить логгер (кэшируется по имени модуля).
 
     Args:
         name: Имя модуля (опционально).
@@ -4,9 +4,20 @@
 Общие функции и классы для пагинации результатов.
 """
 
+import base64
+import hashlib
+import hmac
+import json
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, Literal, TypeVar
 from math import ceil
+from uuid import UUID
+
+from .exceptions import InvalidInputError
 
 
 T = TypeVar("T")
@@ -18,6 +29,17 @@ DEFAULT_PAGE = 1
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 
+# === Стратегии подсчёта total_items ===
+
+# exact    — точный COUNT(*) / count_documents на каждый запрос
+# estimate — оценка планировщика (pg_class.reltuples / estimated_document_count)
+# cached   — точный подсчёт с кэшированием на TTL (ключ: таблица + фильтр)
+CountStrategy = Literal["exact", "estimate", "cached"]
+
+DEFAULT_COUNT_CACHE_TTL_SECONDS = 30.0
+# Ключ включает фильтр из query params — число записей ограничено
+DEFAULT_COUNT_CACHE_MAX_ENTRIES = 10000
+
 
 @dataclass
 class PaginationParams:
@@ -77,6 +99,7 @@ class PaginationMeta:
         total_pages: Общее количество страниц.
         has_next: Есть ли следующая страница.
         has_prev: Есть ли предыдущая страница.
+        is_approximate: total_items — оценка, а не точное значение.
     """
 
     page: int
@@ -85,12 +108,14 @@ class PaginationMeta:
     total_pages: int
     has_next: bool
     has_prev: bool
+    is_approximate: bool = False
 
     @classmethod
     def from_params(
         cls,
         params: PaginationParams,
         total_items: int,
+        is_approximate: bool = False,
     ) -> "PaginationMeta":
         """
         Создать метаданные из параметров и общего количества.
@@ -98,6 +123,7 @@ class PaginationMeta:
         Args:
             params: Параметры пагинации.
             total_items: Общее количество элементов.
+            is_approximate: total_items получен оценкой.
 
         Returns:
             Метаданные пагинации.
@@ -111,6 +137,7 @@ class PaginationMeta:
             total_pages=total_pages,
             has_next=params.page < total_pages,
             has_prev=params.page > 1,
+            is_approximate=is_approximate,
         )
 
     def to_dict(self) -> dict:
@@ -127,9 +154,112 @@ class PaginationMeta:
             "total_pages": self.total_pages,
             "has_next": self.has_next,
             "has_prev": self.has_prev,
+            "is_approximate": self.is_approximate,
         }
 
 
+@dataclass
+class CountResult:
+    """
+    Результат подсчёта общего количества элементов.
+
+    Attributes:
+        total: Количество элементов.
+        is_approximate: Значение является оценкой.
+    """
+
+    total: int
+    is_approximate: bool = False
+
+
+class CountCache:
+    """
+    In-process кэш результатов COUNT с TTL.
+
+    Ключ — таблица/коллекция + нормализованный фильтр.
+    Используется стратегией "cached" в репозиториях.
+    При превышении max_entries вытесняются самые старые записи.
+
+    Attributes:
+        ttl_seconds: Время жизни записи.
+        max_entries: Максимум записей.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_COUNT_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_COUNT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Инициализировать кэш.
+
+        Args:
+            ttl_seconds: Время жизни записи в секундах.
+            max_entries: Максимум записей (старые вытесняются).
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
+    @staticmethod
+    def make_key(table: str, filters: dict[str, Any] | None = None) -> str:
+        """
+        Построить ключ кэша.
+
+        Args:
+            table: Имя таблицы/коллекции.
+            filters: Фильтр запроса.
+
+        Returns:
+            Стабильный строковый ключ.
+        """
+        if not filters:
+            return table
+        return f"{table}:{json.dumps(filters, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> int | None:
+        """
+        Получить значение, если оно не устарело.
+
+        Args:
+            key: Ключ кэша.
+
+        Returns:
+            Закэшированное количество или None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: int) -> None:
+        """
+        Сохранить значение.
+
+        Args:
+            key: Ключ кэша.
+            value: Количество.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, table: str) -> None:
+        """
+        Сбросить все записи таблицы/коллекции.
+
+        Args:
+            table: Имя таблицы/коллекции.
+        """
+        for key in [k for k in self._entries if k == table or k.startswith(f"{table}:")]:
+            del self._entries[key]
+
+
 @dataclass
 class PaginatedResult(Generic[T]):
     """
@@ -193,7 +323,7 @@ class CursorPaginationParams:
     Параметры cursor-based пагинации.
 
     Attributes:
-        cursor: Курсор (ID последнего элемента).
+        cursor: Непрозрачный подписанный курсор (см. encode_cursor).
         limit: Количество элементов.
         direction: Направление (forward/backward).
     """
@@ -259,3 +389,114 @@ class CursorPaginatedResult(Generic[T]):
             "items": self.items,
             "pagination": self.meta.to_dict(),
         }
+
+
+# === Кодирование курсора ===
+
+# Теги типов для значений ключа сортировки в курсоре
+_CURSOR_TYPE_DECODERS: dict[str, Any] = {
+    "dt": datetime.fromisoformat,
+    "d": date.fromisoformat,
+    "uuid": UUID,
+    "dec": Decimal,
+}
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    """
+    Преобразовать значение ключа в JSON-совместимый вид с тегом типа.
+
+    Args:
+        value: Значение ключа сортировки.
+
+    Returns:
+        JSON-совместимое значение.
+    """
+    if isinstance(value, datetime):
+        return {"t": "dt", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"t": "d", "v": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"t": "uuid", "v": str(value)}
+    if isinstance(value, Decimal):
+        return {"t": "dec", "v": str(value)}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    """
+    Восстановить значение ключа из JSON-представления.
+
+    Args:
+        value: Значение из курсора.
+
+    Returns:
+        Значение исходного типа.
+    """
+    if isinstance(value, dict) and value.get("t") in _CURSOR_TYPE_DECODERS:
+        return _CURSOR_TYPE_DECODERS[value["t"]](value["v"])
+    return value
+
+
+def _sign_cursor(payload: bytes, secret: str) -> str:
+    """Вычислить HMAC-подпись полезной нагрузки курсора."""
+    digest = hmac.new(secret.encode(), payload, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest[:16]).decode().rstrip("=")
+
+
+def encode_cursor(values: dict[str, Any], secret: str) -> str:
+    """
+    Закодировать позицию keyset-пагинации в непрозрачный курсор.
+
+    Курсор — base64url(JSON) с HMAC-SHA256 подписью, поэтому клиент
+    не может подменить ключ сортировки или ID.
+
+    Args:
+        values: Значения позиции (ключ сортировки, id, параметры сортировки).
+        secret: Секрет для подписи.
+
+    Returns:
+        Строка курсора.
+
+    Example:
+        >>> cursor = encode_cursor({"k": created_at, "id": entity_id}, secret)
+    """
+    payload = json.dumps(
+        {key: _encode_cursor_value(value) for key, value in values.items()},
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode()
+    body = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+    return f"{body}.{_sign_cursor(payload, secret)}"
+
+
+def decode_cursor(cursor: str, secret: str) -> dict[str, Any]:
+    """
+    Декодировать и проверить курсор keyset-пагинации.
+
+    Args:
+        cursor: Строка курсора (от encode_cursor).
+        secret: Секрет для проверки подписи.
+
+    Returns:
+        Значения позиции.
+
+    Raises:
+        InvalidInputError: Курсор повреждён или подпись неверна.
+    """
+    try:
+        body, signature = cursor.split(".", 1)
+        payload = base64.urlsafe_b64decode(body + "=" * (-len(body) % 4))
+    except ValueError:
+        raise InvalidInputError("Невалидный курсор", field="cursor")
+
+    # Сравниваем байты: compare_digest не принимает не-ASCII строки
+    expected = _sign_cursor(payload, secret).encode()
+    if not hmac.compare_digest(signature.encode("utf-8", "surrogateescape"), expected):
+        raise InvalidInputError("Невалидный курсор", field="cursor")
+
+    try:
+        data = json.loads(payload)
+        return {key: _decode_cursor_value(value) for key, value in data.items()}
+    except (ValueError, TypeError, KeyError):
+        raise InvalidInputError("Невалидный курсор", field="cursor")
@@ -0,0 +1,188 @@
+"""
+Счётчик запросов к БД в пределах HTTP запроса.
+
+ContextVar хранит статистику текущего запроса; источники данных —
+события engine (каждый SQL statement) и операции репозитория.
+Итог добавляется в request_completed (RequestContextMiddleware
+с track_queries=True), повтор одной формы запроса больше
+repeat_threshold раз логируется как n_plus_one_suspected.
+
+Использование:
+    ```python
+    token = start_query_tracking()
+    try:
+        ...  # обработка запроса
+    finally:
+        stats = stop_query_tracking(token)
+    log_data.update(stats.to_log_fields())
+    ```
+"""
+
+import re
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+from .log_helpers import log_n_plus_one_suspected
+
+
+logger = structlog.get_logger(__name__)
+
+# Повторов одной формы запроса до предупреждения о N+1
+DEFAULT_REPEAT_THRESHOLD = 10
+
+# Плейсхолдеры параметров: $1 (asyncpg), %(name)s, :name, ?
+_PLACEHOLDER_PATTERN = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+|\?")
+# Список плейсхолдеров IN (?, ?, ?) → (?)
+_PLACEHOLDER_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Получить форму запроса (без параметров и длины IN списков).
+
+    Args:
+        statement: SQL запрос.
+
+    Returns:
+        Нормализованный SQL.
+    """
+    shape = _PLACEHOLDER_PATTERN.sub("?", statement)
+    shape = _PLACEHOLDER_LIST_PATTERN.sub("(?)", shape)
+    return _WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    """
+    Статистика запросов к БД одного HTTP запроса.
+
+    Attributes:
+        query_count: Количество выполненных SQL запросов.
+        total_ms: Суммарное время SQL запросов.
+        statements: Количество запросов по форме.
+        operations: Количество операций репозитория (table.operation).
+    """
+
+    query_count: int = 0
+    total_ms: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+    operations: Counter = field(default_factory=Counter)
+
+    @property
+    def repeated_count(self) -> int:
+        """Количество запросов, повторяющих уже выполненную форму."""
+        return sum(count - 1 for count in self.statements.values() if count > 1)
+
+    def to_log_fields(self) -> dict[str, Any]:
+        """
+        Получить поля для request_completed.
+
+        Returns:
+            Словарь db_query_count, db_total_ms, db_repeated_statements
+            (пустой, если запросов не было).
+        """
+        if not self.query_count:
+            return {}
+        return {
+            "db_query_count": self.query_count,
+            "db_total_ms": round(self.total_ms, 2),
+            "db_repeated_statements": self.repeated_count,
+        }
+
+    def log_repeats(
+        self,
+        log: structlog.BoundLogger | None = None,
+        threshold: int = DEFAULT_REPEAT_THRESHOLD,
+    ) -> None:
+        """
+        Залогировать формы запросов, повторённые больше threshold раз.
+
+        Args:
+            log: Логгер (по умолчанию логгер модуля).
+            threshold: Допустимое количество повторов.
+        """
+        for statement, count in self.statements.items():
+            if count > threshold:
+                log_n_plus_one_suspected(
+                    log or logger,
+                    statement=statement,
+                    count=count,
+                    threshold=threshold,
+                    operations=dict(self.operations.most_common(3)),
+                )
+
+
+_query_stats_ctx: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats",
+    default=None,
+)
+
+
+def start_query_tracking() -> Token:
+    """
+    Начать подсчёт запросов для текущего контекста.
+
+    Returns:
+        Token для stop_query_tracking.
+    """
+    return _query_stats_ctx.set(QueryStats())
+
+
+def stop_query_tracking(token: Token) -> QueryStats:
+    """
+    Завершить подсчёт и вернуть статистику.
+
+    Args:
+        token: Token из start_query_tracking.
+
+    Returns:
+        Статистика запросов.
+    """
+    stats = _query_stats_ctx.get() or QueryStats()
+    _query_stats_ctx.reset(token)
+    return stats
+
+
+def get_query_stats() -> QueryStats | None:
+    """
+    Получить статистику текущего контекста.
+
+    Returns:
+        Статистика или None вне отслеживаемого запроса.
+    """
+    return _query_stats_ctx.get()
+
+
+def record_query(statement: str, duration_ms: float) -> None:
+    """
+    Учесть выполненный SQL запрос (вызывается из событий engine).
+
+    Args:
+        statement: SQL запрос.
+        duration_ms: Время выполнения.
+    """
+    stats = _query_stats_ctx.get()
+    if stats is None:
+        return
+    stats.query_count += 1
+    stats.total_ms += duration_ms
+    stats.statements[normalize_statement(statement)] += 1
+
+
+def record_operation(table: str, operation: str) -> None:
+    """
+    Учесть операцию репозитория (вызывается из BaseRepository).
+
+    Args:
+        table: Имя таблицы/коллекции.
+        operation: Название операции.
+    """
+    stats = _query_stats_ctx.get()
+    if stats is not None:
+        stats.operations[f"{table}.{operation}"] += 1
+
@@ -7,12 +7,31 @@
 - correlation_id: ID изначального запроса от клиента (не меняется между сервисами)
 - causation_id: ID события, которое вызвало текущее действие
 - user_id: ID аутентифицированного пользователя (если есть)
+
+RequestContextMiddleware — pure ASGI middleware для сервисов без
+RequestLoggingMiddleware (Data API): устанавливает контекст трассировки
+и привязывает request_id к structlog (нужен LogSampler для выборки
+по запросу и tail-буфера), опционально — итоги запросов к БД
+в request_completed.
 """
 
+import time
 import uuid
 from contextvars import ContextVar
 from typing import Callable
 
+import structlog
+
+from .log_helpers import log_request_completed
+from .query_tracker import (
+    DEFAULT_REPEAT_THRESHOLD,
+    start_query_tracking,
+    stop_query_tracking,
+)
+
+
+logger = structlog.get_logger(__name__)
+
 
 # === Context Variables для трассировки ===
 
@@ -419,3 +438,104 @@ def clear_tracing_context() -> None:
     set_correlation_id(None)
     set_causation_id(None)
     set_user_id(None)
+
+
+# === ASGI Middleware ===
+
+
+class RequestContextMiddleware:
+    """
+    ASGI middleware контекста трассировки для Data API.
+
+    Для каждого HTTP запроса:
+        - извлекает request_id/correlation_id/causation_id из заголовков
+          (request_id генерируется, если не передан)
+        - привязывает их к structlog contextvars на время запроса
+        - добавляет X-Request-ID в ответ
+        - логирует request_completed (событие завершения для LogSampler)
+        - при track_queries — добавляет в request_completed итоги
+          запросов к БД (db_query_count, db_total_ms, db_repeated_statements)
+          и логирует n_plus_one_suspected
+
+    Добавляется последним (внешним), чтобы db_operation и логи
+    остальных middleware тоже содержали request_id.
+
+    Использование:
+        ```python
+        app.add_middleware(
+            RequestContextMiddleware,
+            track_queries=settings.query_tracking_enabled,
+            repeat_threshold=settings.n_plus_one_threshold,
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        skip_paths: set[str] | None = None,
+        track_queries: bool = False,
+        repeat_threshold: int = DEFAULT_REPEAT_THRESHOLD,
+    ) -> None:
+        """
+        Инициализировать middleware.
+
+        Args:
+            app: ASGI приложение.
+            skip_paths: Пути без request_completed (health checks).
+            track_queries: Считать запросы к БД (события engine) за запрос.
+            repeat_threshold: Повторов одной формы SQL до n_plus_one_suspected.
+        """
+        self.app = app
+        self.skip_paths = skip_paths or {"/health", "/metrics", "/ready"}
+        self.track_queries = track_queries
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        """Обработать ASGI вызов."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        tracing = extract_tracing_from_headers(
+            {k.decode("latin-1"): v.decode("latin-1") for k, v in scope.get("headers", [])},
+            generate_if_missing=True,
+        )
+        request_id = tracing["request_id"]
+        status_code = 500
+
+        async def send_wrapper(message: dict) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (REQUEST_ID_HEADER.lower().encode(), request_id.encode("latin-1")),
+                ]
+            await send(message)
+
+        context = {k: v for k, v in tracing.items() if v is not None}
+        start = time.perf_counter()
+        setup_tracing_context(**tracing)
+        query_tracking_token = start_query_tracking() if self.track_queries else None
+        try:
+            with structlog.contextvars.bound_contextvars(**context):
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                finally:
+                    db_fields: dict = {}
+                    if query_tracking_token is not None:
+                        query_stats = stop_query_tracking(query_tracking_token)
+                        db_fields = query_stats.to_log_fields()
+                        query_stats.log_repeats(logger, self.repeat_threshold)
+                    if scope["path"] not in self.skip_paths:
+                        log_request_completed(
+                            logger,
+                            method=scope["method"],
+                            path=scope["path"],
+                            start_time=start,
+                            status_code=status_code,
+                            **db_fields,
+                        )
+        finally:
+            clear_tracing_context()
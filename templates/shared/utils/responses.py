@@ -0,0 +1,31 @@
+"""
+Классы ответов FastAPI.
+
+Не экспортируется из shared.utils: модуль требует starlette,
+которого нет в воркере и боте. Импорт:
+    from shared.utils.responses import FastJSONResponse
+"""
+
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from .json_codec import json_dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON ответ через orjson/msgspec (см. shared.utils.json_codec).
+
+    Формат совпадает с JSONResponse (UTF-8, без экранирования
+    не-ASCII), отличается только компактными разделителями.
+
+    Использование:
+        ```python
+        app = FastAPI(default_response_class=FastJSONResponse)
+        ```
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Сериализовать содержимое ответа."""
+        return json_dumps(content)
@@ -0,0 +1,143 @@
+"""
+Потоковая выдача больших выборок.
+
+Кодирование асинхронного потока записей в NDJSON
+(одна JSON-запись на строку) или CSV для StreamingResponse.
+Память ограничена одним буфером из flush_rows строк,
+независимо от общего количества записей.
+
+Backpressure: StreamingResponse ждёт send() каждого чанка, а ASGI
+сервер приостанавливает send(), пока буфер сокета медленного клиента
+не освободится. Генератор при этом не запрашивает следующие строки,
+и серверный курсор БД не читает новые пачки.
+"""
+
+import csv
+import io
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Literal
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Заголовки потокового ответа: отключают буферизацию в nginx,
+# иначе прокси копит весь ответ и backpressure не работает
+STREAMING_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "no-store"}
+
+# Строк в одном чанке ответа (баланс между числом send() и памятью)
+DEFAULT_FLUSH_ROWS = 100
+
+
+async def iter_ndjson(
+    rows: AsyncIterable[Any],
+    serialize: Callable[[Any], dict[str, Any]] | None = None,
+    flush_rows: int = DEFAULT_FLUSH_ROWS,
+) -> AsyncIterator[bytes]:
+    """
+    Закодировать поток записей в NDJSON чанки.
+
+    Args:
+        rows: Асинхронный поток записей.
+        serialize: Преобразование записи в dict (по умолчанию — как есть).
+        flush_rows: Количество строк в одном чанке.
+
+    Yields:
+        Байтовые чанки по flush_rows строк.
+
+    Example:
+        ```python
+        return StreamingResponse(
+            iter_ndjson(repository.stream_all(), serialize=to_dict),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+        ```
+    """
+    buffer: list[str] = []
+
+    async for row in rows:
+        data = serialize(row) if serialize else row
+        buffer.append(json.dumps(data, ensure_ascii=False, default=str))
+        if len(buffer) >= flush_rows:
+            yield ("\n".join(buffer) + "\n").encode()
+            buffer.clear()
+
+    if buffer:
+        yield ("\n".join(buffer) + "\n").encode()
+
+
+async def iter_csv(
+    rows: AsyncIterable[Any],
+    serialize: Callable[[Any], dict[str, Any]] | None = None,
+    fieldnames: list[str] | None = None,
+    flush_rows: int = DEFAULT_FLUSH_ROWS,
+) -> AsyncIterator[bytes]:
+    """
+    Закодировать поток записей в CSV чанки (с заголовком).
+
+    Вложенные значения (dict/list) записываются как JSON.
+
+    Args:
+        rows: Асинхронный поток записей.
+        serialize: Преобразование записи в dict (по умолчанию — как есть).
+        fieldnames: Колонки (по умолчанию — ключи первой записи).
+        flush_rows: Количество строк в одном чанке.
+
+    Yields:
+        Байтовые чанки по flush_rows строк.
+    """
+    buffer = io.StringIO()
+    writer: csv.DictWriter | None = None
+    pending = 0
+
+    async for row in rows:
+        data = serialize(row) if serialize else row
+
+        if writer is None:
+            writer = csv.DictWriter(
+                buffer,
+                fieldnames=fieldnames or list(data),
+                extrasaction="ignore",
+            )
+            writer.writeheader()
+
+        writer.writerow({
+            key: json.dumps(value, ensure_ascii=False, default=str)
+            if isinstance(value, (dict, list)) else value
+            for key, value in data.items()
+        })
+        pending += 1
+
+        if pending >= flush_rows:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def encode_stream(
+    rows: AsyncIterable[Any],
+    export_format: ExportFormat,
+    serialize: Callable[[Any], dict[str, Any]] | None = None,
+    flush_rows: int = DEFAULT_FLUSH_ROWS,
+) -> tuple[AsyncIterator[bytes], str]:
+    """
+    Выбрать кодировщик потока по формату.
+
+    Args:
+        rows: Асинхронный поток записей.
+        export_format: Формат выгрузки (ndjson | csv).
+        serialize: Преобразование записи в dict.
+        flush_rows: Количество строк в одном чанке.
+
+    Returns:
+        Tuple (поток байтовых чанков, media type).
+    """
+    if export_format == "csv":
+        return iter_csv(rows, serialize, flush_rows=flush_rows), CSV_MEDIA_TYPE
+    return iter_ndjson(rows, serialize, flush_rows=flush_rows), NDJSON_MEDIA_TYPE
@@ -22,6 +22,13 @@ SLUG_REGEX = re.compile(
     r"^[a-z0-9]+(?:-[a-z0-9]+)*$"
 )
 
+FIELD_NAME_REGEX = re.compile(
+    r"^[A-Za-z_][A-Za-z0-9_]*$"
+)
+
+# Максимум полей в проекции (?fields=...)
+MAX_PROJECTION_FIELDS = 50
+
 UUID_REGEX = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
     re.IGNORECASE,
@@ -130,6 +137,37 @@ def validate_uuid(value: str) -> str:
     return value
 
 
+def parse_fields(value: str | list[str] | None) -> list[str] | None:
+    """
+    Разобрать список полей проекции (?fields=id,name,email).
+
+    Args:
+        value: Поля через запятую или список.
+
+    Returns:
+        Уникальные имена полей в исходном порядке или None (все поля).
+
+    Raises:
+        ValueError: Невалидное имя поля или слишком много полей.
+    """
+    if not value:
+        return None
+
+    raw = value.split(",") if isinstance(value, str) else value
+    fields = list(dict.fromkeys(name.strip() for name in raw if name.strip()))
+    if not fields:
+        return None
+
+    if len(fields) > MAX_PROJECTION_FIELDS:
+        raise ValueError(f"Слишком много полей: максимум {MAX_PROJECTION_FIELDS}")
+
+    invalid = [name for name in fields if not FIELD_NAME_REGEX.match(name)]
+    if invalid:
+        raise ValueError(f"Невалидные имена полей: {', '.join(invalid)}")
+
+    return fields
+
+
 # === Валидаторы чисел ===
 
 def validate_positive(value: int | float, field_name: str = "Значение") -> int | float: